@@ -0,0 +1,30 @@
+"""webhook deliveries
+
+Revision ID: b71d0e5c2a84
+Revises: a4e1c7d2b9f3
+Create Date: 2026-10-17 11:02:47.905163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b71d0e5c2a84'
+down_revision: Union[str, None] = 'a4e1c7d2b9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('webhook_deliveries',
+    sa.Column('id', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('webhook_deliveries')
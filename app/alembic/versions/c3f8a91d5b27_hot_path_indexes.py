@@ -0,0 +1,51 @@
+"""hot path indexes
+
+Revision ID: c3f8a91d5b27
+Revises: b71d0e5c2a84
+Create Date: 2026-10-17 18:40:12.518302
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a91d5b27'
+down_revision: Union[str, None] = 'b71d0e5c2a84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The unique indexes need the duplicated links gone, one row of each link is kept
+    op.execute(
+        "DELETE f1 FROM project_favorites f1 JOIN project_favorites f2 "
+        "ON f1.user_id = f2.user_id AND f1.project_id = f2.project_id AND f1.id > f2.id"
+    )
+    op.execute(
+        "DELETE g1 FROM group_projects g1 JOIN group_projects g2 "
+        "ON g1.project_id = g2.project_id AND g1.group_id = g2.group_id AND g1.id > g2.id"
+    )
+
+    op.create_index('ix_arena_session_players_session_id_user_id', 'arena_session_players', ['session_id', 'user_id'], unique=False)
+    op.create_index('ix_arena_session_players_user_email', 'arena_session_players', ['user_email'], unique=False)
+    op.create_index('ix_arena_sessions_project_id_organisation_code', 'arena_sessions', ['project_id', 'organisation_code'], unique=False)
+    op.create_index('ix_arena_sessions_project_id_super_game_master_id', 'arena_sessions', ['project_id', 'super_game_master_id'], unique=False)
+    op.create_index('uq_group_projects_project_id_group_id', 'group_projects', ['project_id', 'group_id'], unique=True)
+    op.create_index('ix_group_users_group_id_user_id', 'group_users', ['group_id', 'user_id'], unique=False)
+    op.create_index('ix_group_users_user_email', 'group_users', ['user_email'], unique=False)
+    op.create_index('ix_projects_organisation_code_start_time', 'projects', ['organisation_code', 'start_time'], unique=False)
+    op.create_index('uq_project_favorites_user_id_project_id', 'project_favorites', ['user_id', 'project_id'], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('uq_project_favorites_user_id_project_id', table_name='project_favorites')
+    op.drop_index('ix_projects_organisation_code_start_time', table_name='projects')
+    op.drop_index('ix_group_users_user_email', table_name='group_users')
+    op.drop_index('ix_group_users_group_id_user_id', table_name='group_users')
+    op.drop_index('uq_group_projects_project_id_group_id', table_name='group_projects')
+    op.drop_index('ix_arena_sessions_project_id_super_game_master_id', table_name='arena_sessions')
+    op.drop_index('ix_arena_sessions_project_id_organisation_code', table_name='arena_sessions')
+    op.drop_index('ix_arena_session_players_user_email', table_name='arena_session_players')
+    op.drop_index('ix_arena_session_players_session_id_user_id', table_name='arena_session_players')
@@ -0,0 +1,59 @@
+"""user game membership
+
+Revision ID: d4a7e2b91f60
+Revises: c3f8a91d5b27
+Create Date: 2026-10-17 21:05:47.281930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a7e2b91f60'
+down_revision: Union[str, None] = 'c3f8a91d5b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('user_game_membership',
+    sa.Column('id', sa.String(length=36), nullable=False),
+    sa.Column('user_id', sa.String(length=36), nullable=False),
+    sa.Column('project_id', sa.String(length=36), nullable=False),
+    sa.Column('organisation_code', sa.String(length=36), nullable=True),
+    sa.Column('role', sa.String(length=20), nullable=False),
+    sa.Column('is_game_master', sa.Boolean(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_user_game_membership_project_id', 'user_game_membership', ['project_id'], unique=False)
+    op.create_index('ix_user_game_membership_user_id_project_id', 'user_game_membership', ['user_id', 'project_id'], unique=False)
+
+    # Backfill from the group managers, the session players and the session moderators,
+    # as get_game_memberships_from_sources derives them
+    op.execute(
+        "INSERT INTO user_game_membership (id, user_id, project_id, organisation_code, role, is_game_master) "
+        "SELECT UUID(), user_id, project_id, organisation_code, role, MAX(is_game_master) FROM ("
+        "SELECT gu.user_id, gp.project_id, g.organisation_code, 'manager' AS role, 0 AS is_game_master "
+        "FROM group_projects gp JOIN group_users gu ON gp.group_id = gu.group_id "
+        "LEFT JOIN `groups` g ON gp.group_id = g.id "
+        "WHERE gu.user_id IS NOT NULL AND gp.project_id IS NOT NULL "
+        "UNION ALL "
+        "SELECT p.user_id, s.project_id, s.organisation_code, 'player', IF(p.is_game_master, 1, 0) "
+        "FROM arena_session_players p JOIN arena_sessions s ON p.session_id = s.id "
+        "WHERE p.user_id IS NOT NULL AND s.project_id IS NOT NULL "
+        "UNION ALL "
+        "SELECT s.super_game_master_id, s.project_id, s.organisation_code, 'moderator', 0 "
+        "FROM arena_sessions s "
+        "WHERE s.super_game_master_id IS NOT NULL AND s.project_id IS NOT NULL"
+        ") memberships "
+        "GROUP BY user_id, project_id, organisation_code, role"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_game_membership_user_id_project_id', table_name='user_game_membership')
+    op.drop_index('ix_user_game_membership_project_id', table_name='user_game_membership')
+    op.drop_table('user_game_membership')
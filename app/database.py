@@ -1,7 +1,16 @@
+import logging
 import os
+import time
+from contextlib import AsyncExitStack
+
+from fastapi import Request
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
 
 # Database URL (replace with your own database credentials)
 DB_USER = os.getenv("DB_USER", "user")
@@ -11,8 +20,174 @@ DB_PORT = os.getenv("DB_PORT", "3306")
 DB_NAME = os.getenv("DB_NAME", "db_name")
 DATABASE_URL = f"mysql+aiomysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
-# Create the SQLAlchemy async engine
-async_engine = create_async_engine(DATABASE_URL, future=True, echo=False)
+# Connection pool, per worker process
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+# Seconds a request waits for a free connection before failing
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Connections are replaced after this many seconds, keep it below the wait_timeout of MySQL (8 hours by default)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+# Test connections on checkout so the ones closed by the server are replaced instead of failing the request
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+# Connections opened at startup, at most the pool size
+DB_POOL_WARMUP = int(os.getenv("DB_POOL_WARMUP", str(DB_POOL_SIZE)))
+
+# Optional read replica, the read-only endpoints use the primary when it is not set
+DB_READ_HOST = os.getenv("DB_READ_HOST")
+DB_READ_PORT = os.getenv("DB_READ_PORT", DB_PORT)
+DB_READ_USER = os.getenv("DB_READ_USER", DB_USER)
+DB_READ_PASSWORD = os.getenv("DB_READ_PASSWORD", DB_PASSWORD)
+DATABASE_READ_URL = f"mysql+aiomysql://{DB_READ_USER}:{DB_READ_PASSWORD}@{DB_READ_HOST}:{DB_READ_PORT}/{DB_NAME}"
+# Seconds a client keeps reading from the primary after a write, covers the replication lag
+DB_READ_AFTER_WRITE_WINDOW = int(os.getenv("DB_READ_AFTER_WRITE_WINDOW", "5"))
+# Cookie set on the responses of writes while the client reads from the primary
+DB_PRIMARY_COOKIE = "db_primary"
+
+
+class PoolStats:
+    """
+    Counters of the connection pool, read by the instrumentation endpoint.
+    """
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.overflow_peak = 0
+        self.waits = 0
+        self.wait_time_total = 0.0
+        self.wait_time_max = 0.0
+
+    def record_wait(self, wait: float):
+        self.waits += 1
+        self.wait_time_total += wait
+        self.wait_time_max = max(self.wait_time_max, wait)
+
+    def as_dict(self, pool) -> dict:
+        return {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": max(pool.overflow(), 0),
+            "overflow_peak": self.overflow_peak,
+            "max_overflow": DB_MAX_OVERFLOW,
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "timeouts": self.timeouts,
+            "wait_time_avg_ms": round(self.wait_time_total / self.waits * 1000, 3) if self.waits else 0.0,
+            "wait_time_max_ms": round(self.wait_time_max * 1000, 3),
+        }
+
+
+# Counters of every pool by pool name
+pool_stats: dict[str, PoolStats] = dict()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool timing how long every checkout waits for a connection, opening it included.
+    """
+
+    def _do_get(self):
+        stats = pool_stats[self.logging_name]
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.record_wait(time.perf_counter() - start)
+            stats.overflow_peak = max(stats.overflow_peak, self.overflow())
+
+
+def _create_engine(url: str, name: str):
+    """
+    Create an async engine with the configured pool, its counters are kept under the name of the pool.
+    """
+    stats = pool_stats[name] = PoolStats()
+    engine = create_async_engine(
+        url,
+        future=True,
+        echo=False,
+        poolclass=InstrumentedAsyncPool,
+        pool_logging_name=name,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_timeout=DB_POOL_TIMEOUT,
+        pool_recycle=DB_POOL_RECYCLE,
+        pool_pre_ping=DB_POOL_PRE_PING,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        stats.connects += 1
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.checkouts += 1
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        stats.checkins += 1
+
+    @event.listens_for(engine.sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        stats.invalidations += 1
+
+    return engine
+
+
+# Create the SQLAlchemy async engines, the read engine is the primary one when there is no replica
+async_engine = _create_engine(DATABASE_URL, "primary")
+async_read_engine = _create_engine(DATABASE_READ_URL, "replica") if DB_READ_HOST else async_engine
+
+
+def _engines() -> dict:
+    engines = {"primary": async_engine}
+    if async_read_engine is not async_engine:
+        engines["replica"] = async_read_engine
+    return engines
+
+
+def get_pool_stats() -> dict:
+    """
+    Return the state and the counters of the connection pools of this worker, by pool name.
+    """
+    return {name: pool_stats[name].as_dict(engine.sync_engine.pool) for name, engine in _engines().items()}
+
+
+async def warm_up_pool(connections: int = DB_POOL_WARMUP):
+    """
+    Open connections up front so the first requests do not pay for the connection handshakes.
+
+    A database that is not reachable yet is only logged, connections are then opened on demand.
+
+    Args:
+        connections (int): The number of connections to open, at most the pool size.
+    """
+    connections = min(connections, DB_POOL_SIZE)
+    for name, engine in _engines().items():
+        try:
+            # Connections are held together so the pool opens distinct ones, then all go back to the pool
+            async with AsyncExitStack() as stack:
+                for _ in range(connections):
+                    await stack.enter_async_context(engine.connect())
+        except Exception as e:
+            logger.warning(f"Database pool warm-up failed for the {name} pool: {str(e)}")
+
+
+async def dispose_pool():
+    """
+    Close the pooled connections of this worker.
+    """
+    for engine in _engines().values():
+        await engine.dispose()
+
 
 # Create a configured "AsyncSession" class
 AsyncSessionLocal = sessionmaker(
@@ -21,6 +196,13 @@ AsyncSessionLocal = sessionmaker(
     expire_on_commit=False  # Keeps objects active after commit
 )
 
+# Sessions of the read-only endpoints
+AsyncReadSessionLocal = sessionmaker(
+    bind=async_read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 # Create a base class for declarative models
 Base = declarative_base()
 
@@ -35,3 +217,26 @@ async def get_db_async() -> AsyncSession:
             raise
         finally:
             await db.close()  # Ensure the session is closed
+
+
+def reads_from_primary(request: Request) -> bool:
+    """
+    Tell whether the reads of a request must go to the primary.
+
+    That is the case without a replica, and for a client that wrote less than
+    DB_READ_AFTER_WRITE_WINDOW seconds ago so it reads its own writes.
+    """
+    return async_read_engine is async_engine or DB_PRIMARY_COOKIE in request.cookies
+
+
+# Dependency to get an async database session for the read-only endpoints
+async def get_db_read_async(request: Request) -> AsyncSession:
+    session_factory = AsyncSessionLocal if reads_from_primary(request) else AsyncReadSessionLocal
+    async with session_factory() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+        finally:
+            await db.close()
@@ -0,0 +1,66 @@
+import hashlib
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+# Read endpoints polled by the front-ends, their successful GET responses carry an ETag
+ETAG_PATHS = ("/espace-admin", "/game-view", "/sessions", "/groups")
+
+ETAG_METHODS = {"GET", "HEAD"}
+
+# Headers describing the body, not sent with a 304
+BODY_HEADERS = {b"content-length", b"content-type"}
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Strong ETag of a response body.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Tell whether an If-None-Match header names the ETag, with the weak comparison RFC 9110 asks for.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def has_etag(path: str) -> bool:
+    return any(path == prefix or path.startswith(prefix + "/") for prefix in ETAG_PATHS)
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """
+    Add a strong ETag to the responses of the polled read endpoints and answer
+    304 Not Modified when the client already holds the body.
+
+    The ETag is a hash of the body, so it changes with anything the body shows,
+    e.g. the profiles of the user service, and holds across the replicas. The
+    game view is served from its versioned cache, so a client polling an
+    unchanged game is answered without building the view.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.method not in ETAG_METHODS or response.status_code != 200 or not has_etag(request.url.path):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = make_etag(body)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            not_modified = Response(status_code=304)
+            not_modified.raw_headers = [(name, value) for name, value in response.raw_headers
+                                        if name not in BODY_HEADERS]
+            not_modified.headers["ETag"] = etag
+            return not_modified
+
+        full = Response(content=body, status_code=response.status_code, background=response.background)
+        full.raw_headers = list(response.raw_headers)
+        full.headers["ETag"] = etag
+        return full
@@ -1,8 +1,10 @@
 # MiddlewareWrapper.py
 import traceback
 
+from fastapi.exceptions import RequestValidationError
 from fastapi.routing import APIRoute
 from typing import Callable, List, Type
+from starlette.exceptions import HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response, JSONResponse
@@ -22,6 +24,9 @@ def middlewareWrapper(middlewares: List[BaseHTTPMiddleware] = []) -> Type[APIRou
 
                 try:
                     return await handler(request)
+                except (HTTPException, RequestValidationError):
+                    # Answered by the exception handlers of the app with their own status code
+                    raise
                 except Exception as exc:
                     tb_str = traceback.format_exc()  # Capture the traceback
                     return JSONResponse(
@@ -0,0 +1,26 @@
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from app.database import DB_PRIMARY_COOKIE, DB_READ_AFTER_WRITE_WINDOW, async_engine, async_read_engine
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class ReadYourWritesMiddleware(BaseHTTPMiddleware):
+    """
+    Pin a client to the primary database for a short window after a successful write.
+
+    The cookie expires after DB_READ_AFTER_WRITE_WINDOW seconds, until then
+    get_db_read_async serves the client from the primary so a read following
+    a write does not miss it because of the replication lag. The cookie lives
+    on the client, so the pin holds whichever replica of the service the next
+    request reaches.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if (async_read_engine is not async_engine and request.method not in SAFE_METHODS
+                and response.status_code < 400):
+            response.set_cookie(DB_PRIMARY_COOKIE, "1", max_age=DB_READ_AFTER_WRITE_WINDOW, httponly=True,
+                                samesite="lax")
+        return response
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Enum, Integer, DateTime, Boolean, Text
+from sqlalchemy import Column, String, Enum, Integer, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess, ActivationStatus, GameType, PlayingType, \
@@ -9,6 +9,9 @@ from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess, Activ
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_organisation_code_start_time", "organisation_code", "start_time"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     name = Column(String(255), index=True)
@@ -143,6 +146,9 @@ class CommentLike(Base):
 # ProjectFavorite model
 class ProjectFavorite(Base):
     __tablename__ = "project_favorites"
+    __table_args__ = (
+        Index("uq_project_favorites_user_id_project_id", "user_id", "project_id", unique=True),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     project_id = Column(String(36), index=True)  # No ForeignKey constraint
@@ -188,6 +194,10 @@ class Group(Base):
 # GroupUsers model
 class GroupUsers(Base):
     __tablename__ = "group_users"
+    __table_args__ = (
+        Index("ix_group_users_group_id_user_id", "group_id", "user_id"),
+        Index("ix_group_users_user_email", "user_email"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     group_id = Column(String(36), index=True)  # No ForeignKey constraint
@@ -211,6 +221,9 @@ class GroupUsers(Base):
 # GroupProjects model
 class GroupProjects(Base):
     __tablename__ = "group_projects"
+    __table_args__ = (
+        Index("uq_group_projects_project_id_group_id", "project_id", "group_id", unique=True),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     group_id = Column(String(36), index=True)  # No ForeignKey constraint
@@ -261,6 +274,10 @@ class Arena(Base):
 # ArenaSession model
 class ArenaSession(Base):
     __tablename__ = "arena_sessions"
+    __table_args__ = (
+        Index("ix_arena_sessions_project_id_organisation_code", "project_id", "organisation_code"),
+        Index("ix_arena_sessions_project_id_super_game_master_id", "project_id", "super_game_master_id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     organisation_code = Column(String(36), nullable=True, index=True)
@@ -309,6 +326,10 @@ class ArenaSessionTeam(Base):
 # ArenaSessionPlayers model
 class ArenaSessionPlayers(Base):
     __tablename__ = "arena_session_players"
+    __table_args__ = (
+        Index("ix_arena_session_players_session_id_user_id", "session_id", "user_id"),
+        Index("ix_arena_session_players_user_email", "user_email"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     organisation_code = Column(String(36), nullable=True, index=True)
@@ -325,3 +346,58 @@ class ArenaSessionPlayers(Base):
                            foreign_keys="ArenaSessionPlayers.session_id",
                            primaryjoin="ArenaSessionPlayers.session_id == ArenaSession.id", back_populates="players",
                            viewonly=True)
+
+
+# EmailOutbox model
+class EmailOutbox(Base):
+    __tablename__ = "email_outbox"
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    recipient_type = Column(String(50), nullable=False)  # player, manager or moderator
+    recipient_id = Column(String(36), nullable=True, index=True)  # Row whose email_status follows the delivery
+    email = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    template = Column(String(100), nullable=False)  # Template file name in app/mails
+    context = Column(Text, nullable=True)  # JSON values of the template placeholders
+    status = Column(Enum(EmailStatus), default=EmailStatus.PENDING, nullable=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=lambda: datetime.now())
+    claim_token = Column(String(36), nullable=True, index=True)  # Worker batch that owns the row
+    locked_until = Column(DateTime, nullable=True)  # The row can be claimed again after this time
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=True, default=lambda: datetime.now())
+    sent_at = Column(DateTime, nullable=True)
+
+
+# WebhookDelivery model
+class WebhookDelivery(Base):
+    __tablename__ = "webhook_deliveries"
+
+    id = Column(String(255), primary_key=True)  # Idempotency key of the delivery
+    created_at = Column(DateTime, nullable=True, default=lambda: datetime.now())
+
+
+# UserGameMembership model
+class UserGameMembership(Base):
+    """
+    The memberships of the users in the games, derived from the group managers,
+    the session players and the session moderators.
+
+    Maintained by the write paths changing them through
+    app/services/user_game_membership.py, which can also rebuild it.
+    """
+    __tablename__ = "user_game_membership"
+    __table_args__ = (
+        Index("ix_user_game_membership_user_id_project_id", "user_id", "project_id"),
+    )
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(String(36), nullable=False)
+    project_id = Column(String(36), nullable=False, index=True)
+    # Organisation of the group or of the session the membership comes from
+    organisation_code = Column(String(36), nullable=True)
+    role = Column(String(20), nullable=False)  # manager, player or moderator
+    is_game_master = Column(Boolean, nullable=False, default=False)
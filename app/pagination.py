@@ -0,0 +1,116 @@
+import base64
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, Optional, Sequence, TypeVar
+
+from fastapi import HTTPException, Query, Response
+
+# Page size of the list endpoints when the client does not ask for one, large enough for the payloads of today
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "1000"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+# Response header carrying the cursor of the next page, absent on the last page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+T = TypeVar("T")
+
+
+def encode_cursor(key: Any) -> str:
+    """
+    Turn the sort key of the last row of a page into an opaque cursor.
+    """
+    return base64.urlsafe_b64encode(json.dumps(key, default=str).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    """
+    Read back the sort key of a cursor made by encode_cursor.
+
+    :raises ValueError: When the cursor was not made by encode_cursor
+    """
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+@dataclass
+class Pagination:
+    limit: int
+    cursor: Any = None  # Sort key of the last row of the previous page, None for the first page
+
+
+def _is_id_key(key: Any) -> bool:
+    return isinstance(key, str)
+
+
+def _is_created_at_key(key: Any) -> bool:
+    if not (isinstance(key, list) and len(key) == 2 and isinstance(key[1], str)):
+        return False
+    if key[0] is None:
+        return True
+    try:
+        datetime.fromisoformat(key[0])
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def _read_page(limit: int, cursor: Optional[str], is_key: Callable[[Any], bool]) -> Pagination:
+    if not cursor:
+        return Pagination(limit=limit)
+    try:
+        key = decode_cursor(cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Decoded cursors reach the queries as bind parameters, one of another shape is refused here
+    if not is_key(key):
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+    return Pagination(limit=limit, cursor=key)
+
+
+def pagination(limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+               cursor: Optional[str] = Query(None)) -> Pagination:
+    """
+    Dependency reading the page requested by the client, for the lists sorted by ID.
+    """
+    return _read_page(limit, cursor, _is_id_key)
+
+
+def created_at_pagination(limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+                          cursor: Optional[str] = Query(None)) -> Pagination:
+    """
+    Dependency reading the page requested by the client, for the lists sorted by
+    creation date then ID, whose cursors are [created_at in ISO format or None, id].
+    """
+    return _read_page(limit, cursor, _is_created_at_key)
+
+
+@dataclass
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: Any = None  # Sort key of the last row when more rows may follow
+
+
+def page_of(items: list[T], rows: Sequence, limit: int | None, key: Callable[[Any], Any]) -> Page[T]:
+    """
+    Build the page of a keyset query.
+
+    :param items: The response items of the page
+    :param rows: The rows the items were built from, in the order of the query
+    :param limit: The page size of the query, None when it was not paginated
+    :param key: The sort key of a row
+    """
+    full = limit is not None and len(rows) == limit
+    return Page(items=items, next_cursor=key(rows[-1]) if full else None)
+
+
+def send_page(response: Response, page: Page[T]) -> list[T]:
+    """
+    Return the items of a page and announce its next page in the response headers.
+    """
+    if page.next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(page.next_cursor)
+    return page.items
@@ -24,3 +24,4 @@ class WebhookInvitationProgressRequest(BaseModel):
     role: RoleType = RoleType.PLAYER
     session_id: str = Field(..., description="Unique identifier for the session")
     users: list[InvitationUserRequest] = Field(..., description="emails for the session")
+    idempotency_key: Optional[str] = Field(None, description="Key of the delivery, repeated deliveries are ignored")
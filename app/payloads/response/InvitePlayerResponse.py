@@ -3,4 +3,7 @@ from typing import Optional
 
 
 class InvitePlayerResponse(BaseModel):
-    message: str
\ No newline at end of file
+    message: str
+    added: Optional[int] = None
+    duplicates: Optional[int] = None
+    invalid: Optional[int] = None
@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import select, update, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import EmailStatus
+from app.models import EmailOutbox
+
+
+async def claim_pending_emails(claim_token: str, limit: int, locked_until: datetime,
+                               session: AsyncSession) -> list[EmailOutbox]:
+    """
+    Claim a batch of due outbox emails for a worker.
+
+    Rows are only taken when their previous claim expired, so a worker that
+    stopped in the middle of a batch releases its rows after the lease and
+    concurrent workers never get the same row.
+
+    :param claim_token: Token of the worker batch
+    :param limit: Maximum number of emails to claim
+    :param locked_until: End of the lease of the claimed rows
+    :param session: Database session
+    :return: The claimed emails
+    """
+    now = datetime.now()
+    claimable = [
+        EmailOutbox.status == EmailStatus.PENDING,
+        EmailOutbox.next_attempt_at <= now,
+        or_(EmailOutbox.locked_until.is_(None), EmailOutbox.locked_until < now),
+    ]
+
+    candidates = await session.execute(
+        select(EmailOutbox.id)
+        .where(*claimable)
+        .order_by(EmailOutbox.next_attempt_at)
+        .limit(limit)
+    )
+    ids = candidates.scalars().all()
+    if not ids:
+        return []
+
+    await session.execute(
+        update(EmailOutbox)
+        .where(EmailOutbox.id.in_(ids), *claimable)
+        .values(claim_token=claim_token, locked_until=locked_until)
+        .execution_options(synchronize_session=False)
+    )
+    await session.commit()
+
+    result = await session.execute(
+        select(EmailOutbox).where(EmailOutbox.claim_token == claim_token)
+    )
+    return list(result.scalars().all())
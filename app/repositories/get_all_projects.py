@@ -1,23 +1,43 @@
+from datetime import datetime
 from typing import Sequence
 
-from sqlalchemy import select
+from sqlalchemy import select, or_, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Project
 
 
-async def get_all_projects(session: AsyncSession) -> Sequence[Project]:
+async def get_all_projects(session: AsyncSession, limit: int | None = None,
+                           cursor: list | None = None) -> Sequence[Project]:
     """
-    Asynchronously fetch  projects.
+    Asynchronously fetch projects, the most recent first.
+
+    Projects without a creation date come last, the project ID breaks ties.
 
     Args:
         session (AsyncSession): The asynchronous database session.
+        limit (int | None): The maximum number of projects to return, all of them when None.
+        cursor (list | None): [created_at in ISO format or None, id] of the last project of the previous page.
 
     Returns:
         List: List of all game responses.
     """
-    result = await session.execute(
-        select(Project)
-        .order_by(Project.created_at.desc())
-    )
-    return result.scalars().all()  # Fetches the first object
+    query = select(Project)
+    if cursor is not None:
+        created_at, project_id = cursor
+        if created_at is None:
+            query = query.where(Project.created_at.is_(None), Project.id < project_id)
+        else:
+            created_at = datetime.fromisoformat(created_at)
+            query = query.where(or_(
+                Project.created_at < created_at,
+                and_(Project.created_at == created_at, Project.id < project_id),
+                Project.created_at.is_(None)
+            ))
+    # NULL creation dates sort last in descending order on both MySQL and SQLite
+    query = query.order_by(Project.created_at.desc(), Project.id.desc())
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    return result.scalars().all()
@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Arena, GroupArenas
+
+
+async def get_arenas_by_groups(group_ids: list[str], session: AsyncSession) -> Sequence[Row[tuple[str, Arena]]]:
+    """
+    Fetches all arenas associated with a list of group IDs in a single query.
+    :param group_ids: The IDs of the groups to filter arenas by.
+    :param session: The async session
+    :return: A list of (group_id, Arena) rows.
+    """
+    if not group_ids:
+        return []
+
+    result = await session.execute(
+        select(GroupArenas.group_id, Arena).join(
+            GroupArenas, GroupArenas.arena_id == Arena.id
+        ).where(
+            GroupArenas.group_id.in_(group_ids)
+        )
+    )
+    return result.all()
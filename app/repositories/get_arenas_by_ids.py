@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Arena
+
+
+async def get_arenas_by_ids(arena_ids: list[str], session: AsyncSession) -> Sequence[Arena]:
+    """
+    Fetches all arenas matching a list of arena IDs in a single query.
+    :param arena_ids: The IDs of the arenas to fetch.
+    :param session: The async session
+    :return: A list of Arena ORM objects.
+    """
+    if not arena_ids:
+        return []
+
+    result = await session.execute(
+        select(Arena).where(
+            Arena.id.in_(arena_ids)
+        )
+    )
+    return result.scalars().all()
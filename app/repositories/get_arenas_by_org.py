@@ -3,21 +3,28 @@ from typing import Sequence
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Arena, GroupArenas
+from app.models import Arena
 
 
-async def get_arenas_by_org(org_id: str, session: AsyncSession) -> Sequence[Arena]:
+async def get_arenas_by_org(org_id: str, session: AsyncSession, limit: int | None = None,
+                            cursor: str | None = None) -> Sequence[Arena]:
     """
-    Fetches all arenas associated with a specific group ID.
+    Fetches the arenas of an organisation, ordered by arena ID.
     :param org_id: The ID of the organisation to filter arenas.
     :param session: The async session
+    :param limit: The maximum number of arenas to return, all of them when None.
+    :param cursor: The ID of the last arena of the previous page.
     :return: A list of Arena ORM objects.
     """
-
-    result = await session.execute(
-        select(Arena).where(
-            Arena.organisation_code == org_id
-        )
+    query = select(Arena).where(
+        Arena.organisation_code == org_id
     )
+    if cursor is not None:
+        query = query.where(Arena.id > cursor)
+    query = query.order_by(Arena.id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
 
     return result.scalars().all()
@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import ProjectComment
+
+
+async def get_comment_by_id(comment_id: str, session: AsyncSession) -> ProjectComment | None:
+    """
+    Fetches a single comment by ID, with its likes.
+
+    Args:
+        comment_id (str): The ID of the comment to fetch.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        ProjectComment: The comment or None if not found.
+    """
+    result = await session.execute(
+        select(ProjectComment)
+        .options(selectinload(ProjectComment.likes))
+        .where(ProjectComment.id == comment_id)
+    )
+    return result.scalar()
@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import CommentLike
+
+
+async def get_comment_like(comment_id: str, user_id: str, session: AsyncSession) -> CommentLike | None:
+    """
+    Fetches the like of a user on a comment.
+
+    Args:
+        comment_id (str): The ID of the comment.
+        user_id (str): The ID of the user.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        CommentLike: The like or None if the user did not like the comment.
+    """
+    result = await session.execute(
+        select(CommentLike)
+        .where(CommentLike.comment_id == comment_id, CommentLike.user_id == user_id)
+        .limit(1)
+    )
+    return result.scalar()
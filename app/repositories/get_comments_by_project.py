@@ -0,0 +1,36 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import ProjectComment
+
+
+async def get_comments_by_project(project_id: str | None, visible: bool, session: AsyncSession,
+                                  limit: int | None = None, cursor: str | None = None) -> Sequence[ProjectComment]:
+    """
+    Fetches the comments of a project, ordered by comment ID.
+
+    Args:
+        project_id (str | None): The project of the comments, the comments of every project when None.
+        visible (bool): The visibility of the comments.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+        limit (int | None): The maximum number of comments to return, all of them when None.
+        cursor (str | None): The ID of the last comment of the previous page.
+
+    Returns:
+        list[ProjectComment]: The comments with their likes.
+    """
+    # The likes are part of the response, they are loaded up front as lazy loads fail on async sessions
+    query = select(ProjectComment).options(selectinload(ProjectComment.likes)).where(ProjectComment.visible == visible)
+    if project_id:
+        query = query.where(ProjectComment.project_id == project_id)
+    if cursor is not None:
+        query = query.where(ProjectComment.id > cursor)
+    query = query.order_by(ProjectComment.id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    return result.scalars().all()
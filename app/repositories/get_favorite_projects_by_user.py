@@ -6,20 +6,30 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Project, ProjectFavorite
 
 
-async def get_favorite_projects_by_user(user_id: str, session: AsyncSession) -> Sequence[Project]:
+async def get_favorite_projects_by_user(user_id: str, session: AsyncSession, limit: int | None = None,
+                                        cursor: str | None = None) -> Sequence[Project]:
     """
-    Fetches the favorite project (game) by user code
+    Fetches the favorite projects (games) of a user, ordered by project ID.
 
     Args:
         user_id (str): The user code.
         session (AsyncSession): The asynchronous SQLAlchemy session.
+        limit (int | None): The maximum number of projects to return, all of them when None.
+        cursor (str | None): The ID of the last project of the previous page.
 
     Returns:
-        Project: The next Project object or None if not found.
+        list[Project]: The favorite projects of the user.
     """
-    result = await session.execute(
+    query = (
         select(Project)
         .join(ProjectFavorite, ProjectFavorite.project_id == Project.id)
         .where(ProjectFavorite.user_id == user_id)
     )
-    return result.scalars().all()  # Fetches the first object
+    if cursor is not None:
+        query = query.where(Project.id > cursor)
+    query = query.order_by(Project.id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    return result.scalars().all()
@@ -0,0 +1,73 @@
+from collections import defaultdict
+
+from sqlalchemy import select, func, literal, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSessionPlayers, ArenaSession, Group, GroupUsers, GroupProjects
+
+
+async def get_game_counters_by_games(db: AsyncSession, games: list[tuple[str, str]]) -> dict[str, dict[str, int]]:
+    """
+    Asynchronous counters query for many games at once.
+
+    The group, manager and player counts of every game are computed with
+    one GROUP BY per counter, combined with a UNION into a single round trip.
+
+    Args:
+        db (AsyncSession): The asynchronous database session.
+        games (list[tuple[str, str]]): The (module game ID, game ID) pairs to count for.
+
+    Returns:
+        dict[str, dict[str, int]]: The counters of each game, keyed by game ID:
+            - session_players: players of the sessions running the module game,
+            - total_players: players of every session of the game,
+            - total_managers: managers of the groups of the game,
+            - total_groups: groups of the game.
+    """
+    if not games:
+        return {}
+
+    game_ids = list({game_id for _, game_id in games})
+
+    groups_query = (
+        select(GroupProjects.project_id.label("project_id"), literal("groups").label("counter"),
+               literal(None).label("module_id"), func.count().label("total"))
+        .where(GroupProjects.project_id.in_(game_ids))
+        .group_by(GroupProjects.project_id)
+    )
+
+    managers_query = (
+        select(GroupProjects.project_id, literal("managers"), literal(None), func.count())
+        .select_from(GroupUsers)
+        .join(Group, Group.id == GroupUsers.group_id)
+        .join(GroupProjects, Group.id == GroupProjects.group_id)
+        .where(GroupProjects.project_id.in_(game_ids))
+        .group_by(GroupProjects.project_id)
+    )
+
+    players_query = (
+        select(ArenaSession.project_id, literal("players"), ArenaSession.player_module_id, func.count())
+        .select_from(ArenaSessionPlayers)
+        .join(ArenaSession, ArenaSession.id == ArenaSessionPlayers.session_id)
+        .where(ArenaSession.project_id.in_(game_ids))
+        .group_by(ArenaSession.project_id, ArenaSession.player_module_id)
+    )
+
+    result = await db.execute(union_all(groups_query, managers_query, players_query))
+
+    totals = defaultdict(int)
+    players_by_module = {}
+    for game_id, counter, module_id, total in result.all():
+        totals[(game_id, counter)] += total
+        if counter == "players":
+            players_by_module[(game_id, module_id)] = total
+
+    return {
+        game_id: {
+            "session_players": players_by_module.get((game_id, module_game_id), 0),
+            "total_players": totals[(game_id, "players")],
+            "total_managers": totals[(game_id, "managers")],
+            "total_groups": totals[(game_id, "groups")],
+        }
+        for module_game_id, game_id in games
+    }
@@ -0,0 +1,25 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSession
+
+
+async def get_game_ids_by_arena(arena_id: str, session: AsyncSession) -> Sequence[str]:
+    """
+    Fetches the IDs of the games (projects) played in the sessions of an arena.
+
+    Args:
+        arena_id (str): The ID of the arena.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[str]: The IDs of the games of the arena.
+    """
+    result = await session.execute(
+        select(ArenaSession.project_id)
+        .distinct()
+        .where(ArenaSession.arena_id == arena_id)
+    )
+    return result.scalars().all()
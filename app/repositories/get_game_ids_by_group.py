@@ -0,0 +1,25 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GroupProjects
+
+
+async def get_game_ids_by_group(group_id: str, session: AsyncSession) -> Sequence[str]:
+    """
+    Fetches the IDs of the games (projects) associated with a group.
+
+    Args:
+        group_id (str): The ID of the group.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[str]: The IDs of the games of the group.
+    """
+    result = await session.execute(
+        select(GroupProjects.project_id)
+        .distinct()
+        .where(GroupProjects.group_id == group_id)
+    )
+    return result.scalars().all()
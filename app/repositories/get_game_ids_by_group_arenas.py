@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSession, GroupArenas
+
+
+async def get_game_ids_by_group_arenas(group_id: str, session: AsyncSession) -> Sequence[str]:
+    """
+    Fetches the IDs of the games (projects) played in the sessions of the arenas of a group.
+
+    Args:
+        group_id (str): The ID of the group.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[str]: The IDs of the games of the arenas of the group.
+    """
+    result = await session.execute(
+        select(ArenaSession.project_id)
+        .distinct()
+        .join(GroupArenas, GroupArenas.arena_id == ArenaSession.arena_id)
+        .where(GroupArenas.group_id == group_id)
+    )
+    return result.scalars().all()
@@ -0,0 +1,63 @@
+from typing import Sequence
+
+from sqlalchemy import Row, select, literal, union_all, case, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Group, GroupUsers, GroupProjects, ArenaSession, ArenaSessionPlayers
+
+
+async def get_game_memberships_from_sources(
+        session: AsyncSession, user_ids: list[str] | None = None, project_ids: list[str] | None = None
+) -> Sequence[Row]:
+    """
+    Derives the memberships of users in games from the group managers, the
+    session players and the session moderators, in one query.
+
+    Args:
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+        user_ids (list[str] | None): The users to derive the memberships of, every user when None.
+        project_ids (list[str] | None): The games to derive the memberships in, every game when None.
+
+    Returns:
+        list[Row]: (user_id, project_id, organisation_code, role, is_game_master) rows, one per
+        user, game, organisation and role ('manager', 'player' or 'moderator').
+    """
+    manager_query = (
+        select(GroupUsers.user_id.label("user_id"), GroupProjects.project_id.label("project_id"),
+               Group.organisation_code.label("organisation_code"), literal("manager").label("role"),
+               literal(0).label("is_game_master"))
+        .join(GroupUsers, GroupProjects.group_id == GroupUsers.group_id)
+        .outerjoin(Group, GroupProjects.group_id == Group.id)
+        .where(GroupUsers.user_id.is_not(None), GroupProjects.project_id.is_not(None))
+    )
+
+    player_query = (
+        select(ArenaSessionPlayers.user_id, ArenaSession.project_id, ArenaSession.organisation_code,
+               literal("player"), case((ArenaSessionPlayers.is_game_master.is_(True), 1), else_=0))
+        .join(ArenaSession, ArenaSessionPlayers.session_id == ArenaSession.id)
+        .where(ArenaSessionPlayers.user_id.is_not(None), ArenaSession.project_id.is_not(None))
+    )
+
+    moderator_query = (
+        select(ArenaSession.super_game_master_id, ArenaSession.project_id, ArenaSession.organisation_code,
+               literal("moderator"), literal(0))
+        .where(ArenaSession.super_game_master_id.is_not(None), ArenaSession.project_id.is_not(None))
+    )
+
+    if user_ids is not None:
+        manager_query = manager_query.where(GroupUsers.user_id.in_(user_ids))
+        player_query = player_query.where(ArenaSessionPlayers.user_id.in_(user_ids))
+        moderator_query = moderator_query.where(ArenaSession.super_game_master_id.in_(user_ids))
+    if project_ids is not None:
+        manager_query = manager_query.where(GroupProjects.project_id.in_(project_ids))
+        player_query = player_query.where(ArenaSession.project_id.in_(project_ids))
+        moderator_query = moderator_query.where(ArenaSession.project_id.in_(project_ids))
+
+    memberships = union_all(manager_query, player_query, moderator_query).subquery()
+    result = await session.execute(
+        select(memberships.c.user_id, memberships.c.project_id, memberships.c.organisation_code,
+               memberships.c.role, func.max(memberships.c.is_game_master).label("is_game_master"))
+        .group_by(memberships.c.user_id, memberships.c.project_id, memberships.c.organisation_code,
+                  memberships.c.role)
+    )
+    return result.all()
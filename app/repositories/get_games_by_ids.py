@@ -0,0 +1,28 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Project
+
+
+async def get_games_by_ids(game_ids: list[str], session: AsyncSession) -> Sequence[Project]:
+    """
+    Fetches all projects (games) matching a list of game IDs in a single query.
+
+    Args:
+        game_ids (list[str]): The IDs of the games to fetch.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[Project]: A list of Project objects or an empty list if none are found.
+    """
+    if not game_ids:
+        return []
+
+    result = await session.execute(
+        select(Project).where(
+            Project.id.in_(game_ids)
+        )
+    )
+    return result.scalars().all()
@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GroupArenas, Group
+
+
+async def get_groups_by_arenas(arena_ids: list[str], session: AsyncSession) -> Sequence[Row[tuple[str, Group]]]:
+    """
+    Fetches the groups associated with a list of arena IDs in a single query.
+    :param arena_ids: The IDs of the arenas to filter groups by.
+    :param session: The async session
+    :return: A list of (arena_id, Group) rows.
+    """
+    if not arena_ids:
+        return []
+
+    result = await session.execute(
+        select(GroupArenas.arena_id, Group).join(
+            GroupArenas, GroupArenas.group_id == Group.id
+        ).where(
+            GroupArenas.arena_id.in_(arena_ids)
+        )
+    )
+    return result.all()
@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Group, GroupProjects
+
+
+async def get_groups_by_games(game_ids: list[str], session: AsyncSession) -> Sequence[Row[tuple[str, Group]]]:
+    """
+    Fetches all groups associated with a list of game IDs in a single query.
+    :param game_ids: The IDs of the games to filter groups by.
+    :param session: The async session
+    :return: A list of (game_id, Group) rows.
+    """
+    if not game_ids:
+        return []
+
+    result = await session.execute(
+        select(GroupProjects.project_id, Group).join(
+            GroupProjects, GroupProjects.group_id == Group.id
+        ).where(
+            GroupProjects.project_id.in_(game_ids)
+        )
+    )
+    return result.all()
@@ -6,17 +6,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Group
 
 
-async def get_groups_by_org(org_id: str, session: AsyncSession) -> Sequence[Group]:
+async def get_groups_by_org(org_id: str, session: AsyncSession, limit: int | None = None,
+                            cursor: str | None = None) -> Sequence[Group]:
     """
-    Fetches all arenas associated with a specific group ID.
-    :param org_id: The ID of the group.
+    Fetches the groups of an organisation, ordered by group ID.
+    :param org_id: The ID of the organisation.
     :param session: The async session
-    :return: A list of Arena ORM objects.
+    :param limit: The maximum number of groups to return, all of them when None.
+    :param cursor: The ID of the last group of the previous page.
+    :return: A list of Group ORM objects.
     """
-
-    result = await session.execute(
-        select(Group).where(
-            Group.organisation_code == org_id
-        )
+    query = select(Group).where(
+        Group.organisation_code == org_id
     )
-    return result.scalars().all()
\ No newline at end of file
+    if cursor is not None:
+        query = query.where(Group.id > cursor)
+    query = query.order_by(Group.id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
+    return result.scalars().all()
@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import GroupUsers
+
+
+async def get_managers_by_groups(group_ids: list[str], session: AsyncSession) -> Sequence[GroupUsers]:
+    """
+    Fetches the managers of a list of groups in a single query.
+    :param group_ids: The IDs of the groups to filter managers by.
+    :param session: The async session
+    :return: A list of GroupUsers ORM objects.
+    """
+    if not group_ids:
+        return []
+
+    result = await session.execute(
+        select(GroupUsers)
+        .distinct()  # Ensures unique managers
+        .where(GroupUsers.group_id.in_(group_ids))
+    )
+    return result.scalars().all()
@@ -0,0 +1,32 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import ModuleForType
+from app.models import ProjectModule
+
+
+async def get_modules_by_games_by_types(game_ids: list[str], types: list[ModuleForType], session: AsyncSession) -> \
+        Sequence[ProjectModule]:
+    """
+    Fetches the modules of many games restricted to a list of types in a single query.
+
+    Args:
+        game_ids (list[str]): The IDs of the games to fetch modules for.
+        types (list[ModuleForType]): A list of types to filter modules by.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[ProjectModule]: A list of ProjectModule objects or an empty list if none are found.
+    """
+    if not game_ids or not types:
+        return []
+
+    result = await session.execute(
+        select(ProjectModule).where(
+            ProjectModule.project_id.in_(game_ids),
+            ProjectModule.module_for.in_([mtype.value for mtype in types])
+        )
+    )
+    return result.scalars().all()
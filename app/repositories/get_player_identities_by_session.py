@@ -0,0 +1,19 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSessionPlayers
+
+
+async def get_player_identities_by_session(session_id: str, session: AsyncSession) -> list[tuple[str | None, str | None]]:
+    """
+    Fetch the email and user id of every player of a session in one query.
+
+    :param session_id: Session identifier
+    :param session: Database session
+    :return: (user_email, user_id) of the players
+    """
+    result = await session.execute(
+        select(ArenaSessionPlayers.user_email, ArenaSessionPlayers.user_id)
+        .where(ArenaSessionPlayers.session_id == session_id)
+    )
+    return [tuple(row) for row in result.all()]
@@ -0,0 +1,33 @@
+from typing import Sequence
+
+from sqlalchemy import select, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSession, ArenaSessionPlayers
+
+
+async def get_players_by_arenas(arena_ids: list[str],
+                                session: AsyncSession) -> Sequence[Row[tuple[str, str, str, str]]]:
+    """
+    Fetches the distinct players of every session of a list of arenas in a single query.
+    :param arena_ids: The IDs of the arenas to filter players by.
+    :param session: The async session
+    :return: A list of (arena_id, user_id, user_email, user_name) rows.
+    """
+    if not arena_ids:
+        return []
+
+    result = await session.execute(
+        select(
+            ArenaSession.arena_id,
+            ArenaSessionPlayers.user_id,
+            ArenaSessionPlayers.user_email,
+            ArenaSessionPlayers.user_name
+        )
+        .distinct()
+        .join(ArenaSession, ArenaSession.id == ArenaSessionPlayers.session_id)
+        .where(
+            ArenaSession.arena_id.in_(arena_ids)
+        )
+    )
+    return result.all()
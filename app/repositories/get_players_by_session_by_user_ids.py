@@ -0,0 +1,24 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSessionPlayers
+
+
+async def get_players_by_session_by_user_ids(session_id: str, user_ids: list[str],
+                                             session: AsyncSession) -> list[ArenaSessionPlayers]:
+    """
+    Fetch the players of a session for many users in one query.
+
+    :param session_id: Session identifier
+    :param user_ids: User identifiers
+    :param session: Database session
+    :return: The players of the session among those users
+    """
+    if not user_ids:
+        return []
+
+    result = await session.execute(
+        select(ArenaSessionPlayers)
+        .where(ArenaSessionPlayers.session_id == session_id, ArenaSessionPlayers.user_id.in_(user_ids))
+    )
+    return list(result.scalars().all())
@@ -0,0 +1,25 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import ArenaSessionPlayers
+
+
+async def get_players_by_sessions(session_ids: list[str], session: AsyncSession) -> Sequence[ArenaSessionPlayers]:
+    """
+    Fetches the players of a list of sessions in a single query.
+    :param session_ids: The IDs of the sessions to filter players by.
+    :param session: The async session
+    :return: A list of ArenaSessionPlayers ORM objects.
+    """
+    if not session_ids:
+        return []
+
+    result = await session.execute(
+        select(ArenaSessionPlayers)
+        .where(
+            ArenaSessionPlayers.session_id.in_(session_ids)
+        )
+    )
+    return result.scalars().all()  # Extract ORM objects
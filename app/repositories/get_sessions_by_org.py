@@ -6,11 +6,24 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import ArenaSession
 
 
-async def get_sessions_by_org(org_id: str, session: AsyncSession) -> Sequence[ArenaSession]:
-    result = await session.execute(
-        select(ArenaSession)
-        .where(
-            ArenaSession.organisation_code == org_id
-        )
+async def get_sessions_by_org(org_id: str, session: AsyncSession, limit: int | None = None,
+                              cursor: str | None = None) -> Sequence[ArenaSession]:
+    """
+    Fetches the sessions of an organisation, ordered by session ID.
+    :param org_id: The ID of the organisation to filter sessions.
+    :param session: The async session
+    :param limit: The maximum number of sessions to return, all of them when None.
+    :param cursor: The ID of the last session of the previous page.
+    :return: A list of ArenaSession ORM objects.
+    """
+    query = select(ArenaSession).where(
+        ArenaSession.organisation_code == org_id
     )
+    if cursor is not None:
+        query = query.where(ArenaSession.id > cursor)
+    query = query.order_by(ArenaSession.id)
+    if limit is not None:
+        query = query.limit(limit)
+
+    result = await session.execute(query)
     return result.scalars().all()  # Extract ORM objects
@@ -0,0 +1,31 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UserGameMembership
+
+
+async def get_user_game_memberships(user_id: str, project_ids: list[str],
+                                    session: AsyncSession) -> Sequence[UserGameMembership]:
+    """
+    Fetches the memberships of a user in a list of games.
+
+    Args:
+        user_id (str): The user's ID.
+        project_ids (list[str]): The IDs of the games.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        list[UserGameMembership]: The memberships of the user in those games.
+    """
+    if not project_ids:
+        return []
+
+    result = await session.execute(
+        select(UserGameMembership).where(
+            UserGameMembership.user_id == user_id,
+            UserGameMembership.project_id.in_(project_ids)
+        )
+    )
+    return result.scalars().all()
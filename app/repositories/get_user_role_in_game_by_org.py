@@ -1,7 +1,6 @@
-from sqlalchemy import select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Project, GroupUsers, ArenaSessionPlayers, ArenaSession, GroupProjects
+from app.repositories.get_user_roles_in_games_by_org import get_user_roles_in_games_by_org
 
 
 async def get_user_role_in_game_by_org(
@@ -19,52 +18,8 @@ async def get_user_role_in_game_by_org(
     Returns:
         str: The role of the user ('manager', 'moderator', 'player', or None).
     """
-
-    manager_query = (
-        select(GroupProjects.project_id)
-        .join(GroupUsers, GroupProjects.group_id == GroupUsers.group_id)
-        .where(
-            GroupUsers.user_id == user_id,
-            GroupProjects.project_id == game_id,
-        )
-    )
-
-    # Manager role
-    result = await session.execute(manager_query)
-    if result.scalar() is not None:
-        return "manager"
-
-
-    player_query = (
-        select(ArenaSessionPlayers.session_id)
-        .join(ArenaSession, ArenaSessionPlayers.session_id == ArenaSession.id)
-        .where(
-            ArenaSessionPlayers.user_id == user_id,
-            ArenaSession.project_id == game_id,
-            ArenaSession.organisation_code == org_id,
-        )
-    )
-
-    # Player role
-    result = await session.execute(player_query)
-    if result.scalar() is not None:
+    roles = await get_user_roles_in_games_by_org(user_id, {game_id: org_id}, session)
+    role = roles[game_id]
+    if role == "game_master":
         return "player"
-
-
-    moderator_query = (
-        select(ArenaSession.project_id)
-        .where(
-            ArenaSession.super_game_master_id == user_id,
-            ArenaSession.project_id == game_id,
-            ArenaSession.organisation_code == org_id,
-        )
-    )
-
-    # Moderator role
-    result = await session.execute(moderator_query)
-    if result.scalar() is not None:
-        return "moderator"
-
-
-    # No access
-    return None
+    return role
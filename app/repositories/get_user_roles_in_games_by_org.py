@@ -0,0 +1,52 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.get_user_game_memberships import get_user_game_memberships
+
+
+async def get_user_roles_in_games_by_org(
+        user_id: str, games: dict[str, str], session: AsyncSession
+) -> dict[str, str | None]:
+    """
+    Determines the role of a user in many games within their organizations in one query.
+
+    The memberships of the user are ranked per game, so a manager wins over a
+    player and a player over a moderator. A player flagged as game master in
+    any session of the game gets the 'game_master' role.
+
+    Args:
+        user_id (str): The user's ID.
+        games (dict[str, str]): The organization code of each game, keyed by game ID.
+        session (AsyncSession): The asynchronous SQLAlchemy session.
+
+    Returns:
+        dict[str, str | None]: The role of the user in each game
+        ('manager', 'game_master', 'player', 'moderator', or None), keyed by game ID.
+    """
+    if not games:
+        return {}
+
+    manager, player, game_master, moderator = set(), set(), set(), set()
+    for membership in await get_user_game_memberships(user_id, list(games), session):
+        if membership.role == "manager":
+            manager.add(membership.project_id)
+        # Sessions only count for the organization of their game
+        elif membership.organisation_code != games[membership.project_id]:
+            continue
+        elif membership.role == "player":
+            player.add(membership.project_id)
+            if membership.is_game_master:
+                game_master.add(membership.project_id)
+        elif membership.role == "moderator":
+            moderator.add(membership.project_id)
+
+    roles = dict.fromkeys(games)
+    for game_id in games:
+        if game_id in manager:
+            roles[game_id] = "manager"
+        elif game_id in game_master:
+            roles[game_id] = "game_master"
+        elif game_id in player:
+            roles[game_id] = "player"
+        elif game_id in moderator:
+            roles[game_id] = "moderator"
+    return roles
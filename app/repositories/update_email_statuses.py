@@ -0,0 +1,22 @@
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import EmailOutbox, ArenaSessionPlayers, ArenaSession
+
+
+async def update_email_statuses(outbox: list[dict], players: list[dict], sessions: list[dict],
+                                session: AsyncSession):
+    """
+    Write the delivery results of a batch of outbox emails.
+
+    Every list is sent as one executemany UPDATE by primary key.
+
+    :param outbox: Outbox changes, each with the id of the outbox row
+    :param players: {"id", "email_status"} of the invited players
+    :param sessions: {"id", "email_status"} of the sessions with an invited moderator
+    :param session: Database session
+    """
+    for model, values in ((EmailOutbox, outbox), (ArenaSessionPlayers, players), (ArenaSession, sessions)):
+        if values:
+            await session.execute(update(model), values)
+    await session.commit()
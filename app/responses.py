@@ -0,0 +1,78 @@
+import json
+import os
+from typing import Any
+
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # The optional orjson package is faster, the standard encoder gives the same bytes
+    orjson = None
+
+# Opt-in fast responses of the endpoints returning large trusted payloads
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() in ("1", "true", "yes")
+
+
+def dump_json(content: Any) -> bytes:
+    """
+    Encode JSON compatible content to the exact bytes JSONResponse renders for it.
+
+    orjson writes compact UTF-8 like JSONResponse does, the payloads of the
+    API have no floats, which the two encoders format differently.
+    """
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def to_jsonable(content: Any) -> Any:
+    """
+    Turn response models, and lists of them, into JSON compatible content as FastAPI serializes them.
+
+    The models built by the services with model_construct are trusted, so they are dumped without
+    being validated again, and without the warnings of fields holding the string form of their type.
+    """
+    if isinstance(content, BaseModel):
+        return content.model_dump(mode="json", by_alias=True, warnings=False)
+    if isinstance(content, list):
+        return [to_jsonable(item) for item in content]
+    return jsonable_encoder(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response encoded with dump_json.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+def fast_json_response(content: Any, response: Response | None = None) -> Any:
+    """
+    Send the content of an endpoint without the validation against its response_model.
+
+    When FAST_JSON_RESPONSES is off the content is returned as JSON compatible data,
+    which FastAPI validates and serializes as usual. The endpoint keeps its
+    response_model for the documentation.
+
+    Args:
+        content (Any): Response models built by the services, or lists of them.
+        response (Response | None): The response of the endpoint, its headers are sent along.
+
+    Returns:
+        Any: The response to return from the endpoint.
+    """
+    content = to_jsonable(content)
+    if not FAST_JSON_RESPONSES:
+        return content
+
+    fast_response = FastJSONResponse(content=content)
+    if response is not None:
+        for name, value in response.headers.items():
+            if name != "content-length":
+                fast_response.headers.append(name, value)
+    return fast_response
@@ -1,6 +1,6 @@
 from typing import Dict, Any, List
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
@@ -30,10 +30,13 @@ from app.payloads.response.GroupCreateClientResponse import GroupCreateClientRes
 from app.payloads.response.InvitePlayerResponse import InvitePlayerResponse
 from app.payloads.response.SessionCreateResponse import SessionCreateResponse
 from app.payloads.response.SessionResponse import SessionResponse
-from app.database import get_db_async
+from app.database import get_db_async, get_db_read_async
+from app.pagination import Pagination, pagination, send_page
+from app.responses import fast_json_response
 from uuid import UUID
 from sqlalchemy.exc import NoResultFound
 
+from app.repositories.get_game_ids_by_group import get_game_ids_by_group
 from app.repositories.get_group_by_id import get_group_by_id
 from app.repositories.get_session_by_id import get_session_by_id
 from app.services import config_session as services_config_session
@@ -66,6 +69,8 @@ from app.services.assign_game_to_group import assign_game_to_group
 from app.services.assign_manager_to_group_by_email import assign_manager_to_group_by_email
 from app.services.remove_game_from_group import remove_game_from_group
 from app.services.remove_manager_from_group_by_email import remove_manager_from_group_by_email
+from app.services.game_view_cache import bump_game_versions, get_game_ids_showing_group
+from app.services.user_game_membership import sync_user_game_memberships
 
 logger = logging.getLogger(__name__)
 
@@ -78,12 +83,11 @@ router = APIRouter(
 
 @router.post("/groups", response_model=GroupCreateClientResponse)
 async def create_group(group: GroupCreateRequest,
-                       background_tasks: BackgroundTasks,
                        db: AsyncSession = Depends(get_db_async),
                        jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
-        return await services_create_group.create_group(db, group, org_id, background_tasks)
+        return await services_create_group.create_group(db, group, org_id)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -92,10 +96,12 @@ async def create_group(group: GroupCreateRequest,
 
 
 @router.get("/groups", response_model=list[GroupClientResponse])
-async def list_groups(db: AsyncSession = Depends(get_db_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def list_groups(response: Response, page: Pagination = Depends(pagination),
+                      db: AsyncSession = Depends(get_db_read_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
-        return await services_get_groups.get_groups(db, org_id)
+        groups = await services_get_groups.get_groups(db, org_id, limit=page.limit, cursor=page.cursor)
+        return send_page(response, groups)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -104,7 +110,7 @@ async def list_groups(db: AsyncSession = Depends(get_db_async), jwt_claims: Dict
 
 
 @router.get("/groups/{group_id}", response_model=GroupClientResponse)
-async def get_group(group_id: str, db: AsyncSession = Depends(get_db_async),
+async def get_group(group_id: str, db: AsyncSession = Depends(get_db_read_async),
                     jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
@@ -248,7 +254,6 @@ async def delete_group(group_id: str, db: AsyncSession = Depends(get_db_async),
 @router.post("/groups/{group_id}/invite-managers")
 async def invite_manager(
         group_id: str,
-        background_tasks: BackgroundTasks,
         invite_req: GroupInviteManagerRequest,
         db: AsyncSession = Depends(get_db_async),
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)
@@ -269,7 +274,7 @@ async def invite_manager(
                 detail=f"Organisation not allowed."
             )
 
-        await services_invite_managers.invite_managers(db, group, invite_req.managers, background_tasks)
+        await services_invite_managers.invite_managers(db, group, invite_req.managers)
         return {"message": "Invitations sent successfully"}
     except HTTPException:
         raise
@@ -281,31 +286,35 @@ async def invite_manager(
 
 
 @router.post("/groups/manager/{group_manager_id}/remove")
-def remove_manager(group_manager_id: str, db: AsyncSession = Depends(get_db_async),
-                   jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def remove_manager(group_manager_id: str, db: AsyncSession = Depends(get_db_async),
+                         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
 
-        group_user = db.query(GroupUsers).filter(GroupUsers.id == group_manager_id).first()
+        group_user = await db.get(GroupUsers, group_manager_id)
         if not group_user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"GroupUser with ID {group_manager_id} not found."
             )
 
-        if not group_user.group or group_user.group.organisation_code != org_id:
+        group = await get_group_by_id(group_user.group_id, db)
+        if not group or group.organisation_code != org_id:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Group not found."
             )
 
-        db.delete(group_user)
-        db.commit()
+        await db.delete(group_user)
+        await sync_user_game_memberships(db, [group_user.user_id], await get_game_ids_by_group(group.id, db))
+        game_ids = await get_game_ids_showing_group(db, group.id)
+        await db.commit()
+        await bump_game_versions(game_ids)
         return {"message": "Group manager removed successfully."}
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()  # Rollback in case of an error
+        await db.rollback()  # Rollback in case of an error
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred while removing the group manager: {str(e)}"
@@ -322,13 +331,15 @@ async def create_arena(arena: ArenaCreateRequest, db: AsyncSession = Depends(get
 
 
 @router.get("/arenas", response_model=list[ArenaListResponseTop])
-async def list_arenas(db: AsyncSession = Depends(get_db_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def list_arenas(response: Response, page: Pagination = Depends(pagination),
+                      db: AsyncSession = Depends(get_db_read_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     org_id = jwt_claims.get("org_id")
-    return await services_get_arenas.get_arenas(db, org_id)
+    arenas = await services_get_arenas.get_arenas(db, org_id, limit=page.limit, cursor=page.cursor)
+    return fast_json_response(send_page(response, arenas), response)
 
 
 @router.get("/arenas/{arena_id}", response_model=ArenaListResponseTop)
-async def get_arena(arena_id: UUID, db: AsyncSession = Depends(get_db_async),
+async def get_arena(arena_id: UUID, db: AsyncSession = Depends(get_db_read_async),
                     jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     org_id = jwt_claims.get("org_id")
     arena = await services_show_arena.show_arena(db, arena_id, org_id)
@@ -338,7 +349,7 @@ async def get_arena(arena_id: UUID, db: AsyncSession = Depends(get_db_async),
 
 
 @router.get("/arenas/{arena_id}/game/{game_id}", response_model=ArenaShowByGameResponse)
-async def get_arena_by_game(arena_id: UUID, game_id: UUID, db: AsyncSession = Depends(get_db_async),
+async def get_arena_by_game(arena_id: UUID, game_id: UUID, db: AsyncSession = Depends(get_db_read_async),
                             jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     org_id = jwt_claims.get("org_id")
     arena = await services_show_arena_by_game.show_arena_by_game(db, arena_id, game_id, org_id)
@@ -358,11 +369,11 @@ async def update_arena(arena_id: UUID, arena: ArenaUpdateRequest, db: AsyncSessi
 
 
 @router.delete("/arenas/{arena_id}")
-def delete_arena(arena_id: UUID, db: AsyncSession = Depends(get_db_async),
-                 jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def delete_arena(arena_id: UUID, db: AsyncSession = Depends(get_db_async),
+                       jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     org_id = jwt_claims.get("org_id")
     try:
-        return services_delete_arena.delete_arena(db, arena_id, org_id)
+        return await services_delete_arena.delete_arena(db, arena_id, org_id)
     except NoResultFound:
         raise HTTPException(status_code=404, detail="Arena not found")
 
@@ -404,7 +415,6 @@ async def create_session(session: SessionCreateRequest, db: AsyncSession = Depen
 @router.post("/sessions/{session_id}/invite-players", response_model=InvitePlayerResponse)
 async def invite_players(
         session_id: str,
-        background_tasks: BackgroundTasks,
         invite_req: InvitePlayerRequest,
         db: AsyncSession = Depends(get_db_async),
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)
@@ -420,9 +430,14 @@ async def invite_players(
         )
 
     # Call the service to handle player invitations
-    await services_invite_players.invite_players(db, session, invite_req, background_tasks)
+    result = await services_invite_players.invite_players(db, session, invite_req)
 
-    return {"message": "Invitations sent successfully"}
+    return {
+        "message": "Invitations sent successfully",
+        "added": result["added"],
+        "duplicates": result["duplicates"],
+        "invalid": result["invalid"],
+    }
 
 
 @router.post("/sessions/{session_id}/remove-invitation-players", response_model=InvitePlayerResponse)
@@ -451,11 +466,12 @@ async def remove_invited_players(
 
 
 @router.get("/sessions", response_model=list[SessionResponse])
-async def list_sessions(db: AsyncSession = Depends(get_db_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def list_sessions(response: Response, page: Pagination = Depends(pagination),
+                        db: AsyncSession = Depends(get_db_read_async), jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
-        sessions = await services_get_sessions.get_sessions(db, org_id)
-        return sessions
+        sessions = await services_get_sessions.get_sessions(db, org_id, limit=page.limit, cursor=page.cursor)
+        return fast_json_response(send_page(response, sessions), response)
     except Exception as e:
         # General error handling for unexpected issues
         raise HTTPException(
@@ -465,14 +481,14 @@ async def list_sessions(db: AsyncSession = Depends(get_db_async), jwt_claims: Di
 
 
 @router.get("/sessions/{session_id}", response_model=SessionResponse)
-async def get_session(session_id: str, db: AsyncSession = Depends(get_db_async),
+async def get_session(session_id: str, db: AsyncSession = Depends(get_db_read_async),
                       jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
         session = await services_show_session.show_session(db, session_id, org_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
-        return session
+        return fast_json_response(session)
     except Exception as e:
         # General error handling for unexpected issues
         raise HTTPException(
@@ -482,15 +498,17 @@ async def get_session(session_id: str, db: AsyncSession = Depends(get_db_async),
 
 
 @router.put("/sessions/{session_id}/config", response_model=SessionCreateResponse)
-def config_session(session_id: str, session: SessionConfigRequest, db: AsyncSession = Depends(get_db_async),
-                   jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
+async def config_session(session_id: str, session: SessionConfigRequest, db: AsyncSession = Depends(get_db_async),
+                         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     try:
         org_id = jwt_claims.get("org_id")
         try:
-            return services_config_session.config_session(db, session_id, session, org_id)
+            return await services_config_session.config_session(db, session_id, session, org_id)
         except NoResultFound:
             raise HTTPException(status_code=404, detail="Session not found")
 
+    except HTTPException:
+        raise
     except Exception as e:
         # General error handling for unexpected issues
         raise HTTPException(
@@ -556,7 +574,7 @@ async def remove_player(session_player_id: str, db: AsyncSession = Depends(get_d
 @router.get("/groups/game/{game_id}", response_model=List[GroupByGameResponse])
 async def groups_by_game(
         game_id: str,
-        db: AsyncSession = Depends(get_db_async),
+        db: AsyncSession = Depends(get_db_read_async),
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)
 ):
     """
@@ -607,12 +625,12 @@ async def groups_by_game(
 
 
 @router.post("/sessions/{session_id}/assign-moderator", response_model=dict)
-async def assign_moderator(session_id: str, background_tasks: BackgroundTasks, req: AssignModeratorRequest,
+async def assign_moderator(session_id: str, req: AssignModeratorRequest,
                            db: AsyncSession = Depends(get_db_async),
                            jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims)):
     org_id = jwt_claims.get("org_id")
 
     # Call the service to handle player invitations
-    await services_assign_moderator.assign_moderator(db, session_id, org_id, req.email, background_tasks)
+    await services_assign_moderator.assign_moderator(db, session_id, org_id, req.email)
 
     return {"message": "Invitations sent successfully"}
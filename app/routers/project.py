@@ -1,7 +1,7 @@
 # router/project.py
 from typing import Dict, Any
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
@@ -30,7 +30,9 @@ from app.payloads.response.ModuleAdminResponse import ModuleAdminResponse
 from app.payloads.response.ProjectAdminResponse import ProjectAdminResponse
 from app.payloads.response.ProjectClientWebResponse import ProjectClientWebResponse
 from app.payloads.response.ProjectCommentResponse import ProjectCommentResponse
-from app.database import get_db_async
+from app.database import DB_PRIMARY_COOKIE, AsyncReadSessionLocal, get_db_async, get_db_read_async, \
+    reads_from_primary
+from app.pagination import Pagination, created_at_pagination, pagination, send_page
 from app.services import project as services
 from app.services import create_project as services_create_project
 from app.services import get_project as services_get_project
@@ -38,6 +40,7 @@ from app.services import space_admin as services_space_admin
 from app.services import space_user as services_space_user
 from app.services import game_view as services_game_view
 from app.services import game_view_user as services_game_view_user
+from app.services.game_view_cache import get_cached_game_view
 from app.services import favorite_project as services_favorite_project
 from app.services import unfavorite_project as services_unfavorite_project
 from app.services import list_favorites as services_list_favorites
@@ -60,9 +63,11 @@ client_router = APIRouter(
 
 
 @admin_router.get("/projects", response_model=list[ProjectAdminResponse])
-async def get_projects(db: AsyncSession = Depends(get_db_async)):
-    """Endpoint to list all projects."""
-    return await services.list_projects(db)
+async def get_projects(response: Response, page: Pagination = Depends(created_at_pagination),
+                       db: AsyncSession = Depends(get_db_async)):
+    """Endpoint to list the projects, the most recent first."""
+    projects = await services.list_projects(db, limit=page.limit, cursor=page.cursor)
+    return send_page(response, projects)
 
 
 @admin_router.get("/projects/{project_id}/modules", response_model=list[ModuleAdminResponse])
@@ -126,7 +131,7 @@ async def set_template_module(module_id: str, template_id: str,
 @client_router.get("/espace-admin", response_model=AdminSpaceClientResponse)
 async def admin_space(
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
-        db: AsyncSession = Depends(get_db_async)
+        db: AsyncSession = Depends(get_db_read_async)
 ):
     """
     Endpoint to retrieve admin space information for a client.
@@ -181,17 +186,34 @@ async def admin_space(
 
 
 @client_router.get("/game-view/{game_id}", response_model=GameViewClientResponse|GameViewModeratorClientResponse|GameViewPlayerClientResponse)
-async def game_view(game_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
+async def game_view(game_id: str, request: Request, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
                     db: AsyncSession = Depends(get_db_async)):
     try:
         org_id = jwt_claims.get("org_id")
         user_id = jwt_claims.get("uid")
         # email = jwt_claims.get("email")
         role = jwt_claims.get("role")
+        # The views are cached serialized, managers and admins share theirs, players and moderators get their own.
+        # They are built from the primary, and rebuilt for a client that just wrote
+        refresh = DB_PRIMARY_COOKIE in request.cookies
         if role == "admin":
-            return await services_game_view.gameView(db=db, org_id=org_id, game_id=game_id)
+            body = await get_cached_game_view(
+                game_id, org_id, "admin", None,
+                lambda: services_game_view.gameView(db=db, org_id=org_id, game_id=game_id), refresh)
         else:
-            return await services_game_view_user.gameViewUser(db=db, org_id=org_id, user_id=user_id, game_id=game_id)
+            if reads_from_primary(request):
+                view_role = await services_game_view_user.get_game_view_role(db, org_id, user_id, game_id)
+            else:
+                # The role is read from the replica, whose connection is released before a miss is built
+                async with AsyncReadSessionLocal() as read_db:
+                    view_role = await services_game_view_user.get_game_view_role(read_db, org_id, user_id, game_id)
+            body = await get_cached_game_view(
+                game_id, org_id, view_role, None if view_role == "manager" else user_id,
+                lambda: services_game_view_user.gameViewUser(db=db, org_id=org_id, user_id=user_id,
+                                                             game_id=game_id, role=view_role), refresh)
+        return Response(content=body, media_type="application/json")
+    except HTTPException:
+        raise
     except Exception as e:
         # Log the error (you can use a proper logging framework in your project)
         logger.error(f"Error in game_view: {str(e)}")
@@ -221,10 +243,13 @@ async def unfavorite_project(project_id: str, jwt_claims: Dict[Any, Any] = Depen
 
 
 @client_router.get("/users/{user_id}/favorites", response_model=list[ProjectClientWebResponse])
-def list_favorites(jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims), db: AsyncSession = Depends(get_db_async)):
-    """Endpoint to list all favorite projects of a user."""
+async def list_favorites(response: Response, page: Pagination = Depends(pagination),
+                         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims), db: AsyncSession = Depends(get_db_async)):
+    """Endpoint to list the favorite projects of a user."""
     user_id = jwt_claims.get("uid")
-    return services_list_favorites.list_favorites(db=db, user_id=user_id)
+    favorites = await services_list_favorites.list_favorites(db=db, user_id=user_id, limit=page.limit,
+                                                             cursor=page.cursor)
+    return send_page(response, favorites)
 
 
 @client_router.get("/game/{game_id}/config", response_model=GameConfigResponse)
@@ -247,7 +272,7 @@ async def config_game(game_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt
 
 
 @client_router.put("/game/{game_id}", response_model=GameConfigResponse)
-def update_game(
+async def update_game(
         game_id: str,
         update_data: GameUpdateRequest,
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
@@ -261,8 +286,8 @@ def update_game(
     if not org_id:
         raise HTTPException(status_code=401, detail="Unauthorized: Missing org ID in JWT claims.")
 
-    updated_project = services_update_client_game.update_client_game(db=db, org_id=org_id, project_id=game_id,
-                                                                     update_data=update_data)
+    updated_project = await services_update_client_game.update_client_game(db=db, org_id=org_id, project_id=game_id,
+                                                                           update_data=update_data)
 
     if not updated_project:
         raise HTTPException(status_code=404, detail="Game not found or could not be updated.")
@@ -271,54 +296,57 @@ def update_game(
 
 
 @client_router.post("/games/{project_id}/add-comment", response_model=ProjectCommentResponse)
-def create_comment_endpoint(
+async def create_comment_endpoint(
         project_id: str,
         req: ProjectCommentCreateRequest,
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
         db: AsyncSession = Depends(get_db_async),
 ):
     user_id = jwt_claims.get("uid")
-    return services_create_comment.create_comment(db, project_id, user_id, req.comment_text)
+    return await services_create_comment.create_comment(db, project_id, user_id, req.comment_text)
 
 
 @client_router.get("/games/{project_id}/comments", response_model=list[ProjectCommentResponse])
-def list_comments_endpoint(
+async def list_comments_endpoint(
         project_id: str,
+        response: Response,
+        page: Pagination = Depends(pagination),
         db: AsyncSession = Depends(get_db_async),
 ):
-    return services_list_comments.list_comments(db, project_id)
+    comments = await services_list_comments.list_comments(db, project_id, limit=page.limit, cursor=page.cursor)
+    return send_page(response, comments)
 
 
 @client_router.put("/comments/{comment_id}", response_model=ProjectCommentResponse)
-def update_comment_endpoint(
+async def update_comment_endpoint(
         comment_id: str,
         updated_data: ProjectCommentUpdateRequest,
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
         db: AsyncSession = Depends(get_db_async),
 ):
     user_id = jwt_claims.get("uid")
-    return services_update_comment.update_comment(db, comment_id, updated_data, user_id)
+    return await services_update_comment.update_comment(db, comment_id, updated_data, user_id)
 
 
 @client_router.delete("/comments/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_comment_endpoint(
+async def delete_comment_endpoint(
         comment_id: str,
         jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
         db: AsyncSession = Depends(get_db_async),
 ):
     user_id = jwt_claims.get("uid")
-    return services_delete_comment.delete_comment(db, comment_id, user_id)
+    return await services_delete_comment.delete_comment(db, comment_id, user_id)
 
 
 @client_router.post("/comments/{comment_id}/like", response_model=ProjectCommentResponse)
-def like_comment_endpoint(comment_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
-                          db: AsyncSession = Depends(get_db_async)):
+async def like_comment_endpoint(comment_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
+                                db: AsyncSession = Depends(get_db_async)):
     user_id = jwt_claims.get("uid")
-    return services_like_comment.like_comment(db, comment_id, user_id)
+    return await services_like_comment.like_comment(db, comment_id, user_id)
 
 
 @client_router.post("/comments/{comment_id}/dislike", response_model=ProjectCommentResponse)
-def dislike_comment_endpoint(comment_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
-                             db: AsyncSession = Depends(get_db_async)):
+async def dislike_comment_endpoint(comment_id: str, jwt_claims: Dict[Any, Any] = Depends(get_jwt_claims),
+                                   db: AsyncSession = Depends(get_db_async)):
     user_id = jwt_claims.get("uid")
-    return services_dislike_comment.dislike_comment(db, comment_id, user_id)
+    return await services_dislike_comment.dislike_comment(db, comment_id, user_id)
@@ -4,6 +4,8 @@ from sqlalchemy.future import select
 from app.models import Group, GroupUsers
 from fastapi import HTTPException, status
 
+from app.services.game_view_cache import bump_game_versions, get_game_ids_showing_group
+
 
 async def assign_manager_to_group_by_email(
         group_id: str, manager_email: str, organisation_id: str, db: AsyncSession
@@ -37,7 +39,9 @@ async def assign_manager_to_group_by_email(
             user_email=manager_email
         )
         db.add(new_manager)
+        game_ids = await get_game_ids_showing_group(db, group.id)
         await db.commit()
+        await bump_game_versions(game_ids)
 
         return {
             "message": "Manager successfully assigned to the group",
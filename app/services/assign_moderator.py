@@ -1,11 +1,13 @@
 import logging
 import re
 from sqlalchemy.ext.asyncio import AsyncSession
-from fastapi import HTTPException, status, BackgroundTasks
+from fastapi import HTTPException, status
 from app.repositories.get_game_by_id import get_game_by_id
 from app.services.get_session import get_session
 from app.services.organisation_service import get_organisation_service
-from app.services.send_invite_moderator import send_invite_moderator
+from app.services.email_outbox import enqueue_email, notify_email_outbox, RECIPIENT_MODERATOR
+from app.services.email_templates import TEMPLATE_INVITE_MODERATOR
+from app.services.game_view_cache import bump_game_versions
 from app.services.user_service import get_user_service
 
 # Set up logging
@@ -29,8 +31,7 @@ def is_valid_email(email: str) -> bool:
     return bool(re.match(EMAIL_REGEX, email))
 
 
-async def assign_moderator(db: AsyncSession, session_id: str, org_id: str, email: str,
-                           background_tasks: BackgroundTasks) -> dict[str, str]:
+async def assign_moderator(db: AsyncSession, session_id: str, org_id: str, email: str) -> dict[str, str]:
     try:
 
         session = await get_session(db, session_id, org_id)
@@ -77,22 +78,28 @@ async def assign_moderator(db: AsyncSession, session_id: str, org_id: str, email
         session.super_game_master_mail = email
 
         game_link = f"{organisation_name}.gamitool.com/game/{project.id}/moderator/invite?token={session.id}"
-        # Queue email sending in the background
-        background_tasks.add_task(
-            send_invite_moderator,
-            db=db,
-            session=session,
+        # Queue email sending through the outbox, committed with the session
+        enqueue_email(
+            db,
+            recipient_type=RECIPIENT_MODERATOR,
+            recipient_id=session.id,
             email=email,
-            fullname=user.full_name if user else "",
-            organisation_name=organisation_name,
-            game_name=game_name,
-            game_link=game_link,
+            subject=f"{organisation_name} - Invitation to play {game_name}",
+            template=TEMPLATE_INVITE_MODERATOR,
+            context={
+                "[Recipient Name]": user.full_name if user and user.full_name else "",
+                "[OrgName]": organisation_name,
+                "[Your CTA URL]": game_link,
+                "[GAME_NAME]": game_name,
+            },
         )
 
         # Persist players to the database
         try:
             db.add(session)
             await db.commit()
+            notify_email_outbox()
+            await bump_game_versions([session.project_id])
             logger.info(f"Moderator has been assigned the session.")
         except Exception as db_error:
             logger.error(f"Database error while saving players: {db_error}")
@@ -1,10 +1,11 @@
 import logging
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.models import ArenaSession
 from app.payloads.request import SessionConfigRequest
 from app.services.get_session import get_session
+from app.services.game_view_cache import bump_game_versions
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ def validate_session_config(session: SessionConfigRequest):
     return True
 
 
-def config_session(db: Session, session_id: str, session: SessionConfigRequest, org_id: str):
+async def config_session(db: AsyncSession, session_id: str, session: SessionConfigRequest, org_id: str):
     """
     Configures the session with the given settings.
 
@@ -52,7 +53,7 @@ def config_session(db: Session, session_id: str, session: SessionConfigRequest,
         validate_session_config(session)
 
         # Retrieve the session to be updated
-        db_session = get_session(db, session_id, org_id)
+        db_session = await get_session(db, session_id, org_id)
         if not db_session:
             logger.warning(f"Session {session_id} not found for organization {org_id}.")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
@@ -66,14 +67,18 @@ def config_session(db: Session, session_id: str, session: SessionConfigRequest,
         db_session.view_access = session.view_access
 
         # Commit the changes to the database
-        db.commit()
+        await db.commit()
+        await bump_game_versions([db_session.project_id])
 
         logger.info(f"Session {session_id} successfully configured for organization {org_id}.")
         return db_session
 
+    except HTTPException:
+        raise
+
     except SQLAlchemyError as e:
         logger.error(f"Database error while configuring session {session_id}: {str(e)}")
-        db.rollback()  # Rollback in case of an error
+        await db.rollback()  # Rollback in case of an error
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                             detail="Error updating session configuration.")
 
@@ -1,4 +1,4 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models import ProjectComment
 import logging
@@ -7,8 +7,8 @@ from app.payloads.response.ProjectCommentResponse import ProjectCommentResponse
 logger = logging.getLogger(__name__)
 
 
-def create_comment(
-        db: Session,
+async def create_comment(
+        db: AsyncSession,
         project_id: str,
         user_id: str,
         comment_text: str
@@ -32,14 +32,14 @@ def create_comment(
 
         # Persist the new comment
         db.add(new_comment)
-        db.commit()
-        db.refresh(new_comment)
+        await db.commit()
+        await db.refresh(new_comment, ["likes"])
 
         logger.info(
             f"Comment created with ID {new_comment.id} for project {project_id} by user {user_id}.")
 
         # Convert to response schema
-        return ProjectCommentResponse.from_orm(new_comment)
+        return ProjectCommentResponse.model_validate(new_comment, from_attributes=True)
 
     except Exception as e:
         logger.error(f"Error creating comment for project {project_id} by user {user_id}: {e}")
@@ -2,19 +2,20 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models
 from app.payloads.request.GroupCreateRequest import GroupCreateRequest
+from app.services.game_view_cache import bump_game_versions
 from app.services.invite_managers import invite_managers
 
 
 # ---------------- Group CRUD Operations ----------------
 
-async def create_group(db: AsyncSession, group_request: GroupCreateRequest, org_id: str, background_tasks):
+async def create_group(db: AsyncSession, group_request: GroupCreateRequest, org_id: str):
     """
     Creates a new group and associates it with projects and managers.
     """
     try:
         db_group = await _create_group(db, group_request.name, org_id)
         await _associate_projects_with_group(db, db_group.id, group_request.project_ids)
-        await invite_managers(db, db_group, group_request.managers, background_tasks)
+        await invite_managers(db, db_group, group_request.managers)
         return db_group
     except Exception as e:
         await db.rollback()  # Ensure to rollback in case of any error during the transaction
@@ -34,11 +35,13 @@ async def _create_group(db: AsyncSession, group_name: str, org_id: str) -> model
 
 async def _associate_projects_with_group(db: AsyncSession, group_id: str, project_ids: list):
     """
-    Associates a list of project IDs with a group.
+    Associates a list of project IDs with a group, a project repeated in the list is associated once.
     """
+    project_ids = list(dict.fromkeys(str(project_id) for project_id in project_ids))
     project_group_mappings = [
         models.GroupProjects(group_id=group_id, project_id=project_id)
         for project_id in project_ids
     ]
     db.add_all(project_group_mappings)
     await db.commit()
+    await bump_game_versions(project_ids)
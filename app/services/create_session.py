@@ -5,6 +5,7 @@ from app.payloads.request.SessionCreateRequest import SessionCreateRequest
 from app.repositories.get_arena_by_id import get_arena_by_id
 from app.repositories.get_game_by_id import get_game_by_id
 from app.services.game_db_service import get_game_db_service
+from app.services.game_view_cache import bump_game_versions
 
 
 async def get_project(db: AsyncSession, org_id: str, project_id: str) -> Project:
@@ -40,6 +41,7 @@ async def create_arena_session(
     )
     db.add(arena_session)
     await db.commit()
+    await bump_game_versions([arena_session.project_id])
     await db.refresh(arena_session)
     return arena_session
 
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class DataLoader:
+    """
+    Batch and memoize the lookups of one repository for the lifetime of a request.
+
+    Keys requested in the same event-loop tick are resolved together with a
+    single call to `batch_load`, usually one IN query, and every result is
+    kept so later lookups of the same key do not reach the database again.
+    Keys `batch_load` does not return resolve to `default`.
+    """
+
+    def __init__(self, batch_load: Callable[[list], Awaitable[dict]], default: Callable[[], Any] = lambda: None):
+        self.batch_load = batch_load
+        self.default = default
+        self._results: dict[Hashable, asyncio.Future] = dict()
+        self._queue: list[tuple[Hashable, asyncio.Future]] = []
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load(self, key: Hashable) -> Any:
+        """
+        Resolve one key together with the other lookups of the current tick.
+        """
+        # Shielded as the result is shared with the other callers of the key
+        return await asyncio.shield(self._future(key))
+
+    async def load_many(self, keys: list) -> list:
+        """
+        Resolve many keys with at most one batch call.
+
+        :param keys: The keys to resolve
+        :return: The value of every key, in the order of the keys
+        """
+        return list(await asyncio.gather(*(asyncio.shield(self._future(key)) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any):
+        """
+        Remember a value already loaded by another query.
+        """
+        if key not in self._results:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._results[key] = future
+
+    def clear(self, key: Hashable | None = None):
+        """
+        Forget one key, or every key, after the rows behind it changed.
+        """
+        if key is None:
+            self._results.clear()
+        else:
+            self._results.pop(key, None)
+
+    def _future(self, key: Hashable) -> asyncio.Future:
+        future = self._results.get(key)
+        if future is not None:
+            return future
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._results[key] = future
+        if not self._queue:
+            loop.call_soon(self._dispatch)
+        self._queue.append((key, future))
+        return future
+
+    def _dispatch(self):
+        queue, self._queue = self._queue, []
+        task = asyncio.get_running_loop().create_task(self._flush(queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, queue: list[tuple[Hashable, asyncio.Future]]):
+        keys = [key for key, _ in queue]
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for key, future in queue:
+                # Failed keys are fetched again on their next lookup
+                if self._results.get(key) is future:
+                    del self._results[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in queue:
+            if not future.done():
+                future.set_result(values[key] if key in values else self.default())
@@ -1,15 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from uuid import UUID
 from app.models import Arena, GroupArenas
+from app.repositories.get_game_ids_by_arena import get_game_ids_by_arena
+from app.services.game_view_cache import bump_game_versions
 
 
-def get_arena_by_id(db: Session, arena_id: UUID, org_id: str) -> Arena:
+async def get_arena_by_id(db: AsyncSession, arena_id: UUID, org_id: str) -> Arena:
     """
     Retrieve an Arena by its ID and organization code.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         arena_id (UUID): The ID of the Arena to retrieve.
         org_id (str): The organization code to validate.
 
@@ -19,29 +22,32 @@ def get_arena_by_id(db: Session, arena_id: UUID, org_id: str) -> Arena:
     Raises:
         ValueError: If the Arena is not found.
     """
-    arena = db.query(Arena).filter(Arena.id == str(arena_id), Arena.organisation_code == org_id).first()
+    result = await db.execute(
+        select(Arena).where(Arena.id == str(arena_id), Arena.organisation_code == org_id)
+    )
+    arena = result.scalar()
     if not arena:
         raise ValueError(f"Arena with ID {arena_id} not found in organization {org_id}")
     return arena
 
 
-def delete_arena_associations(db: Session, arena_id: UUID):
+async def delete_arena_associations(db: AsyncSession, arena_id: UUID):
     """
     Delete all associations of an Arena with groups.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         arena_id (UUID): The ID of the Arena whose associations should be deleted.
     """
-    db.query(GroupArenas).filter(GroupArenas.arena_id == str(arena_id)).delete()
+    await db.execute(delete(GroupArenas).where(GroupArenas.arena_id == str(arena_id)))
 
 
-def delete_arena(db: Session, arena_id: UUID, org_id: str) -> dict:
+async def delete_arena(db: AsyncSession, arena_id: UUID, org_id: str) -> dict:
     """
     Delete an Arena and its associated group links.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         arena_id (UUID): The ID of the Arena to delete.
         org_id (str): The organization code to validate.
 
@@ -54,18 +60,20 @@ def delete_arena(db: Session, arena_id: UUID, org_id: str) -> dict:
     """
     try:
         # Retrieve the Arena
-        arena = get_arena_by_id(db, arena_id, org_id)
+        arena = await get_arena_by_id(db, arena_id, org_id)
 
         # Delete associated records
-        delete_arena_associations(db, arena_id)
+        await delete_arena_associations(db, arena_id)
 
         # Delete the Arena itself
-        db.delete(arena)
-        db.commit()
+        game_ids = await get_game_ids_by_arena(arena.id, db)
+        await db.delete(arena)
+        await db.commit()
+        await bump_game_versions(game_ids)
         return {"message": f"Arena {arena_id} deleted successfully"}
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise e
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise RuntimeError(f"Database error occurred while deleting Arena {arena_id}: {e}")
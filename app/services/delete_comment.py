@@ -1,15 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models import ProjectComment
+from app.repositories.get_comment_by_id import get_comment_by_id as fetch_comment_by_id
 import logging
 
 logger = logging.getLogger(__name__)
 
-def get_comment_by_id(db: Session, comment_id: str) -> ProjectComment:
+async def get_comment_by_id(db: AsyncSession, comment_id: str) -> ProjectComment:
     """
     Retrieve a comment by ID.
     """
-    comment = db.query(ProjectComment).filter(ProjectComment.id == comment_id).first()
+    comment = await fetch_comment_by_id(comment_id, db)
     if not comment:
         logger.error(f"Comment with ID {comment_id} not found.")
         raise HTTPException(
@@ -29,19 +30,19 @@ def is_comment_owner(comment: ProjectComment, user_id: str) -> None:
             detail="You are not authorized to delete this comment.",
         )
 
-def delete_comment(db: Session, comment_id: str, user_id: str) -> dict:
+async def delete_comment(db: AsyncSession, comment_id: str, user_id: str) -> dict:
     """
     Delete a comment by ID if the user is the owner.
     """
     # Retrieve the comment
-    comment = get_comment_by_id(db, comment_id)
+    comment = await get_comment_by_id(db, comment_id)
 
     # Check ownership
     is_comment_owner(comment, user_id)
 
     # Delete the comment
-    db.delete(comment)
-    db.commit()
+    await db.delete(comment)
+    await db.commit()
 
     logger.info(f"Comment with ID {comment_id} deleted by user {user_id}.")
     return {"detail": "Comment successfully deleted."}
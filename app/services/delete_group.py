@@ -1,14 +1,19 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.models import Group, GroupArenas, GroupUsers, GroupProjects
+from app.repositories.get_game_ids_by_group import get_game_ids_by_group
+from app.repositories.get_manager_id_by_group import get_manager_id_by_group
+from app.services.game_view_cache import bump_game_versions, get_game_ids_showing_group
+from app.services.user_game_membership import sync_user_game_memberships
 
 
-async def delete_group(db: Session, group_id: str, org_id: str) -> bool:
+async def delete_group(db: AsyncSession, group_id: str, org_id: str) -> bool:
     """
     Deletes a group from the system and removes its associations with arenas.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         group_id (str): The ID of the group to delete.
         org_id (str): The organization ID associated with the group.
 
@@ -22,20 +27,30 @@ async def delete_group(db: Session, group_id: str, org_id: str) -> bool:
 
     try:
         # Validate existence of the group
-        group = db.query(Group).filter(Group.id == group_id, Group.organisation_code == org_id).first()
+        result = await db.execute(
+            select(Group).where(Group.id == group_id, Group.organisation_code == org_id)
+        )
+        group = result.scalar()
         if not group:
             raise ValueError(f"Group with ID {group_id} not found in organization {org_id}.")
 
+        # Managers and games of the group, their memberships are recomputed without it
+        manager_ids = await get_manager_id_by_group(group_id, db)
+        game_ids = await get_game_ids_by_group(group_id, db)
+        shown_in_game_ids = await get_game_ids_showing_group(db, group_id)
+
         # Remove associations from GroupArenas table
-        remove_associations_from_group(db, group_id)
+        await remove_associations_from_group(db, group_id)
 
-        # Delete the group
-        db.delete(group)
-        db.commit()
+        # Delete the group together with its associations
+        await db.delete(group)
+        await sync_user_game_memberships(db, manager_ids, game_ids)
+        await db.commit()
+        await bump_game_versions(shown_in_game_ids)
         return True
 
     except SQLAlchemyError as e:
-        db.rollback()  # Rollback transaction in case of an error
+        await db.rollback()  # Rollback transaction in case of an error
         raise RuntimeError("Database error occurred while deleting the group.") from e
     except ValueError as ve:
         raise ve
@@ -43,26 +58,26 @@ async def delete_group(db: Session, group_id: str, org_id: str) -> bool:
         raise RuntimeError("An unexpected error occurred while deleting the group.") from ex
 
 
-def remove_associations_from_group(db: Session, group_id: str):
+async def remove_associations_from_group(db: AsyncSession, group_id: str):
     """
-    Removes all arena associations related to the group before deletion.
+    Removes all arena associations related to the group before deletion, the caller commits.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         group_id (str): The ID of the group to remove associations from.
     """
 
     try:
         # Find and delete all associations of this group in the GroupArenas table
-        db.query(GroupUsers).filter(GroupUsers.group_id == group_id).delete(synchronize_session=False)
-        db.query(GroupProjects).filter(GroupProjects.group_id == group_id).delete(
-            synchronize_session=False)
-        db.query(GroupArenas).filter(GroupArenas.group_id == group_id).delete(
-            synchronize_session=False)
-        db.commit()
+        await db.execute(
+            delete(GroupUsers).where(GroupUsers.group_id == group_id).execution_options(synchronize_session=False))
+        await db.execute(
+            delete(GroupProjects).where(GroupProjects.group_id == group_id).execution_options(synchronize_session=False))
+        await db.execute(
+            delete(GroupArenas).where(GroupArenas.group_id == group_id).execution_options(synchronize_session=False))
 
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
         raise RuntimeError(f"Error removing associations for group {group_id}.") from e
 
 
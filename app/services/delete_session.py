@@ -7,6 +7,8 @@ from fastapi import HTTPException, status
 from app.exceptions.NoResultFoundError import NoResultFoundError
 from app.repositories.get_players_by_session import get_players_by_session
 from app.services.get_session import get_session
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -45,8 +47,13 @@ async def delete_session(db: AsyncSession, session_id: str, org_id: str):
         await db.delete(db_session)
         logger.info(f"Deleted session {session_id}.")
 
+        # Drop the memberships the players and the moderator had through this session only
+        await sync_user_game_memberships(
+            db, [player.user_id for player in players] + [db_session.super_game_master_id], [db_session.project_id])
+
         # Commit changes to the database
         await db.commit()
+        await bump_game_versions([db_session.project_id])
         logger.info(f"Session {session_id} deleted successfully.")
 
         return {"message": "Session deleted successfully"}
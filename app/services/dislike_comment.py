@@ -1,15 +1,17 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
-from app.models import ProjectComment, CommentLike
+from app.models import ProjectComment
+from app.repositories.get_comment_by_id import get_comment_by_id
+from app.repositories.get_comment_like import get_comment_like
 
 
-def dislike_comment(db: Session, comment_id: str, user_id: str) -> ProjectComment:
+async def dislike_comment(db: AsyncSession, comment_id: str, user_id: str) -> ProjectComment:
     """
     Remove a user's like from a comment.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         comment_id (str): The ID of the comment.
         user_id (str): The ID of the user.
 
@@ -20,10 +22,7 @@ def dislike_comment(db: Session, comment_id: str, user_id: str) -> ProjectCommen
         HTTPException: If the like does not exist or if an error occurs during processing.
     """
     # Retrieve the existing like for the comment by the user
-    comment_like = db.query(CommentLike).filter(
-        CommentLike.comment_id == comment_id,
-        CommentLike.user_id == user_id
-    ).first()
+    comment_like = await get_comment_like(comment_id, user_id, db)
 
     # Raise an exception if the like does not exist
     if not comment_like:
@@ -32,18 +31,16 @@ def dislike_comment(db: Session, comment_id: str, user_id: str) -> ProjectCommen
             detail="Like not found for the specified comment and user",
         )
 
-    # Retrieve the associated comment
-    comment = comment_like.comment
-
     try:
         # Remove the like from the database
-        db.delete(comment_like)
-        db.commit()
+        await db.delete(comment_like)
+        await db.commit()
     except Exception as e:
-        db.rollback()  # Ensure the transaction is rolled back on error
+        await db.rollback()  # Ensure the transaction is rolled back on error
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while disliking the comment",
         ) from e
 
-    return comment
+    # Retrieve the associated comment with its remaining likes
+    return await get_comment_by_id(comment_id, db)
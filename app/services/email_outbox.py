@@ -0,0 +1,103 @@
+import asyncio
+import json
+import uuid
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import EmailStatus
+from app.models import EmailOutbox
+
+# The row whose email_status follows the delivery of the email
+RECIPIENT_PLAYER = "player"
+RECIPIENT_MANAGER = "manager"
+RECIPIENT_MODERATOR = "moderator"
+
+# Rows per multi-row INSERT of enqueue_emails
+OUTBOX_INSERT_CHUNK_SIZE = 1000
+
+# Set when new emails are committed so the worker does not wait for its next poll
+_outbox_event = asyncio.Event()
+
+
+def outbox_email(
+        recipient_type: str,
+        recipient_id: str | None,
+        email: str,
+        subject: str,
+        template: str,
+        context: dict[str, str],
+) -> dict:
+    """
+    Build the values of an outbox email.
+
+    Args:
+        recipient_type (str): player, manager or moderator.
+        recipient_id (str | None): The row whose email_status follows the delivery.
+        email (str): The recipient's email address.
+        subject (str): The subject of the email.
+        template (str): The template file name in app/mails.
+        context (dict[str, str]): The value of each placeholder of the template.
+
+    Returns:
+        dict: The column values of the outbox row.
+    """
+    return {
+        "id": str(uuid.uuid4()),
+        "recipient_type": recipient_type,
+        "recipient_id": recipient_id,
+        "email": email,
+        "subject": subject,
+        "template": template,
+        "context": json.dumps(context),
+        "status": EmailStatus.PENDING,
+        "attempts": 0,
+    }
+
+
+def enqueue_email(db: AsyncSession, **values) -> EmailOutbox:
+    """
+    Add an email to the outbox in the current transaction.
+
+    The email is only delivered once the caller commits, together with the
+    rows it belongs to. Takes the arguments of outbox_email.
+
+    Args:
+        db (AsyncSession): The database session of the caller.
+
+    Returns:
+        EmailOutbox: The outbox entry.
+    """
+    outbox = EmailOutbox(**outbox_email(**values))
+    db.add(outbox)
+    return outbox
+
+
+async def enqueue_emails(db: AsyncSession, emails: list[dict]):
+    """
+    Add many emails built with outbox_email to the outbox with multi-row INSERTs in the current transaction.
+
+    Args:
+        db (AsyncSession): The database session of the caller.
+        emails (list[dict]): The outbox rows.
+    """
+    for i in range(0, len(emails), OUTBOX_INSERT_CHUNK_SIZE):
+        await db.execute(insert(EmailOutbox), emails[i:i + OUTBOX_INSERT_CHUNK_SIZE])
+
+
+def notify_email_outbox():
+    """
+    Wake the delivery worker up after new emails were committed.
+    """
+    _outbox_event.set()
+
+
+async def wait_email_outbox(timeout: float):
+    """
+    Wait for new emails or for the timeout, whichever comes first.
+    """
+    try:
+        await asyncio.wait_for(_outbox_event.wait(), timeout)
+    except asyncio.TimeoutError:
+        pass
+    _outbox_event.clear()
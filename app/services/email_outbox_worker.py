@@ -0,0 +1,175 @@
+import asyncio
+import json
+import logging
+import os
+import uuid
+from datetime import datetime, timedelta
+
+from app.database import AsyncSessionLocal
+from app.enums import EmailStatus
+from app.models import EmailOutbox
+from app.repositories.claim_pending_emails import claim_pending_emails
+from app.repositories.update_email_statuses import update_email_statuses
+from app.services.email_outbox import RECIPIENT_PLAYER, RECIPIENT_MODERATOR, notify_email_outbox, \
+    wait_email_outbox
+from app.services.email_templates import render_template
+from app.services.mailer import Mailer
+
+logger = logging.getLogger(__name__)
+
+EMAIL_OUTBOX_WORKER_ENABLED = os.getenv("EMAIL_OUTBOX_WORKER_ENABLED", "true").lower() in ("1", "true", "yes")
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", "100"))
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.getenv("EMAIL_OUTBOX_POLL_INTERVAL", "5"))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", "5"))
+# Delay before the first retry, doubled after every failed attempt
+EMAIL_OUTBOX_RETRY_DELAY = float(os.getenv("EMAIL_OUTBOX_RETRY_DELAY", "30"))
+# Claimed rows are released after this delay when the worker stops in the middle of a batch
+EMAIL_OUTBOX_LEASE = float(os.getenv("EMAIL_OUTBOX_LEASE", "300"))
+
+
+class EmailOutboxWorker:
+    """
+    Deliver the emails of the outbox.
+
+    Batches of due emails are claimed, handed to the mailer in one go and
+    their results written back with one UPDATE per table. Failed sends are
+    retried with an exponential backoff until EMAIL_OUTBOX_MAX_ATTEMPTS is
+    reached.
+    """
+
+    def __init__(self, session_factory=AsyncSessionLocal, mailer: Mailer | None = None):
+        self.session_factory = session_factory
+        self.mailer = mailer or Mailer()
+        self._task: asyncio.Task | None = None
+        self._stopping = False
+
+    def start(self):
+        self._stopping = False
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self._stopping = True
+        notify_email_outbox()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.mailer.aclose()
+
+    async def run(self):
+        while not self._stopping:
+            try:
+                claimed = await self.drain_once()
+            except Exception as e:
+                logger.exception(f"Email outbox batch failed: {str(e)}")
+                claimed = 0
+
+            # A full batch means more emails are probably waiting
+            if claimed < EMAIL_OUTBOX_BATCH_SIZE:
+                await wait_email_outbox(EMAIL_OUTBOX_POLL_INTERVAL)
+
+    async def drain_once(self) -> int:
+        """
+        Deliver one batch of due emails.
+
+        :return: The number of claimed emails
+        """
+        async with self.session_factory() as db:
+            emails = await claim_pending_emails(
+                str(uuid.uuid4()),
+                EMAIL_OUTBOX_BATCH_SIZE,
+                datetime.now() + timedelta(seconds=EMAIL_OUTBOX_LEASE),
+                db
+            )
+            if not emails:
+                return 0
+
+            errors = await self._deliver(emails)
+            await update_email_statuses(*self._collect_statuses(emails, errors), db)
+            return len(emails)
+
+    async def _deliver(self, emails: list[EmailOutbox]) -> list[str | None]:
+        """
+        Render the emails and send them to the mailer.
+
+        :return: None for every email the mailer accepted, the error otherwise
+        """
+        errors: list[str | None] = [None] * len(emails)
+        messages = []
+        for i, email in enumerate(emails):
+            try:
+                messages.append((i, {
+                    "html_body": render_template(email.template, json.loads(email.context or "{}")),
+                    "is_html": True,
+                    "subject": email.subject,
+                    "to": email.email,
+                    "from": 'GAMITOOL'
+                }))
+            except Exception as general_err:
+                logger.critical(f"Unexpected error for {email.email}: {general_err}")
+                errors[i] = str(general_err)
+
+        # The outbox id lets the mailer drop the resend of an email delivered before a restart
+        results = await self.mailer.send_many([(emails[i].id, payload) for i, payload in messages])
+        for (i, _), error in zip(messages, results):
+            errors[i] = error
+        return errors
+
+    @staticmethod
+    def _collect_statuses(emails: list[EmailOutbox], errors: list[str | None]):
+        """
+        Turn the delivery results into the outbox, player and session updates.
+        """
+        now = datetime.now()
+        outbox, players, sessions = [], [], []
+        for email, error in zip(emails, errors):
+            attempts = email.attempts + 1
+            if error is None:
+                status = EmailStatus.SENT
+            elif attempts >= EMAIL_OUTBOX_MAX_ATTEMPTS:
+                status = EmailStatus.FAILED
+            else:
+                status = EmailStatus.PENDING
+
+            outbox.append({
+                "id": email.id,
+                "status": status,
+                "attempts": attempts,
+                "next_attempt_at": now + timedelta(seconds=EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)),
+                "last_error": error,
+                "sent_at": now if error is None else None,
+                "claim_token": None,
+                "locked_until": None,
+            })
+
+            # The recipient only changes once the email is sent or given up on
+            if status == EmailStatus.PENDING or email.recipient_id is None:
+                continue
+            if email.recipient_type == RECIPIENT_PLAYER:
+                players.append({"id": email.recipient_id, "email_status": status})
+            elif email.recipient_type == RECIPIENT_MODERATOR:
+                sessions.append({"id": email.recipient_id, "email_status": status})
+
+        return outbox, players, sessions
+
+
+_worker: EmailOutboxWorker | None = None
+
+
+def start_email_outbox_worker():
+    """
+    Start the delivery worker of this process, called from the application lifespan.
+    """
+    global _worker
+    if EMAIL_OUTBOX_WORKER_ENABLED and _worker is None:
+        _worker = EmailOutboxWorker()
+        _worker.start()
+
+
+async def stop_email_outbox_worker():
+    """
+    Stop the delivery worker once its current batch is written.
+    """
+    global _worker
+    if _worker is not None:
+        await _worker.stop()
+        _worker = None
@@ -0,0 +1,86 @@
+import os
+import re
+
+# Invitation templates shipped in app/mails
+MAILS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "mails")
+
+TEMPLATE_INVITE_PLAYER = "template_invite_player.html"
+TEMPLATE_INVITE_GAME_MASTER = "template_invite_game_master.html"
+TEMPLATE_INVITE_MANAGER = "template_invite_manager.html"
+TEMPLATE_INVITE_MODERATOR = "template_invite_moderator.html"
+
+TEMPLATES = (TEMPLATE_INVITE_PLAYER, TEMPLATE_INVITE_GAME_MASTER, TEMPLATE_INVITE_MANAGER, TEMPLATE_INVITE_MODERATOR)
+
+_WHITESPACE = re.compile(r"\s+")
+# Placeholders look like [OrgName], bracketed text without a value is kept as is
+_PLACEHOLDER = re.compile(r"(\[[^\[\]<>]+\])")
+
+
+class CompiledTemplate:
+    """
+    An email template minified once and split around its placeholders.
+
+    Rendering joins the static parts with the placeholder values in a single
+    pass, instead of one replace per placeholder and a whitespace collapse
+    over the whole document for every recipient.
+    """
+
+    def __init__(self, content: str):
+        # Odd indexes hold the placeholders, even ones the static HTML between them
+        self.parts = _PLACEHOLDER.split(_WHITESPACE.sub(" ", content).strip())
+
+    def render(self, context: dict[str, str]) -> str:
+        parts = self.parts[:]
+        for i in range(1, len(parts), 2):
+            value = context.get(parts[i])
+            if value is not None:
+                parts[i] = _WHITESPACE.sub(" ", value) if value else value
+        rendered = "".join(parts)
+
+        # Empty values or values padded with spaces may leave double spaces at their borders
+        if "  " in rendered or rendered[:1] == " " or rendered[-1:] == " ":
+            rendered = _WHITESPACE.sub(" ", rendered).strip()
+        return rendered
+
+
+_compiled: dict[str, CompiledTemplate] = dict()
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Return the compiled form of a template, read from app/mails on first use.
+
+    Args:
+        template (str): The template file name in app/mails.
+
+    Returns:
+        CompiledTemplate: The compiled template.
+    """
+    compiled = _compiled.get(template)
+    if compiled is None:
+        with open(os.path.join(MAILS_PATH, template), "r", encoding="utf-8") as file:
+            compiled = CompiledTemplate(file.read())
+        _compiled[template] = compiled
+    return compiled
+
+
+def load_templates():
+    """
+    Compile every invitation template, called once at startup.
+    """
+    for template in TEMPLATES:
+        compile_template(template)
+
+
+def render_template(template: str, context: dict[str, str]) -> str:
+    """
+    Render an email template.
+
+    Args:
+        template (str): The template file name in app/mails.
+        context (dict[str, str]): The value of each placeholder, e.g. {"[OrgName]": "Acme"}.
+
+    Returns:
+        str: The rendered HTML on a single line.
+    """
+    return compile_template(template).render(context)
@@ -2,7 +2,7 @@ from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 import logging
 
 from app.models import ProjectFavorite
@@ -30,7 +30,8 @@ async def favorite_project(
         Optional[models.ProjectFavorite]: The created favorite project record
 
     Raises:
-        HTTPException: If the project is already favorited and raise_on_duplicate is True
+        HTTPException: If the project is already favorited and raise_on_duplicate is True, 409 when
+            a concurrent request favorited it between the check and the insert
         SQLAlchemyError: For database-related errors
     """
     try:
@@ -74,6 +75,15 @@ async def favorite_project(
         logger.error(f"Invalid input: {ve}")
         raise HTTPException(status_code=422, detail=str(ve))
 
+    except IntegrityError as integrity_err:
+        # A concurrent request favorited the project between the check and the insert
+        await db.rollback()
+        logger.warning(f"Concurrent favorite attempt: User {user_id}, Project {project_id}: {integrity_err}")
+        raise HTTPException(
+            status_code=409,
+            detail="Project is already in favorites"
+        )
+
     except SQLAlchemyError as sa_err:
         # Rollback the transaction on database errors
         await db.rollback()
@@ -4,17 +4,9 @@ from sqlalchemy.orm import Session
 
 import logging
 
-from app.repositories.get_arena_by_id import get_arena_by_id
-from app.repositories.get_game_by_id import get_game_by_id
+from app.repositories.get_game_counters_by_games import get_game_counters_by_games
 from app.repositories.get_group_by_arena import get_group_by_arena
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_group import get_manager_id_by_group
-from app.repositories.get_player_id_by_session import get_player_id_by_session
-from app.repositories.get_players_by_session import get_players_by_session
 from app.repositories.get_session_by_game import get_session_by_game
-from app.repositories.get_total_groups_by_game import get_total_groups_by_game
-from app.repositories.get_total_managers_by_game import get_total_managers_by_game
-from app.repositories.get_total_players_by_game import get_total_players_by_game
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +14,7 @@ from app.models import ArenaSessionPlayers, ArenaSession, Project, Arena
 from app.payloads.response.GameViewClientResponse import GameViewClientResponse, GameViewArenaResponse, \
     GameViewSessionResponse, GameViewSessionPlayerClientResponse, GameViewGroupResponse, GameViewManagerResponse
 from app.payloads.response.UserResponse import UserResponse
+from app.services.request_loaders import get_loaders
 from app.services.user_service import get_user_service
 
 
@@ -56,11 +49,11 @@ async def _get_managers_by_group(db_session: AsyncSession, group_id: str, users:
         List[GroupByGameUserClientResponse]: A list of enriched manager responses.
     """
     managers = []
-    db_managers = await get_manager_by_group(group_id, db_session)
+    db_managers = await get_loaders(db_session).managers_by_group.load(group_id)
 
     for db_manager in db_managers:
         user_details = users.get(db_manager.user_id, None)
-        manager_response = GameViewManagerResponse(
+        manager_response = GameViewManagerResponse.model_construct(
             id=str(db_manager.id) if db_manager.id else None,
             user_id=user_details.get("user_id") if user_details else db_manager.user_id,
             user_email=user_details.get("user_email") if user_details else db_manager.user_email,
@@ -87,7 +80,7 @@ async def _process_session_players(players: Sequence[ArenaSessionPlayers], users
 
     for player in players:
         user_detail = users.get(player.user_id, None)
-        processed_player = GameViewSessionPlayerClientResponse(
+        processed_player = GameViewSessionPlayerClientResponse.model_construct(
             user_id=user_detail.get('user_id') if user_detail else str(player.user_id),
             email=user_detail.get('user_email') if user_detail else player.user_email,
             first_name=user_detail.get('first_name') if user_detail else None,
@@ -115,14 +108,14 @@ async def _create_session_response(
     Returns:
         GameViewSessionResponse: Structured session response
     """
-    players = await get_players_by_session(session.id, db)
-    ids = await get_player_id_by_session(session.id, db)
+    players = await get_loaders(db).players_by_session.load(session.id)
+    ids = list(dict.fromkeys(player.user_id for player in players))
     if len(ids) != 0:
         users = await get_user_service().get_users_by_id(list(ids))
     else:
         users = list()
 
-    return GameViewSessionResponse(
+    return GameViewSessionResponse.model_construct(
         id=session.id,
         period_type=session.period_type,
         db_index=session.db_index,
@@ -152,8 +145,14 @@ async def _build_game_arenas(
     """
     arena_map: Dict[str, GameViewArenaResponse] = {}
     arena_sessions = await get_session_by_game(game.id, db)
+
+    # Arenas and players of every session are loaded together and then read from the loaders
+    loaders = get_loaders(db)
+    await loaders.arenas.load_many(list({arena_session.arena_id for arena_session in arena_sessions}))
+    await loaders.players_by_session.load_many([arena_session.id for arena_session in arena_sessions])
+
     for arena_session in arena_sessions:
-        db_arena = await get_arena_by_id(arena_session.arena_id, db)
+        db_arena = await loaders.arenas.load(arena_session.arena_id)
         if not db_arena:
             continue
         arena_id = db_arena.id
@@ -191,16 +190,16 @@ async def gameView(
         HTTPException: If game is not found
     """
     # Fetch game with optimized query
-    game = await get_game_by_id(game_id, org_id, db)
+    game = await get_loaders(db).games.load((game_id, org_id))
 
     # Compute aggregated metrics
-    metrics = await _compute_game_metrics(db, game_id)
+    metrics = await _compute_game_metrics(db, game)
 
     # Build arenas with sessions and groups (pass db session)
     arenas = await _build_game_arenas(db, game)
 
     # Prepare response
-    return GameViewClientResponse(
+    return GameViewClientResponse.model_construct(
         id=game.id,
         game_name=game.name,
         client_name=game.client_name,
@@ -220,22 +219,23 @@ async def gameView(
 
 async def _compute_game_metrics(
         db: AsyncSession,
-        game_id: str
+        game: Project
 ) -> Dict[str, int]:
     """
-    Compute game-level metrics efficiently.
+    Compute game-level metrics in a single grouped query.
 
     Args:
         db (Session): Database session
-        game_id (int): Game identifier
+        game (Project): Game instance
 
     Returns:
         Dict[str, int]: Game metrics
     """
+    counters = (await get_game_counters_by_games(db, [(game.module_game_id, game.id)]))[game.id]
     return {
-        'total_managers': (await get_total_managers_by_game(game_id, db)),
-        'total_groups': (await get_total_groups_by_game(game_id, db)),
-        'total_players': (await get_total_players_by_game(game_id, db)),
+        'total_managers': counters['total_managers'],
+        'total_groups': counters['total_groups'],
+        'total_players': counters['total_players'],
     }
 
 
@@ -251,7 +251,7 @@ async def _create_arena_response(
     Returns:
         GameViewArenaResponse: Structured arena response
     """
-    arena_resp = GameViewArenaResponse(
+    arena_resp = GameViewArenaResponse.model_construct(
         id=arena.id,
         name=arena.name,
         sessions=[]
@@ -259,12 +259,13 @@ async def _create_arena_response(
     group = await get_group_by_arena(arena.id, db)
     if group:
         first_group = group
-        manager_ids = await get_manager_id_by_group(first_group.id, db)
+        db_managers = await get_loaders(db).managers_by_group.load(first_group.id)
+        manager_ids = list(dict.fromkeys(db_manager.user_id for db_manager in db_managers))
         if len(manager_ids) > 0:
             users = await get_user_service().get_users_by_id(list(manager_ids))
         else:
             users = list()
-        arena_resp.group = GameViewGroupResponse(
+        arena_resp.group = GameViewGroupResponse.model_construct(
             id=first_group.id,
             name=first_group.name,
             managers=await _get_managers_by_group(db, first_group.id, users)
@@ -0,0 +1,249 @@
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Hashable, Iterable
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.responses import dump_json, to_jsonable
+from app.repositories.get_game_ids_by_group import get_game_ids_by_group
+from app.repositories.get_game_ids_by_group_arenas import get_game_ids_by_group_arenas
+
+logger = logging.getLogger(__name__)
+
+# Game view cache settings, "memory" keeps the views in the worker, "none" disables the cache
+GAME_VIEW_CACHE_BACKEND = os.getenv("GAME_VIEW_CACHE_BACKEND", "memory")
+GAME_VIEW_CACHE_MAX_ENTRIES = int(os.getenv("GAME_VIEW_CACHE_MAX_ENTRIES", "5000"))
+GAME_VIEW_CACHE_MAX_BYTES = int(os.getenv("GAME_VIEW_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+# Seconds a view is served at most, bounds what a bump made by another replica or a
+# profile change in the user service can leave stale with the in-process backend
+GAME_VIEW_CACHE_TTL = float(os.getenv("GAME_VIEW_CACHE_TTL", "60"))
+
+
+class GameViewCacheBackend:
+    """
+    Storage of the serialized game views and of the version of every game.
+
+    The version of a game is part of the key of its views, so bumping it
+    drops every view of the game at once. A backend shared by the replicas
+    (e.g. Redis) implements the same methods.
+    """
+
+    async def get_version(self, game_id: str) -> int:
+        raise NotImplementedError
+
+    async def bump_versions(self, game_ids: Iterable[str]):
+        raise NotImplementedError
+
+    async def get(self, key: Hashable) -> bytes | None:
+        raise NotImplementedError
+
+    async def set(self, key: Hashable, body: bytes):
+        raise NotImplementedError
+
+    async def clear(self):
+        raise NotImplementedError
+
+    def stats(self) -> dict[str, int | str]:
+        raise NotImplementedError
+
+
+class NoGameViewCache(GameViewCacheBackend):
+    """
+    Backend keeping nothing, every view is built.
+    """
+
+    def __init__(self):
+        self.misses = 0
+
+    async def get_version(self, game_id: str) -> int:
+        return 0
+
+    async def bump_versions(self, game_ids: Iterable[str]):
+        pass
+
+    async def get(self, key: Hashable) -> bytes | None:
+        self.misses += 1
+        return None
+
+    async def set(self, key: Hashable, body: bytes):
+        pass
+
+    async def clear(self):
+        pass
+
+    def stats(self) -> dict[str, int | str]:
+        return {"backend": "none", "hits": 0, "misses": self.misses}
+
+
+class InMemoryGameViewCache(GameViewCacheBackend):
+    """
+    In-process LRU of the game views, bounded by a number of entries and by
+    the total size of the bodies, with a time to live per entry.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = dict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get_version(self, game_id: str) -> int:
+        return self._versions.get(game_id, 0)
+
+    async def bump_versions(self, game_ids: Iterable[str]):
+        for game_id in set(game_ids):
+            self._versions[game_id] = self._versions.get(game_id, 0) + 1
+
+    async def get(self, key: Hashable) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    async def set(self, key: Hashable, body: bytes):
+        if self.max_entries <= 0 or len(body) > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl, body)
+        self.size_bytes += len(body)
+        while len(self._entries) > self.max_entries or self.size_bytes > self.max_bytes:
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted)
+            self.evictions += 1
+
+    async def clear(self):
+        self._entries.clear()
+        self.size_bytes = 0
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "backend": "memory",
+            "size": len(self._entries),
+            "max_size": self.max_entries,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _remove(self, key: Hashable):
+        _, body = self._entries.pop(key)
+        self.size_bytes -= len(body)
+
+
+def _create_game_view_cache() -> GameViewCacheBackend:
+    if GAME_VIEW_CACHE_BACKEND == "none":
+        return NoGameViewCache()
+    if GAME_VIEW_CACHE_BACKEND != "memory":
+        logger.warning(f"Unknown GAME_VIEW_CACHE_BACKEND {GAME_VIEW_CACHE_BACKEND}, using the in-process cache")
+    return InMemoryGameViewCache(GAME_VIEW_CACHE_MAX_ENTRIES, GAME_VIEW_CACHE_MAX_BYTES, GAME_VIEW_CACHE_TTL)
+
+
+_game_view_cache: GameViewCacheBackend | None = None
+
+
+def get_game_view_cache() -> GameViewCacheBackend:
+    """
+    Return the game view cache of the worker, created on first use from GAME_VIEW_CACHE_BACKEND.
+    """
+    global _game_view_cache
+    if _game_view_cache is None:
+        _game_view_cache = _create_game_view_cache()
+    return _game_view_cache
+
+
+def set_game_view_cache(cache: GameViewCacheBackend | None):
+    """
+    Plug another game view cache backend, None goes back to the configured one.
+    """
+    global _game_view_cache
+    _game_view_cache = cache
+
+
+def serialize_game_view(view: BaseModel) -> bytes:
+    """
+    Serialize a game view to the body FastAPI would send for it.
+    """
+    return dump_json(to_jsonable(view))
+
+
+async def get_cached_game_view(
+        game_id: str,
+        org_id: str,
+        role: str,
+        user_id: str | None,
+        build: Callable[[], Awaitable[BaseModel]],
+        refresh: bool = False,
+) -> bytes:
+    """
+    Return the serialized game view from the cache, building and storing it on a miss.
+
+    The version is read before the view is built, so a write committed
+    while it is built leaves it under a version that is already outdated.
+    The view must be built from the primary: the writes bump the version once
+    committed, a replica lagging behind them would store its stale view under
+    the new version.
+
+    Args:
+        game_id (str): The game of the view.
+        org_id (str): The organization of the game.
+        role (str): The role the view is built for.
+        user_id (str | None): The user the view is built for, None when every user of the role sees the same view.
+        build (Callable[[], Awaitable[BaseModel]]): Builds the view on a miss, from the primary.
+        refresh (bool): Build and store the view even when it is cached, for the clients reading their own
+            writes, which another replica of the service may have made without bumping the version here.
+
+    Returns:
+        bytes: The JSON body of the view.
+    """
+    cache = get_game_view_cache()
+    key = (game_id, await cache.get_version(game_id), org_id, role, user_id)
+    body = None if refresh else await cache.get(key)
+    if body is None:
+        body = serialize_game_view(await build())
+        await cache.set(key, body)
+    return body
+
+
+async def bump_game_versions(game_ids: Iterable[str | None]):
+    """
+    Drop the cached views of games, called by the writes changing what their views show once they are committed.
+
+    Args:
+        game_ids (Iterable[str | None]): The games whose views changed, None ids are ignored.
+    """
+    game_ids = {str(game_id) for game_id in game_ids if game_id}
+    if game_ids:
+        await get_game_view_cache().bump_versions(game_ids)
+
+
+async def get_game_ids_showing_group(db: AsyncSession, group_id: str) -> set[str]:
+    """
+    Return the games whose views show a group: the games of the group, counted in
+    their totals, and the games played in its arenas, whose views list its managers.
+
+    Args:
+        db (AsyncSession): The database session.
+        group_id (str): The ID of the group.
+
+    Returns:
+        set[str]: The IDs of the games.
+    """
+    return set(await get_game_ids_by_group(group_id, db)) | set(await get_game_ids_by_group_arenas(group_id, db))
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from typing import List, Optional, Dict, Sequence
 
 from fastapi import HTTPException
@@ -12,29 +13,30 @@ from app.payloads.response.GameViewModeratorClientResponse import GameViewModera
     ModeratorModuleLinkResponse
 from app.payloads.response.GameViewPlayerClientResponse import GameViewPlayerClientResponse, \
     GameViewPlayerSessionResponse, GameViewPlayerArenaResponse, PlayerModuleLinkResponse
-from app.repositories.get_arena_by_id import get_arena_by_id
-from app.repositories.get_game_by_id import get_game_by_id
-from app.repositories.get_group_by_arena import get_group_by_arena
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_group import get_manager_id_by_group
-from app.repositories.get_module_by_game_by_type import get_module_by_game_by_type
-from app.repositories.get_player_id_by_game_by_user import get_player_id_by_game_by_user
-from app.repositories.get_player_id_by_session import get_player_id_by_session
+from app.repositories.get_arenas_by_ids import get_arenas_by_ids
+from app.repositories.get_groups_by_arenas import get_groups_by_arenas
+from app.repositories.get_managers_by_groups import get_managers_by_groups
 from app.repositories.get_player_for_session_by_email import get_player_for_session_by_email
-from app.repositories.get_players_by_session import get_players_by_session
+from app.repositories.get_players_by_sessions import get_players_by_sessions
 from app.repositories.get_session_by_game import get_session_by_game
 from app.repositories.get_session_by_game_for_moderator import get_session_by_game_for_moderator
 from app.repositories.get_session_by_game_for_player import get_session_by_game_for_player
-from app.repositories.get_user_role_in_game_by_org import get_user_role_in_game_by_org
+from app.repositories.get_user_roles_in_games_by_org import get_user_roles_in_games_by_org
 
 logger = logging.getLogger(__name__)
 
-from app.models import ArenaSessionPlayers, ArenaSession, Project, Arena
+from app.models import ArenaSessionPlayers, ArenaSession, Project, Arena, Group, GroupUsers
 from app.payloads.response.GameViewClientResponse import GameViewClientResponse, GameViewArenaResponse, \
     GameViewSessionResponse, GameViewSessionPlayerClientResponse, GameViewGroupResponse, GameViewManagerResponse
 from app.payloads.response.UserResponse import UserResponse
+from app.services.request_loaders import get_loaders
 from app.services.user_service import get_user_service
 
+# Module types shown to each role of a session
+_MODERATOR_MODULES = (ModuleForType.ALL, ModuleForType.MODERATOR, ModuleForType.GAMEMASTER)
+_GAME_MASTER_MODULES = (ModuleForType.ALL, ModuleForType.GAMEMASTER)
+_PLAYER_MODULES = (ModuleForType.ALL, ModuleForType.PLAYER)
+
 
 def _parse_tags(tags: Optional[str]) -> List[str]:
     """
@@ -53,25 +55,23 @@ def _parse_tags(tags: Optional[str]) -> List[str]:
     ]
 
 
-async def _get_managers_by_group(db_session: AsyncSession, group_id: str, users: dict[str, UserResponse]) -> List[
+def _map_group_managers(db_managers: Sequence[GroupUsers], users: dict[str, UserResponse]) -> List[
     GameViewManagerResponse]:
     """
-    Fetches and enriches managers for a given group with user details.
+    Enriches the preloaded managers of a group with user details.
 
     Args:
-        db_session: The database group object.
-        group_id: The group
+        db_managers: The managers of the group
         users: The users managers
 
     Returns:
-        List[GroupByGameUserClientResponse]: A list of enriched manager responses.
+        List[GameViewManagerResponse]: A list of enriched manager responses.
     """
     managers = []
-    db_managers = await get_manager_by_group(group_id, db_session)
 
     for db_manager in db_managers:
         user_details = users.get(db_manager.user_id, None)
-        manager_response = GameViewManagerResponse(
+        manager_response = GameViewManagerResponse.model_construct(
             id=str(db_manager.id) if db_manager.id else None,
             user_id=user_details.get("user_id") if user_details else db_manager.user_id,
             user_email=user_details.get("user_email") if user_details else db_manager.user_email,
@@ -100,7 +100,7 @@ async def _process_session_players(players: Sequence[ArenaSessionPlayers], users
 
     for player in players:
         user_detail = users.get(player.user_id, None)
-        processed_player = GameViewSessionPlayerClientResponse(
+        processed_player = GameViewSessionPlayerClientResponse.model_construct(
             user_id=user_detail.get('user_id') if user_detail else str(player.user_id),
             email=user_detail.get('user_email') if user_detail else player.user_email,
             first_name=user_detail.get('first_name') if user_detail else None,
@@ -131,7 +131,7 @@ async def _process_session_players_for_moderator(players: Sequence[ArenaSessionP
 
     for player in players:
         user_detail = users.get(player.user_id, None)
-        processed_player = GameViewModeratorSessionPlayerClientResponse(
+        processed_player = GameViewModeratorSessionPlayerClientResponse.model_construct(
             user_id=user_detail.get('user_id') if user_detail else str(player.user_id),
             email=user_detail.get('user_email') if user_detail else player.user_email,
             first_name=user_detail.get('first_name') if user_detail else None,
@@ -145,28 +145,23 @@ async def _process_session_players_for_moderator(players: Sequence[ArenaSessionP
     return processed_players
 
 
-# Update the session response creation in the previous function
 async def _create_session_response(
         session: ArenaSession,
-        db: AsyncSession
+        players: Sequence[ArenaSessionPlayers],
+        users: dict[str, UserResponse]
 ) -> GameViewSessionResponse:
     """
-    Create detailed session response with processed players.
+    Create detailed session response with its preloaded players.
 
     Args:
         session (ArenaSession): Arena session
-        db (Session): Database session
+        players (Sequence[ArenaSessionPlayers]): Players of the session
+        users (dict[str, UserResponse]): User details keyed by user id
 
     Returns:
         GameViewSessionResponse: Structured session response
     """
-    players = await get_players_by_session(session.id, db)
-    ids = await get_player_id_by_session(session.id, db)
-    if len(ids) != 0:
-        users = await get_user_service().get_users_by_id(list(ids))
-    else:
-        users = list()
-    return GameViewSessionResponse(
+    return GameViewSessionResponse.model_construct(
         id=session.id,
         period_type=session.period_type,
         start_time=session.start_time,
@@ -182,6 +177,7 @@ async def _create_session_response(
 # Update the session response creation in the previous function
 async def _create_session_for_moderator_response(
         session: ArenaSession,
+        users: dict[str, UserResponse],
         db: AsyncSession
 ) -> GameViewModeratorSessionResponse:
     """
@@ -189,24 +185,19 @@ async def _create_session_for_moderator_response(
 
     Args:
         session (ArenaSession): Arena session
+        users (dict[str, UserResponse]): User details keyed by user id
         db (Session): Database session
 
     Returns:
         GameViewSessionResponse: Structured session response
     """
-
-    db_arena = await get_arena_by_id(session.arena_id, db)
-
-    players = await get_players_by_session(session.id, db)
-    ids = await get_player_id_by_session(session.id, db)
-    if len(ids) != 0:
-        users = await get_user_service().get_users_by_id(list(ids))
-    else:
-        users = list()
-    links = await get_module_by_game_by_type(session.project_id, [ModuleForType.ALL, ModuleForType.MODERATOR, ModuleForType.GAMEMASTER], db)
-    return GameViewModeratorSessionResponse(
+    loaders = get_loaders(db)
+    db_arena = await loaders.arenas.load(session.arena_id)
+    players = await loaders.players_by_session.load(session.id)
+    links = await loaders.modules_by_game_by_type.load((session.project_id, _MODERATOR_MODULES))
+    return GameViewModeratorSessionResponse.model_construct(
         id=session.id,
-        arena=GameViewModeratorArenaResponse(
+        arena=GameViewModeratorArenaResponse.model_construct(
             id=db_arena.id,
             name=db_arena.name,
         ) if db_arena else None,
@@ -217,7 +208,7 @@ async def _create_session_for_moderator_response(
         access_status=session.access_status,
         session_status=session.session_status,
         view_access=session.view_access,
-        links=(ModeratorModuleLinkResponse(name=link.name, template_code=link.template_code) for link in links),
+        links=[ModeratorModuleLinkResponse.model_construct(name=link.name, template_code=link.template_code) for link in links],
         players=await _process_session_players_for_moderator(players, users)
     )
 
@@ -239,25 +230,26 @@ async def _create_session_for_player_response(
         GameViewSessionResponse: Structured session response
     """
 
-    db_arena = await get_arena_by_id(session.arena_id, db)
+    loaders = get_loaders(db)
+    db_arena = await loaders.arenas.load(session.arena_id)
     player = await get_player_for_session_by_email(session.id, user_id, db)
 
     if player.is_game_master:
-        links = await get_module_by_game_by_type(session.project_id, [ModuleForType.ALL, ModuleForType.GAMEMASTER], db)
+        links = await loaders.modules_by_game_by_type.load((session.project_id, _GAME_MASTER_MODULES))
     else:
-        links = await get_module_by_game_by_type(session.project_id, [ModuleForType.ALL, ModuleForType.PLAYER], db)
+        links = await loaders.modules_by_game_by_type.load((session.project_id, _PLAYER_MODULES))
 
-    return GameViewPlayerSessionResponse(
+    return GameViewPlayerSessionResponse.model_construct(
         id=session.id,
         period_type=session.period_type,
         start_time=session.start_time,
         end_time=session.end_time,
         db_index=session.db_index,
-        arena=GameViewPlayerArenaResponse(
+        arena=GameViewPlayerArenaResponse.model_construct(
             id=db_arena.id,
             name=db_arena.name,
         ) if db_arena else None,
-        links=(PlayerModuleLinkResponse(name=link.name, template_code=link.template_code) for link in links),
+        links=[PlayerModuleLinkResponse.model_construct(name=link.name, template_code=link.template_code) for link in links],
         access_status=session.access_status,
         session_status=session.session_status,
         view_access=session.view_access,
@@ -265,7 +257,6 @@ async def _create_session_for_player_response(
     )
 
 
-# Modify the _build_game_arenas function to pass db session
 async def _build_game_arenas(user_id: str,
                              db: AsyncSession,
                              game: Project
@@ -273,6 +264,11 @@ async def _build_game_arenas(user_id: str,
     """
     Build detailed arenas with sessions and groups.
 
+    Sessions, arenas, groups, managers and players are loaded with one
+    set-based query each and every user id is resolved with a single
+    user-service call, so the number of round trips does not depend on
+    the number of arenas or sessions of the game.
+
     Args:
         db (Session): Database session
         game (Project): Game instance
@@ -280,24 +276,48 @@ async def _build_game_arenas(user_id: str,
     Returns:
         List[GameViewArenaResponse]: Detailed arena responses
     """
-    arena_map: Dict[str, GameViewArenaResponse] = {}
     arena_sessions = await get_session_by_game(game.id, db)
-    # arena_sessions = await get_session_by_game_for_player(game.id, `user_email`, db)
-    # arena_sessions = await get_session_by_game_for_moderator(game.id, user_email, db)
+    if not arena_sessions:
+        return []
+
+    arena_ids = list(dict.fromkeys(arena_session.arena_id for arena_session in arena_sessions))
+    db_arenas = {db_arena.id: db_arena for db_arena in await get_arenas_by_ids(arena_ids, db)}
+    arena_sessions = [arena_session for arena_session in arena_sessions if arena_session.arena_id in db_arenas]
+
+    # Only the first group of an arena is shown, as in get_group_by_arena
+    db_groups: Dict[str, Group] = {}
+    for arena_id, db_group in await get_groups_by_arenas(list(db_arenas), db):
+        db_groups.setdefault(arena_id, db_group)
+
+    group_ids = list({db_group.id for db_group in db_groups.values()})
+    managers_by_group: Dict[str, List[GroupUsers]] = defaultdict(list)
+    for db_manager in await get_managers_by_groups(group_ids, db):
+        managers_by_group[db_manager.group_id].append(db_manager)
+
+    session_ids = [arena_session.id for arena_session in arena_sessions]
+    players_by_session: Dict[str, List[ArenaSessionPlayers]] = defaultdict(list)
+    for player in await get_players_by_sessions(session_ids, db):
+        players_by_session[player.session_id].append(player)
+
+    user_ids = {db_manager.user_id for db_managers in managers_by_group.values() for db_manager in db_managers}
+    user_ids.update(player.user_id for players in players_by_session.values() for player in players)
+    user_ids.discard(None)
+    if len(user_ids) != 0:
+        users = await get_user_service().get_users_by_id(list(user_ids))
+    else:
+        users = dict()
 
+    arena_map: Dict[str, GameViewArenaResponse] = {}
     for arena_session in arena_sessions:
-        db_arena = await get_arena_by_id(arena_session.arena_id, db)
-        if not db_arena:
-            continue
+        db_arena = db_arenas[arena_session.arena_id]
         arena_id = db_arena.id
 
         # Initialize arena response if not exists
         if arena_id not in arena_map:
-            arena_map[arena_id] = await _create_arena_response(db_arena, db)
+            arena_map[arena_id] = _create_arena_response(db_arena, db_groups.get(arena_id), managers_by_group, users)
 
-        # Add session to arena (pass db session)
         arena_map[arena_id].sessions.append(
-            await _create_session_response(arena_session, db)
+            await _create_session_response(arena_session, players_by_session[arena_session.id], users)
         )
 
     return list(arena_map.values())
@@ -320,10 +340,24 @@ async def _build_game_sessions_for_moderator(user_id: str,
     """
 
     arena_sessions = await get_session_by_game_for_moderator(game.id, user_id, db)
+
+    # Arenas, players and links of every session are loaded together and then read from the loaders
+    loaders = get_loaders(db)
+    await loaders.arenas.load_many(list({arena_session.arena_id for arena_session in arena_sessions}))
+    players_by_session = await loaders.players_by_session.load_many([arena_session.id for arena_session in arena_sessions])
+    await loaders.modules_by_game_by_type.load((game.id, _MODERATOR_MODULES))
+
+    user_ids = {player.user_id for players in players_by_session for player in players}
+    user_ids.discard(None)
+    if len(user_ids) != 0:
+        users = await get_user_service().get_users_by_id(list(user_ids))
+    else:
+        users = dict()
+
     sessions = []
     for arena_session in arena_sessions:
         sessions.append(
-            await _create_session_for_moderator_response(arena_session, db)
+            await _create_session_for_moderator_response(arena_session, users, db)
         )
 
     return sessions
@@ -346,6 +380,7 @@ async def _build_game_sessions_for_player(user_id: str,
     """
 
     arena_sessions = await get_session_by_game_for_player(game.id, user_id, db)
+    await get_loaders(db).arenas.load_many(list({arena_session.arena_id for arena_session in arena_sessions}))
     sessions = []
     for arena_session in arena_sessions:
         sessions.append(
@@ -362,13 +397,13 @@ async def _build_game_view_manager(
         user_id: str,
         game_id: str):
     # Fetch game with optimized query
-    game = await get_game_by_id(game_id, org_id, db)
+    game = await get_loaders(db).games.load((game_id, org_id))
 
     # Build arenas with sessions and groups (pass db session)
     arenas = await _build_game_arenas(user_id, db, game)
 
     # Prepare response
-    return GameViewClientResponse(
+    return GameViewClientResponse.model_construct(
         id=game.id,
         role='manager',
         game_name=game.name,
@@ -390,13 +425,13 @@ async def _build_game_view_moderator(
         user_id: str,
         game_id: str):
     # Fetch game with optimized query
-    game = await get_game_by_id(game_id, org_id, db)
+    game = await get_loaders(db).games.load((game_id, org_id))
 
     # Build arenas with sessions and groups (pass db session)
     sessions = await _build_game_sessions_for_moderator(user_id, db, game)
 
     # Prepare response
-    return GameViewModeratorClientResponse(
+    return GameViewModeratorClientResponse.model_construct(
         id=game.id,
         game_name=game.name,
         client_name=game.client_name,
@@ -415,18 +450,15 @@ async def _build_game_view_player(
         db: AsyncSession,
         org_id: str,
         user_id: str,
-        game_id: str) -> GameViewPlayerClientResponse:
-    game = await get_game_by_id(game_id, org_id, db)
+        game_id: str,
+        role: str = "player") -> GameViewPlayerClientResponse:
+    game = await get_loaders(db).games.load((game_id, org_id))
 
     # Build arenas with sessions and groups (pass db session)
     sessions = await _build_game_sessions_for_player(user_id, db, game)
-    role = "player"
-    player = await get_player_id_by_game_by_user(game_id, user_id, db)
-    if player is not None and player.is_game_master:
-        role = "game_master"
 
     # Prepare response
-    return GameViewPlayerClientResponse(
+    return GameViewPlayerClientResponse.model_construct(
         id=game.id,
         role=role,
         game_name=game.name,
@@ -442,11 +474,40 @@ async def _build_game_view_player(
     )
 
 
-async def gameViewUser(
+async def get_game_view_role(
         db: AsyncSession,
         org_id: str,
         user_id: str,
         game_id: str
+) -> str:
+    """
+    Determines which game view a user gets.
+
+    Args:
+        db (AsyncSession): Database session
+        org_id (str): Organization identifier
+        user_id (str): User identifier
+        game_id (str): Game identifier
+
+    Returns:
+        str: 'manager', 'game_master', 'player' or 'moderator'
+
+    Raises:
+        HTTPException: If the user has no role in the game
+    """
+    roles = await get_user_roles_in_games_by_org(user_id, {game_id: org_id}, db)
+    role = roles[game_id]
+    if role is None:
+        raise HTTPException(status_code=400, detail="You dont have access for this game")
+    return role
+
+
+async def gameViewUser(
+        db: AsyncSession,
+        org_id: str,
+        user_id: str,
+        game_id: str,
+        role: str | None = None
 ) -> GameViewClientResponse | GameViewModeratorClientResponse | GameViewPlayerClientResponse:
     """
     Retrieve comprehensive game view with optional detailed information.
@@ -456,6 +517,7 @@ async def gameViewUser(
         org_id (str): Organization identifier
         user_id (str): Email identifier
         game_id (str): Game identifier
+        role (str | None): The role of the user from get_game_view_role, looked up when None
 
     Returns:
         GameViewClientResponse: Comprehensive game view
@@ -464,47 +526,45 @@ async def gameViewUser(
         HTTPException: If game is not found
     """
 
-    role = await get_user_role_in_game_by_org(org_id, user_id, game_id, db)
     if role is None:
-        raise HTTPException(status_code=400, detail="You dont have access for this game")
+        role = await get_game_view_role(db, org_id, user_id, game_id)
 
     if role == 'manager':
         return await _build_game_view_manager(db, org_id, user_id, game_id)
-    elif role == 'player':
-        return await _build_game_view_player(db, org_id, user_id, game_id)
+    elif role in ('player', 'game_master'):
+        return await _build_game_view_player(db, org_id, user_id, game_id, role)
     else:
         return await _build_game_view_moderator(db, org_id, user_id, game_id)
 
 
-async def _create_arena_response(
-        arena: Arena, db: AsyncSession
+def _create_arena_response(
+        arena: Arena,
+        group: Optional[Group],
+        managers_by_group: Dict[str, List[GroupUsers]],
+        users: dict[str, UserResponse]
 ) -> GameViewArenaResponse:
     """
     Create arena response with group details.
 
-    Args:``
+    Args:
         arena (models.Arena): Arena instance
+        group (Optional[models.Group]): First group of the arena
+        managers_by_group (Dict[str, List[GroupUsers]]): Managers keyed by group id
+        users (dict[str, UserResponse]): User details keyed by user id
 
     Returns:
         GameViewArenaResponse: Structured arena response
     """
-    arena_resp = GameViewArenaResponse(
+    arena_resp = GameViewArenaResponse.model_construct(
         id=arena.id,
         name=arena.name,
         sessions=[]
     )
-    group = await get_group_by_arena(arena.id, db)
     if group:
-        first_group = group
-        manager_ids = await get_manager_id_by_group(first_group.id, db)
-        if len(manager_ids) > 0:
-            users = await get_user_service().get_users_by_id(list(manager_ids))
-        else:
-            users = list()
-        arena_resp.group = GameViewGroupResponse(
-            id=first_group.id,
-            name=first_group.name,
-            managers=await _get_managers_by_group(db, first_group.id, users)
+        arena_resp.group = GameViewGroupResponse.model_construct(
+            id=group.id,
+            name=group.name,
+            managers=_map_group_managers(managers_by_group.get(group.id, []), users)
         )
 
     return arena_resp
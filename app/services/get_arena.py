@@ -1,6 +1,7 @@
 import logging
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Arena
 from fastapi import HTTPException, status
 
@@ -24,12 +25,12 @@ def validate_arena_id(arena_id: UUID):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid arena ID format.")
 
 
-def get_arena(db: Session, arena_id: UUID, org_id: str) -> Arena:
+async def get_arena(db: AsyncSession, arena_id: UUID, org_id: str) -> Arena:
     """
     Fetches a specific Arena by ID and organization ID.
 
     Args:
-        db (Session): The database session.
+        db (AsyncSession): The database session.
         arena_id (UUID): The ID of the arena to fetch.
         org_id (str): The organization code associated with the arena.
 
@@ -44,7 +45,10 @@ def get_arena(db: Session, arena_id: UUID, org_id: str) -> Arena:
         validate_arena_id(arena_id)
 
         # Query the arena from the database
-        arena = db.query(Arena).filter(Arena.id == str(arena_id), Arena.organisation_code == org_id).first()
+        result = await db.execute(
+            select(Arena).where(Arena.id == str(arena_id), Arena.organisation_code == org_id)
+        )
+        arena = result.scalar()
 
         if not arena:
             logger.warning(f"Arena with ID {arena_id} not found for organization {org_id}.")
@@ -53,6 +57,9 @@ def get_arena(db: Session, arena_id: UUID, org_id: str) -> Arena:
         logger.info(f"Arena with ID {arena_id} retrieved successfully for organization {org_id}.")
         return arena
 
+    except HTTPException:
+        raise
+
     except Exception as e:
         logger.error(f"Error retrieving arena with ID {arena_id} for organization {org_id}: {str(e)}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error retrieving arena.")
@@ -1,93 +1,119 @@
-from typing import List
+from collections import defaultdict
+from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Arena
+from app.models import Arena, Group, GroupUsers
+from app.pagination import Page, page_of
 from sqlalchemy.exc import NoResultFound
 
 from app.payloads.response.ArenaListResponseTop import ArenaListResponseTop, ArenaListGroupClientResponse, \
     ArenaListGroupUserClientResponse, ArenaMembers
+from app.payloads.response.UserResponse import UserResponse
 from app.repositories.get_arenas_by_org import get_arenas_by_org
-from app.repositories.get_groups_by_arena import get_groups_by_arena
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_group import get_manager_id_by_group
-from app.repositories.get_player_id_by_session import get_player_id_by_session
-from app.repositories.get_players_by_session import get_players_by_session
-from app.repositories.get_session_by_arena import get_session_by_arena
+from app.repositories.get_groups_by_arenas import get_groups_by_arenas
+from app.repositories.get_managers_by_groups import get_managers_by_groups
+from app.repositories.get_players_by_arenas import get_players_by_arenas
 from app.services.user_service import get_user_service
 
 
-async def get_arenas(db: AsyncSession, org_id: str) -> List[ArenaListResponseTop]:
+async def get_arenas(db: AsyncSession, org_id: str, limit: Optional[int] = None,
+                     cursor: Optional[str] = None) -> Page[ArenaListResponseTop]:
     """
     Retrieve a list of arenas for a specific organization.
 
+    Groups, managers and distinct players of every arena of the page are
+    loaded with one query each, and user ids are deduplicated across the
+    page before a single user-service call.
+
     Args:
         db (AsyncSession): Database AsyncSession.
         org_id (str): Organization ID.
+        limit (Optional[int]): Maximum number of arenas to return, all of them when None.
+        cursor (Optional[str]): ID of the last arena of the previous page.
 
     Returns:
-        List[ArenaListResponseTop]: List of arenas with associated groups and players.
+        Page[ArenaListResponseTop]: The arenas of the page with associated groups and players.
     """
     # Fetch arenas for the given organization
 
-    arenas_data = await get_arenas_by_org(org_id, db)
+    arenas_data = await get_arenas_by_org(org_id, db, limit=limit, cursor=cursor)
     if not arenas_data:
+        if cursor is not None:
+            return Page(items=[])
         raise NoResultFound(f"No arenas found for organization {org_id}")
 
+    arena_ids = [db_arena.id for db_arena in arenas_data]
+
+    groups_by_arena = defaultdict(list)
+    for arena_id, db_group in await get_groups_by_arenas(arena_ids, db):
+        groups_by_arena[arena_id].append(db_group)
+
+    group_ids = list({db_group.id for db_groups in groups_by_arena.values() for db_group in db_groups})
+    managers_by_group = defaultdict(list)
+    for manager in await get_managers_by_groups(group_ids, db):
+        managers_by_group[manager.group_id].append(manager)
+
+    players_by_arena = defaultdict(list)
+    for arena_id, user_id, user_email, user_name in await get_players_by_arenas(arena_ids, db):
+        players_by_arena[arena_id].append((user_id, user_email, user_name))
+
+    ids = {manager.user_id for managers in managers_by_group.values() for manager in managers}
+    ids.update(player[0] for players in players_by_arena.values() for player in players)
+    ids.discard(None)
+    if len(ids) != 0:
+        users = await get_user_service().get_users_by_id(list(ids))
+    else:
+        users = {}
+
     arenas = []
     for db_arena in arenas_data:
-        arena = ArenaListResponseTop(
+        arena = ArenaListResponseTop.model_construct(
             id=db_arena.id,
             name=db_arena.name,
             groups=[],
             players=[]
         )
-        arena_groups = await get_groups_by_arena(db_arena.id, db)
-        arena_players = await get_session_by_arena(db_arena.id, db)
         # Process groups and players
-        arena.groups = await process_groups(arena_groups, db)
-        arena.players = await process_players(arena_players, db)
+        arena.groups = process_groups(groups_by_arena[db_arena.id], managers_by_group, users)
+        arena.players = process_players(players_by_arena[db_arena.id], users)
 
         arenas.append(arena)
 
-    return arenas
+    return page_of(arenas, arenas_data, limit, lambda db_arena: db_arena.id)
 
 
-async def process_groups(db_groups, db: AsyncSession) -> List[ArenaListGroupClientResponse]:
+def process_groups(db_groups: List[Group], managers_by_group: dict[str, List[GroupUsers]],
+                   users: dict[str, UserResponse]) -> List[ArenaListGroupClientResponse]:
     """
     Process the groups for an arena.
 
     Args:
         db_groups: Groups associated with an arena.
-        db: Database.
+        managers_by_group: Managers keyed by group id.
+        users: User details keyed by user id.
 
     Returns:
         List[ArenaListGroupClientResponse]: List of processed group data.
     """
     groups = []
     for db_group in db_groups:
-        group = ArenaListGroupClientResponse(
+        group = ArenaListGroupClientResponse.model_construct(
             id=db_group.id,
             name=db_group.name,
             managers=[]
         )
-        managers = await get_manager_by_group(db_group.id, db)
-        ids = await get_manager_id_by_group(db_group.id, db)
-        if len(ids) != 0:
-            users = await get_user_service().get_users_by_id(list(ids))
-        else:
-            users = {}
-
-        for manager in managers:
+
+        for manager in managers_by_group.get(db_group.id, []):
             user_details = users.get(manager.user_id, None)
 
             if user_details:
-                group.managers.append(ArenaListGroupUserClientResponse(
+                group.managers.append(ArenaListGroupUserClientResponse.model_construct(
                     **dict(user_details),
                     picture=manager.picture
                 ))
             else:
-                group.managers.append(ArenaListGroupUserClientResponse(
+                group.managers.append(ArenaListGroupUserClientResponse.model_construct(
                     user_id=manager.user_id,
                     user_email=manager.user_email,
                     user_name=f"{manager.first_name} {manager.last_name}",
@@ -98,43 +124,36 @@ async def process_groups(db_groups, db: AsyncSession) -> List[ArenaListGroupClie
     return groups
 
 
-async def process_players(db_sessions, db: AsyncSession) -> List[ArenaMembers]:
+def process_players(arena_players: List[tuple[str, str, str]],
+                    users: dict[str, UserResponse]) -> List[ArenaMembers]:
     """
     Process the players for an arena.
 
     Args:
-        db_sessions: Sessions associated with an arena.
-        db: Database
+        arena_players: (user_id, user_email, user_name) of the players of every session of an arena.
+        users: User details keyed by user id.
 
     Returns:
         List[ArenaMembers]: List of processed player data.
     """
     dict_players = set()
     players = []
-    for session in db_sessions:
-        session_players = await get_players_by_session(session.id, db)
-        player_ids = await get_player_id_by_session(session.id, db)
-        if len(player_ids) != 0:
-            users = await get_user_service().get_users_by_id(list(player_ids))
-        else:
-            users = {}
-
-        for player in session_players:
-            if player.user_id not in dict_players:
-                dict_players.add(player.user_id)
-                user_details = users.get(player.user_id, None)
-
-                if user_details:
-                    players.append(ArenaMembers(
-                        **dict(user_details),
-                        picture=None
-                    ))
-                else:
-                    players.append(ArenaMembers(
-                        user_id=player.user_id,
-                        user_email=player.user_email,
-                        user_name=player.user_name,
-                        picture=None
-                    ))
+    for user_id, user_email, user_name in arena_players:
+        if user_id not in dict_players:
+            dict_players.add(user_id)
+            user_details = users.get(user_id, None)
+
+            if user_details:
+                players.append(ArenaMembers.model_construct(
+                    **dict(user_details),
+                    picture=None
+                ))
+            else:
+                players.append(ArenaMembers.model_construct(
+                    user_id=user_id,
+                    user_email=user_email,
+                    user_name=user_name,
+                    picture=None
+                ))
 
     return players
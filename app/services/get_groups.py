@@ -1,17 +1,17 @@
 import logging
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Group, Arena, GroupUsers
+from app.pagination import Page, page_of
 from app.payloads.response.GroupListClientResponse import ProjectResponse, GroupListUserClientResponse, \
     GroupListArenaClientResponse, GroupListClientResponse
 from app.payloads.response.UserResponse import UserResponse
 from app.repositories.get_arenas_by_group import get_arenas_by_group
 from app.repositories.get_games_by_group import get_games_by_group
 from app.repositories.get_groups_by_org import get_groups_by_org
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_group import get_manager_id_by_group
+from app.services.request_loaders import get_loaders
 from app.services.user_service import get_user_service
 
 # Set up logging for this module
@@ -19,12 +19,15 @@ logger = logging.getLogger(__name__)
 
 
 # Main function to get groups
-async def get_groups(db: AsyncSession, org_id: str) -> List[GroupListClientResponse]:
-    db_groups = await get_groups_by_org(org_id, db)
+async def get_groups(db: AsyncSession, org_id: str, limit: Optional[int] = None,
+                     cursor: Optional[str] = None) -> Page[GroupListClientResponse]:
+    db_groups = await get_groups_by_org(org_id, db, limit=limit, cursor=cursor)
+    # The managers of every group are loaded together and then read from the loader
+    await get_loaders(db).managers_by_group.load_many([db_group.id for db_group in db_groups])
     # Process each group concurrently
     groups = [await process_group(db, db_group) for db_group in db_groups]
 
-    return groups
+    return page_of(groups, db_groups, limit, lambda db_group: db_group.id)
 
 
 # Process each individual group
@@ -38,8 +41,8 @@ async def process_group(db: AsyncSession, db_group: Group) -> GroupListClientRes
     )
 
     # Fetch manager details concurrently
-    managers = await get_manager_by_group(db_group.id, db)
-    id_managers = await get_manager_id_by_group(db_group.id, db)
+    managers = await get_loaders(db).managers_by_group.load(db_group.id)
+    id_managers = list(dict.fromkeys(manager.user_id for manager in managers))
     if len(id_managers) != 0:
         users = await get_user_service().get_users_by_id(list(id_managers))
     else:
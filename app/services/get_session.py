@@ -92,6 +92,9 @@ async def get_session(db: AsyncSession, session_id: str, org_id: str) -> ArenaSe
         logger.info(f"Successfully retrieved session with ID {session_id} for organization {org_id}.")
         return session
 
+    except HTTPException:
+        raise
+
     except SQLAlchemyError as e:
         # Handle any database-related errors
         logger.error(
@@ -1,31 +1,35 @@
-from typing import List, Sequence
+from collections import defaultdict
+from typing import List, Optional, Sequence
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from app.models import ArenaSession, Arena, Project
+from app.models import ArenaSession, Arena, Project, Group, GroupUsers
+from app.pagination import Page, page_of
 
 from app.payloads.response.SessionResponse import ArenaGroupResponse, ArenaGroupUserResponse, SessionResponse, \
     ProjectResponse, ArenaResponse, SessionPlayerClientResponse
 from app.payloads.response.UserResponse import UserResponse
-from app.repositories.get_arena_by_id import get_arena_by_id
-from app.repositories.get_game_by_id import get_game_by_id
-from app.repositories.get_groups_by_arena import get_groups_by_arena
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_group import get_manager_id_by_group
-from app.repositories.get_player_id_by_session import get_player_id_by_session
-from app.repositories.get_players_by_session import get_players_by_session
+from app.repositories.get_arenas_by_ids import get_arenas_by_ids
+from app.repositories.get_games_by_ids import get_games_by_ids
+from app.repositories.get_groups_by_arenas import get_groups_by_arenas
+from app.repositories.get_managers_by_groups import get_managers_by_groups
+from app.repositories.get_players_by_sessions import get_players_by_sessions
 from app.repositories.get_sessions_by_org import get_sessions_by_org
 from app.services.user_service import get_user_service
 
 
-async def get_sessions(db: AsyncSession, org_id: str) -> List[SessionResponse]:
+async def get_sessions(db: AsyncSession, org_id: str, limit: Optional[int] = None,
+                       cursor: Optional[str] = None) -> Page[SessionResponse]:
     """
-    Retrieves a list of ArenaSession records for a specific organization and maps them to SessionResponse.
+    Retrieves a page of ArenaSession records for a specific organization and maps them to SessionResponse.
+
+    Only the sessions of the page are enriched, the next page starts after
+    the ID of its last session.
     """
     validate_organisation_id(org_id)
     try:
-        sessions = await get_sessions_by_org(org_id, db)
-        return await map_sessions_to_responses(sessions, db)
+        sessions = await get_sessions_by_org(org_id, db, limit=limit, cursor=cursor)
+        return page_of(await map_sessions_to_responses(sessions, db), sessions, limit, lambda session: session.id)
     except SQLAlchemyError as e:
         handle_db_error(org_id, e)
     except Exception as e:
@@ -43,48 +47,66 @@ def validate_organisation_id(org_id: str):
 async def map_sessions_to_responses(sessions_query: Sequence[ArenaSession], db: AsyncSession) -> List[SessionResponse]:
     """
     Map the retrieved ArenaSession records to a list of SessionResponse objects.
+
+    Every arena, project, group, manager and player referenced by the page is
+    preloaded with one IN query each, and all user ids are resolved with a
+    single user-service call.
     """
     if not sessions_query:
         return []
 
-    sessions = []
-    for session in sessions_query:
-        session_response = await map_session_to_response(db, session)
-        sessions.append(session_response)
-    return sessions
+    arena_ids = list({session.arena_id for session in sessions_query})
+    arenas = {arena.id: arena for arena in await get_arenas_by_ids(arena_ids, db)}
 
+    project_ids = list({session.project_id for session in sessions_query})
+    projects = {project.id: project for project in await get_games_by_ids(project_ids, db)}
 
-async def map_session_to_response(db: AsyncSession, session: ArenaSession) -> SessionResponse:
-    """
-    Maps a single ArenaSession to a SessionResponse.
-    """
+    groups_by_arena = defaultdict(list)
+    for arena_id, group in await get_groups_by_arenas(list(arenas), db):
+        groups_by_arena[arena_id].append(group)
+
+    group_ids = list({group.id for groups in groups_by_arena.values() for group in groups})
+    managers_by_group = defaultdict(list)
+    for manager in await get_managers_by_groups(group_ids, db):
+        managers_by_group[manager.group_id].append(manager)
+
+    players_by_session = defaultdict(list)
+    for player in await get_players_by_sessions([session.id for session in sessions_query], db):
+        players_by_session[player.session_id].append(player)
 
-    arena = await get_arena_by_id(session.arena_id, db)
-    project = await get_game_by_id(session.project_id, session.organisation_code, db)
-    players = await get_players_by_session(session.id, db)
-    ids = await get_player_id_by_session(session.id, db)
+    ids = {manager.user_id for managers in managers_by_group.values() for manager in managers}
+    ids.update(player.user_id for players in players_by_session.values() for player in players)
+    ids.discard(None)
     if len(ids) != 0:
         users = await get_user_service().get_users_by_id(list(ids))
     else:
         users = {}
 
-    return SessionResponse(
-        id=session.id,
-        super_game_master_mail=session.super_game_master_mail,
-        super_game_master_id=session.super_game_master_id,
-        arena_id=session.arena_id,
-        db_index=session.db_index,
-        project_id=session.project_id,
-        period_type=session.period_type,
-        start_time=session.start_time,
-        end_time=session.end_time,
-        access_status=session.access_status,
-        session_status=session.session_status,
-        view_access=session.view_access,
-        project=map_project(project),
-        arena=await _map_arena(arena, db),
-        players=await _map_players(players, users)
-    )
+    sessions = []
+    for session in sessions_query:
+        project = projects.get(session.project_id)
+        # Projects only belong to a session of the same organisation
+        if project and project.organisation_code != session.organisation_code:
+            project = None
+
+        sessions.append(SessionResponse.model_construct(
+            id=session.id,
+            super_game_master_mail=session.super_game_master_mail,
+            super_game_master_id=session.super_game_master_id,
+            arena_id=session.arena_id,
+            db_index=session.db_index,
+            project_id=session.project_id,
+            period_type=session.period_type,
+            start_time=session.start_time,
+            end_time=session.end_time,
+            access_status=session.access_status,
+            session_status=session.session_status,
+            view_access=session.view_access,
+            project=map_project(project),
+            arena=_map_arena(arenas.get(session.arena_id), groups_by_arena, managers_by_group, users),
+            players=_map_players(players_by_session[session.id], users)
+        ))
+    return sessions
 
 
 def map_project(project: Project) -> ProjectResponse | None:
@@ -94,7 +116,7 @@ def map_project(project: Project) -> ProjectResponse | None:
     if not project:
         return None
 
-    return ProjectResponse(
+    return ProjectResponse.model_construct(
         id=project.id,
         name=project.name,
         description=project.description,
@@ -109,46 +131,42 @@ def map_project(project: Project) -> ProjectResponse | None:
     )
 
 
-async def _map_arena(arena: Arena, db: AsyncSession) -> ArenaResponse | None:
+def _map_arena(arena: Arena, groups_by_arena: dict[str, List[Group]],
+               managers_by_group: dict[str, List[GroupUsers]],
+               users: dict[str, UserResponse]) -> ArenaResponse | None:
     """
     Maps the Arena model to ArenaResponse.
     """
     if not arena:
         return None
 
-    groups = await get_groups_by_arena(arena.id, db)
-    return ArenaResponse(
+    return ArenaResponse.model_construct(
         id=arena.id,
         name=arena.name,
-        groups=[await _map_arena_group(group, db) for group in groups]
+        groups=[_map_arena_group(group, managers_by_group.get(group.id, []), users)
+                for group in groups_by_arena.get(arena.id, [])]
     )
 
 
-async def _map_arena_group(group, db: AsyncSession) -> ArenaGroupResponse:
+def _map_arena_group(group: Group, managers: List[GroupUsers],
+                     users: dict[str, UserResponse]) -> ArenaGroupResponse:
     """
     Maps ArenaGroup model to ArenaGroupResponse.
     """
-    managers = await get_manager_by_group(group.id, db)
-    ids = await get_manager_id_by_group(group.id, db)
-    if len(ids) != 0:
-        users = await get_user_service().get_users_by_id(list(ids))
-    else:
-        users = {}
-
-    return ArenaGroupResponse(
+    return ArenaGroupResponse.model_construct(
         id=group.id,
         name=group.name,
-        managers=[await _map_group_manager(user, users) for user in managers]
+        managers=[_map_group_manager(user, users) for user in managers]
     )
 
 
-async def _map_group_manager(user, users: dict[str, UserResponse]) -> ArenaGroupUserResponse:
-    user_details = users.get(user.user_id, None)
-
+def _map_group_manager(user, users: dict[str, UserResponse]) -> ArenaGroupUserResponse:
     """
     Maps ArenaGroup model to ArenaGroupResponse.
     """
-    return ArenaGroupUserResponse(
+    user_details = users.get(user.user_id, None)
+
+    return ArenaGroupUserResponse.model_construct(
         user_id=user_details.user_id if user_details else user.user_id,
         email=user_details.user_email if user_details else user.user_email,
         first_name=user_details.first_name if user_details else user.first_name,
@@ -156,20 +174,20 @@ async def _map_group_manager(user, users: dict[str, UserResponse]) -> ArenaGroup
     )
 
 
-async def _map_players(players, users) -> List[SessionPlayerClientResponse]:
+def _map_players(players, users) -> List[SessionPlayerClientResponse]:
     """
     Maps players in the session to SessionPlayerClientResponse.
     """
     return [
-        await _map_player(player, users)
+        _map_player(player, users)
         for player in players
     ]
 
 
-async def _map_player(user, users) -> SessionPlayerClientResponse:
+def _map_player(user, users) -> SessionPlayerClientResponse:
     user_details = users.get(user.user_id, None)
 
-    return SessionPlayerClientResponse(
+    return SessionPlayerClientResponse.model_construct(
         id=user.id,
         user_id=user_details.user_id if user_details else user.user_id,
         user_email=user_details.user_email if user_details else user.user_email,
@@ -8,10 +8,9 @@ from app.payloads.response.GroupByGameResponse import (
 )
 from app.payloads.response.UserResponse import UserResponse
 from app.repositories.get_arenas_by_group import get_arenas_by_group
-from app.repositories.get_game_by_id import get_game_by_id
 from app.repositories.get_groups_by_game import get_groups_by_game
-from app.repositories.get_manager_by_group import get_manager_by_group
 from app.repositories.get_manager_id_by_game import get_manager_id_by_game
+from app.services.request_loaders import get_loaders
 from app.services.user_service import get_user_service
 
 
@@ -28,11 +27,14 @@ async def groups_by_game(db_session: AsyncSession, game_id: str, org_id: str) ->
         List[GroupByGameResponse]: A list of groups with nested details.
     """
 
-    game = await get_game_by_id(game_id=game_id, org_id=org_id, session=db_session)
+    loaders = get_loaders(db_session)
+    game = await loaders.games.load((game_id, org_id))
     if game is None:
         raise Exception("Game not found")
 
     db_groups = await get_groups_by_game(game_id=game_id, session=db_session)
+    # The managers of every group are loaded together and then read from the loader
+    await loaders.managers_by_group.load_many([db_group.id for db_group in db_groups])
     groups = []
     ids = await get_manager_id_by_game(game_id=game_id, session=db_session)
     users = await get_user_service().get_users_by_id(list(ids))
@@ -96,7 +98,7 @@ async def _get_managers_by_group(db_session: AsyncSession, group_id: str, users:
         List[GroupByGameUserClientResponse]: A list of enriched manager responses.
     """
     managers = []
-    db_managers = await get_manager_by_group(group_id, db_session)
+    db_managers = await get_loaders(db_session).managers_by_group.load(group_id)
 
     for db_manager in db_managers:
         user_details = users.get(db_manager.user_id, None)
@@ -1,30 +1,35 @@
+import uuid
 from typing import List, Optional, Sequence
-from fastapi import BackgroundTasks
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.models import Group, GroupUsers  # Assuming these are your models
 from app.payloads.request.GroupInviteManagerRequest import GroupManager
 from app.payloads.response.UserResponse import UserResponse
+from app.repositories.get_game_ids_by_group import get_game_ids_by_group
 from app.repositories.get_manager_id_by_group import get_manager_id_by_group
 from app.services.organisation_service import get_organisation_service  # Assuming these are your services
-from app.services.send_invite_manager import send_invite_manager
+from app.services.email_outbox import enqueue_email, notify_email_outbox, RECIPIENT_MANAGER
+from app.services.email_templates import TEMPLATE_INVITE_MANAGER
+from app.services.game_view_cache import bump_game_versions, get_game_ids_showing_group
+from app.services.user_game_membership import sync_user_game_memberships
 from app.services.user_service import get_user_service  # Assuming these are your services
 
 
 async def invite_managers(
         db: AsyncSession,
         group: Group,
-        managers: List[GroupManager],
-        background_tasks: BackgroundTasks
+        managers: List[GroupManager]
 ):
     """
     Invites managers to a group by sending them invitation emails.
     Ensures that no duplicate invitations are sent.
 
+    The invitation emails are written to the outbox in the same transaction
+    as the managers and delivered by the outbox worker.
+
     Args:
         db (Session): The database session.
         group (Group): The group to which managers are being invited.
         managers (List[GroupManager]): List of managers to invite.
-        background_tasks (BackgroundTasks): Task queue for sending emails in the background.
 
     Returns:
         dict: A message indicating the status of email invitations.
@@ -43,6 +48,7 @@ async def invite_managers(
         users = {}
 
     existing_emails = [email for email in users.keys()]
+    invited_user_ids = []
     # Process each manager
     for manager in managers:
         if should_skip_invitation(manager, existing_emails):
@@ -55,22 +61,32 @@ async def invite_managers(
         manager_record = create_or_update_manager(db, group, manager, user_details)
         game_link = f"https://{organisation_name}.gamitool.com/group/{group.id}/invite?token={manager_record.id}"
 
-        # Schedule email invitation
-        background_tasks.add_task(
-            send_invite_manager,
-            db,
-            manager_record,
-            manager_record.user_email,
-            f"{manager_record.first_name} {manager_record.last_name}",
-            organisation_name,
-            game_name,
-            game_link,
-        )
+        # Queue email invitation through the outbox
+        if manager_record.user_email:
+            enqueue_email(
+                db,
+                recipient_type=RECIPIENT_MANAGER,
+                recipient_id=manager_record.id,
+                email=manager_record.user_email,
+                subject=f"{organisation_name} - Invitation to manage {game_name}",
+                template=TEMPLATE_INVITE_MANAGER,
+                context={
+                    "[Recipient Name]": f"{manager_record.first_name} {manager_record.last_name}",
+                    "[OrgName]": organisation_name,
+                    "[Your CTA URL]": game_link.lower(),
+                },
+            )
 
         # Mark email as processed
         existing_emails.append(manager_record.user_email)
+        invited_user_ids.append(manager_record.user_id)
 
+    if invited_user_ids:
+        await sync_user_game_memberships(db, invited_user_ids, await get_game_ids_by_group(group.id, db))
     await db.commit()  # Persist changes to the database
+    notify_email_outbox()
+    if invited_user_ids:
+        await bump_game_versions(await get_game_ids_showing_group(db, group.id))
     return {"message": "Emails queued for sending"}
 
 
@@ -107,6 +123,7 @@ def create_or_update_manager(
         GroupUsers: The created or updated manager record.
     """
     manager_record = GroupUsers(
+        id=str(uuid.uuid4()),
         group_id=group.id,
         user_email=user_details.user_email if user_details else manager.user_email,
         user_id=user_details.user_id if user_details else manager.user_id,
@@ -1,7 +1,8 @@
 import re
 import uuid
 
-from fastapi import BackgroundTasks, HTTPException, status
+from fastapi import HTTPException, status
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List
@@ -10,11 +11,14 @@ from app.enums import EmailStatus
 from app.payloads.request.InvitePlayerRequest import InvitePlayerRequest
 import logging
 
-from app.repositories.check_existing_player_by_email_by_session import check_existing_player_by_email_by_session
 from app.repositories.get_game_by_id import get_game_by_id
 from app.repositories.get_game_by_id_only import get_game_by_id_only
+from app.repositories.get_player_identities_by_session import get_player_identities_by_session
 from app.services.organisation_service import get_organisation_service
-from app.services.send_invite_email import send_invite_email
+from app.services.email_outbox import outbox_email, enqueue_emails, notify_email_outbox, RECIPIENT_PLAYER
+from app.services.email_templates import TEMPLATE_INVITE_GAME_MASTER, TEMPLATE_INVITE_PLAYER
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 # Set up logger
 logger = logging.getLogger(__name__)
@@ -22,6 +26,10 @@ logger.setLevel(logging.INFO)
 
 # Regular expression for validating email (basic format check)
 EMAIL_REGEX = r"(^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$)"
+EMAIL_PATTERN = re.compile(EMAIL_REGEX)
+
+# Rows per multi-row INSERT of the invited players
+PLAYER_INSERT_CHUNK_SIZE = 1000
 
 
 def is_valid_email(email: str) -> bool:
@@ -34,26 +42,27 @@ def is_valid_email(email: str) -> bool:
     Returns:
         bool: True if the email is valid, False otherwise.
     """
-    return bool(re.match(EMAIL_REGEX, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 async def invite_players(
         db: AsyncSession,
         session: ArenaSession,
         invite_req: InvitePlayerRequest,
-        background_tasks: BackgroundTasks,
 ):
     """
     Invites players to a session by sending email invitations and tracking email status.
 
+    The invitation emails are written to the outbox in the same transaction
+    as the players and delivered by the outbox worker.
+
     Args:
         db (Session): Database session for querying and persisting data.
         session (ArenaSession): The session to which players are invited.
         invite_req (InvitePlayerRequest): Request containing the players to invite.
-        background_tasks (BackgroundTasks): Task runner for sending emails asynchronously.
 
     Returns:
-        dict: Confirmation message indicating emails are queued for sending.
+        dict: Confirmation message with the number of added, duplicate and invalid members.
     """
     # Fetch the associated project with validation
     project = await get_game_by_id_only(session.project_id, db)
@@ -74,64 +83,84 @@ async def invite_players(
             detail="Organisation not found."
         )
 
-    players_to_add: List[ArenaSessionPlayers] = []
-    email_set = set()  # To check for duplicate emails in the invite request
+    # Emails and user ids already invited to the session, fetched once for the whole request
+    existing_emails = set()
+    existing_user_ids = set()
+    for user_email, user_id in await get_player_identities_by_session(session.id, db):
+        if user_email:
+            existing_emails.add(user_email.lower())
+        if user_id:
+            existing_user_ids.add(user_id)
+
+    players_to_add: List[dict] = []
+    emails_to_send: List[dict] = []
+    duplicates = 0
+    invalid = 0
 
     for user in invite_req.members:
         if not user.user_email:
             logger.warning(f"Skipping user with missing email: {user.user_fullname}")
+            invalid += 1
             continue  # Skip if email is not provided
 
         # Email validation (without external library)
         if not is_valid_email(user.user_email):
             logger.error(f"Invalid email for {user.user_fullname}: {user.user_email}.")
+            invalid += 1
             continue  # Skip invalid emails
 
-        if user.user_email in email_set:
-            logger.warning(f"Duplicate email detected: {user.user_email}. Skipping.")
-            continue  # Skip duplicate emails
-        email_set.add(user.user_email)
-
-        # Check if the player already exists in the session
-        existing_player = await check_existing_player_by_email_by_session(user.user_email, session.id, db)
-
-        if existing_player:
+        # Skip duplicates of the request and players already in the session
+        email_key = user.user_email.lower()
+        user_id = str(user.user_id) if user.user_id else None
+        if email_key in existing_emails or (user_id and user_id in existing_user_ids):
             logger.info(f"Player {user.user_fullname} already invited to this session.")
-            continue  # Skip if the player is already in the session
-
-        # Add player to list
-        db_player = ArenaSessionPlayers(
-            id=str(uuid.uuid4()),
-            session_id=session.id,
-            user_name=user.user_fullname,
-            user_email=user.user_email,
-            user_id=str(user.user_id) if user.user_id else None,
-            organisation_code=session.organisation_code,
-            email_status=EmailStatus.PENDING,  # Set initial email status to PENDING
-            is_game_master=(user.is_game_master if user.is_game_master is not None else False)
-        )
-        players_to_add.append(db_player)
-
-        game_link = f"https://{organisation_name}.gamitool.com/game/{project.id}/invite?token={db_player.id}"
-
-        # Queue email sending in the background
-        background_tasks.add_task(
-            send_invite_email,
-            db=db,
-            player=db_player,
+            duplicates += 1
+            continue
+        existing_emails.add(email_key)
+        if user_id:
+            existing_user_ids.add(user_id)
+
+        is_game_master = user.is_game_master if user.is_game_master is not None else False
+        player_id = str(uuid.uuid4())
+        players_to_add.append({
+            "id": player_id,
+            "session_id": session.id,
+            "user_name": user.user_fullname,
+            "user_email": user.user_email,
+            "user_id": user_id,
+            "organisation_code": session.organisation_code,
+            "email_status": EmailStatus.PENDING,  # Set initial email status to PENDING
+            "is_game_master": is_game_master,
+        })
+
+        game_link = f"https://{organisation_name}.gamitool.com/game/{project.id}/invite?token={player_id}"
+
+        # Queue email sending through the outbox
+        emails_to_send.append(outbox_email(
+            recipient_type=RECIPIENT_PLAYER,
+            recipient_id=player_id,
             email=user.user_email,
-            is_game_master=(user.is_game_master if user.is_game_master is not None else False),
-            fullname=user.user_fullname,
-            organisation_name=organisation_name,
-            game_name=game_name,
-            game_link=game_link,
-        )
-
-    # Persist players to the database
+            subject=f"{organisation_name} - Invitation to play {game_name}",
+            template=TEMPLATE_INVITE_GAME_MASTER if is_game_master else TEMPLATE_INVITE_PLAYER,
+            context={
+                "[Recipient Name]": user.user_fullname or "",
+                "[OrgName]": organisation_name,
+                "[Your CTA URL]": game_link,
+                "[GAME_NAME]": game_name,
+            },
+        ))
+
+    # Persist players and their emails to the database with multi-row INSERTs
     if players_to_add:
         try:
-            db.add_all(players_to_add)
+            for i in range(0, len(players_to_add), PLAYER_INSERT_CHUNK_SIZE):
+                await db.execute(insert(ArenaSessionPlayers), players_to_add[i:i + PLAYER_INSERT_CHUNK_SIZE])
+            await enqueue_emails(db, emails_to_send)
+            await sync_user_game_memberships(
+                db, [player["user_id"] for player in players_to_add], [session.project_id])
             await db.commit()
+            notify_email_outbox()
+            await bump_game_versions([session.project_id])
             logger.info(f"{len(players_to_add)} players added to the session.")
         except Exception as db_error:
             logger.error(f"Database error while saving players: {db_error}")
@@ -141,4 +170,9 @@ async def invite_players(
                 detail="An error occurred while saving players to the session."
             )
 
-    return {"message": f"{len(players_to_add)} players invited. Emails queued for sending."}
+    return {
+        "message": f"{len(players_to_add)} players invited. Emails queued for sending.",
+        "added": len(players_to_add),
+        "duplicates": duplicates,
+        "invalid": invalid,
+    }
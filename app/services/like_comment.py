@@ -1,16 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 
 from app.models import ProjectComment, CommentLike
+from app.repositories.get_comment_by_id import get_comment_by_id
+from app.repositories.get_comment_like import get_comment_like
 
 
-def like_comment(db: Session, comment_id: str, user_id: str) -> ProjectComment:
+async def like_comment(db: AsyncSession, comment_id: str, user_id: str) -> ProjectComment:
     """
     Add a like to a comment from a user.
     If the like already exists, raise an exception.
     """
     # Fetch the comment
-    comment = db.query(ProjectComment).filter(ProjectComment.id == comment_id).first()
+    comment = await get_comment_by_id(comment_id, db)
     if not comment:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -18,10 +20,7 @@ def like_comment(db: Session, comment_id: str, user_id: str) -> ProjectComment:
         )
 
     # Check if the user already liked the comment
-    existing_like = db.query(CommentLike).filter(
-        CommentLike.comment_id == comment_id,
-        CommentLike.user_id == user_id
-    ).first()
+    existing_like = await get_comment_like(comment_id, user_id, db)
 
     if existing_like:
         raise HTTPException(
@@ -34,13 +33,13 @@ def like_comment(db: Session, comment_id: str, user_id: str) -> ProjectComment:
     db.add(like)
 
     try:
-        db.commit()
-        db.refresh(comment)  # Refresh the comment to reflect changes if needed
+        await db.commit()
+        await db.refresh(comment, ["likes"])  # Reload the likes so the new one is part of the response
     except Exception as e:
-        db.rollback()  # Roll back on any failure
+        await db.rollback()  # Roll back on any failure
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An error occurred while liking the comment",
         ) from e
 
-    return like.comment
+    return comment
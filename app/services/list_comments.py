@@ -1,38 +1,36 @@
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from typing import List, Optional
-from app.models import ProjectComment
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 import logging
 
+from app.pagination import Page, page_of
 from app.payloads.response.ProjectCommentResponse import ProjectCommentResponse
+from app.repositories.get_comments_by_project import get_comments_by_project
 
 logger = logging.getLogger(__name__)
 
 
-def list_comments(
-        db: Session,
+async def list_comments(
+        db: AsyncSession,
         project_id: Optional[str] = None,
-        visible: bool = True
-) -> List[ProjectCommentResponse]:
+        visible: bool = True,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+) -> Page[ProjectCommentResponse]:
     """
     List comments based on filters.
     :param db: SQLAlchemy database session
     :param project_id: Optional project ID to filter comments by project
     :param visible: Filter comments by visibility (default: True)
-    :return: List of ProjectCommentResponse
+    :param limit: Maximum number of comments to return, all of them when None
+    :param cursor: ID of the last comment of the previous page
+    :return: Page of ProjectCommentResponse
     """
-    # Build the query dynamically
-    filters = [ProjectComment.visible == visible]
-
-    if project_id:
-        filters.append(ProjectComment.project_id == project_id)
-
     try:
-        query = db.query(ProjectComment).filter(and_(*filters))
-        comments = query.all()
+        comments = await get_comments_by_project(project_id, visible, db, limit=limit, cursor=cursor)
         logger.info(f"Retrieved {len(comments)} comments for project_id={project_id}.")
-        return [ProjectCommentResponse.from_orm(comment) for comment in comments]
+        return page_of([ProjectCommentResponse.model_validate(comment, from_attributes=True) for comment in comments],
+                       comments, limit, lambda comment: comment.id)
 
     except Exception as e:
         logger.error(f"Error retrieving comments: {e}")
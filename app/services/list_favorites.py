@@ -1,25 +1,31 @@
-from typing import List
-from sqlalchemy.orm import Session
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 import logging
 logger = logging.getLogger(__name__)
-from app.models import Project, ProjectFavorite
+from app.models import Project
+from app.pagination import Page, page_of
+from app.repositories.get_favorite_projects_by_user import get_favorite_projects_by_user
 
 
-def list_favorites(
-        db: Session,
-        user_id: str
-) -> List[Project]:
+async def list_favorites(
+        db: AsyncSession,
+        user_id: str,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+) -> Page[Project]:
     """
     Retrieve favorite projects for a user with enhanced error handling.
 
     Args:
-        db (Session): Database session
+        db (AsyncSession): Database session
         user_id (str): Unique identifier for the user
+        limit (Optional[int]): Maximum number of projects to return, all of them when None
+        cursor (Optional[str]): ID of the last project of the previous page
 
     Returns:
-        List[models.Project]: List of favorite projects
+        Page[models.Project]: Page of favorite projects
 
     Raises:
         ValueError: If user_id is invalid
@@ -31,20 +37,12 @@ def list_favorites(
         raise ValueError("User ID cannot be empty or None")
 
     try:
-        # Construct query with potential for additional filtering
-        query = (
-            db.query(Project)
-            .join(ProjectFavorite, ProjectFavorite.project_id == Project.id)
-            .filter(ProjectFavorite.user_id == user_id)
-        )
-
-        # Execute query with performance optimization
-        favorites = query.all()
+        favorites = await get_favorite_projects_by_user(user_id, db, limit=limit, cursor=cursor)
 
         # Log query results for observability
         logger.info(f"Retrieved {len(favorites)} favorite projects for user {user_id}")
 
-        return favorites
+        return page_of(list(favorites), favorites, limit, lambda project: project.id)
 
     except SQLAlchemyError as e:
         # Comprehensive error logging
@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import os
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+MAILER_CONCURRENCY = int(os.getenv("MAILER_CONCURRENCY", "10"))
+# Path of the bulk endpoint of the mailer, e.g. /api/v1/emails/bulk, single sends only when empty
+MAILER_BULK_PATH = os.getenv("MAILER_BULK_PATH", "")
+MAILER_BULK_SIZE = int(os.getenv("MAILER_BULK_SIZE", "50"))
+
+# Answers meaning the mailer does not offer the bulk endpoint
+_BULK_UNSUPPORTED = {404, 405, 501}
+
+
+class Mailer:
+    """
+    Send emails to the mailer over one pooled client.
+
+    At most `concurrency` requests are in flight at once, whatever the number
+    of callers. When a bulk endpoint is configured emails are submitted in
+    chunks, and the mailer falls back on parallel single sends for good if
+    that endpoint turns out not to exist.
+    """
+
+    def __init__(self, client: httpx.AsyncClient | None = None, concurrency: int = MAILER_CONCURRENCY,
+                 bulk_path: str = MAILER_BULK_PATH, bulk_size: int = MAILER_BULK_SIZE):
+        base_url = os.getenv('URL_MAILER')
+        self.client = client or httpx.AsyncClient()
+        self.url = f"{base_url}/api/v1/emails"
+        self.bulk_url = f"{base_url}{bulk_path}" if bulk_path else None
+        self.bulk_size = bulk_size
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def send_many(self, emails: list[tuple[str, dict]]) -> list[str | None]:
+        """
+        Send many emails.
+
+        :param emails: (idempotency key, mailer payload) of every email
+        :return: None for every email the mailer accepted, the error otherwise, in the order of the emails.
+            Never raises, so the caller retries the failed emails and only them
+        """
+        if self.bulk_url is None:
+            return list(await asyncio.gather(*(self.send(key, payload) for key, payload in emails)))
+
+        chunks = [emails[i:i + self.bulk_size] for i in range(0, len(emails), self.bulk_size)]
+        results = await asyncio.gather(*(self._send_chunk(chunk) for chunk in chunks))
+        return [error for chunk_errors in results for error in chunk_errors]
+
+    async def send(self, key: str, payload: dict) -> str | None:
+        """
+        Send one email.
+
+        :return: None when the mailer accepted the email, the error otherwise
+        """
+        email = payload.get("to")
+        async with self._semaphore:
+            try:
+                response = await self.client.post(self.url, json=payload, headers={"Idempotency-Key": key})
+            except Exception as err:
+                # Any failure, e.g. a payload that is not JSON or an invalid URL, is the error of this email
+                logger.error(f"HTTP request failed for {email}: {err}")
+                return str(err)
+
+        if response.status_code in {200, 201, 202}:
+            logger.info(f"Email sent successfully to {email}. Response Code: {response.status_code}")
+            return None
+
+        logger.error(
+            f"Failed to send email to {email}. Response Code: {response.status_code}, "
+            f"Details: {response.text}"
+        )
+        return f"Response Code: {response.status_code}, Details: {response.text}"
+
+    async def _send_chunk(self, chunk: list[tuple[str, dict]]) -> list[str | None]:
+        bulk_url = self.bulk_url
+        if bulk_url is None:
+            return list(await asyncio.gather(*(self.send(key, payload) for key, payload in chunk)))
+
+        async with self._semaphore:
+            try:
+                response = await self.client.post(
+                    bulk_url,
+                    json={"emails": [{**payload, "idempotency_key": key} for key, payload in chunk]}
+                )
+            except Exception as err:
+                logger.error(f"HTTP request failed for a bulk of {len(chunk)} emails: {err}")
+                return [str(err)] * len(chunk)
+
+        if response.status_code in {200, 201, 202}:
+            logger.info(f"Bulk of {len(chunk)} emails sent successfully. Response Code: {response.status_code}")
+            return [None] * len(chunk)
+
+        if response.status_code in _BULK_UNSUPPORTED:
+            logger.warning(f"Mailer has no bulk endpoint at {bulk_url}, falling back on single sends")
+            self.bulk_url = None
+            return list(await asyncio.gather(*(self.send(key, payload) for key, payload in chunk)))
+
+        logger.error(
+            f"Failed to send a bulk of {len(chunk)} emails. Response Code: {response.status_code}, "
+            f"Details: {response.text}"
+        )
+        return [f"Response Code: {response.status_code}, Details: {response.text}"] * len(chunk)
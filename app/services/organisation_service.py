@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 
 import httpx
 from fastapi import HTTPException
@@ -6,39 +8,144 @@ from fastapi import HTTPException
 import logging
 logger = logging.getLogger(__name__)
 
+UNKNOWN_ORGANISATION = "Unknown Organisation"
+
+# Organisation names rarely change, they are kept for an hour by default
+ORGANISATION_CACHE_TTL = float(os.getenv("ORGANISATION_CACHE_TTL", "3600"))
+
 
 class OrganisationServiceClient:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient | None = None):
         self.base_url = f'{os.getenv("CLIENTAUTH_API")}/api/v1'
+        self.client = client or httpx.AsyncClient()
+        self._names: dict[str, tuple[float, str]] = dict()
+        self._in_flight: dict[str, asyncio.Task] = dict()
+
+    async def aclose(self):
+        await self.client.aclose()
 
     async def get_organisation_name(self, organisation_code: str) -> str:
+        name = self._get_cached_name(organisation_code)
+        if name is not None:
+            return name
+
+        # Concurrent lookups of the same organisation share one request
+        task = self._in_flight.get(organisation_code)
+        if task is None:
+            task = asyncio.create_task(self._fetch_organisation_name(organisation_code))
+            self._in_flight[organisation_code] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(organisation_code, None))
+
+        name = await asyncio.shield(task)
+        if name is None:
+            # Not cached, the next lookup asks the organisation service again
+            return UNKNOWN_ORGANISATION
+        self._set_cached_name(organisation_code, name)
+        return name
+
+    async def get_organisation_names(self, organisation_codes: list[str]) -> dict[str, str]:
+        """
+        Resolve the names of many organisations with one batch call for the codes that are not cached.
+
+        :param organisation_codes: The organisation codes
+        :return: The name of every requested organisation, "Unknown Organisation" when it is not known
+        """
+        names = dict()
+        missing = []
+        for organisation_code in dict.fromkeys(organisation_codes):
+            name = self._get_cached_name(organisation_code)
+            if name is None:
+                missing.append(organisation_code)
+            else:
+                names[organisation_code] = name
+
+        if not missing:
+            return names
+
+        fetched = await self._fetch_organisation_names(missing)
+        if fetched is None:
+            # The batch endpoint failed, fall back on the single lookups
+            for organisation_code, name in zip(
+                    missing, await asyncio.gather(*(self.get_organisation_name(code) for code in missing))
+            ):
+                names[organisation_code] = name
+            return names
+
+        left_out = []
+        for organisation_code in missing:
+            name = fetched.get(organisation_code)
+            if name:
+                self._set_cached_name(organisation_code, name)
+                names[organisation_code] = name
+            else:
+                left_out.append(organisation_code)
+
+        # Codes the batch answer left out are looked up one by one, only the names found are cached
+        for organisation_code, name in zip(
+                left_out, await asyncio.gather(*(self.get_organisation_name(code) for code in left_out))
+        ):
+            names[organisation_code] = name
+        return names
+
+    async def _fetch_organisation_name(self, organisation_code: str) -> str | None:
         url = f"{self.base_url}/organisations/{organisation_code}"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
-                if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
-                    data = response.json()
-                return data.get("name", "Unknown Organisation")
+            response = await self.client.get(url)
+            response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
+            if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
+                data = response.json()
+            return data.get("name") or None
         except httpx.RequestError as e:
             logger.error(f"Error connecting to organisation service: {str(e)}")
-            return "Unknown Organisation"
+            return None
         except httpx.HTTPStatusError as e:
             logger.error(f"Organisation service error: {response.json().get('detail', str(e))}")
-            return "Unknown Organisation"
+            return None
 
-    async def get_organisation_names(self, organisation_codes: list[str]) -> dict:
+    async def _fetch_organisation_names(self, organisation_codes: list[str]) -> dict | None:
         url = f"{self.base_url}/organisations/batch"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json={"organisation_codes": organisation_codes})
-                response.raise_for_status()
-                return response.json()  # Assume response is {"code1": "name1", "code2": "name2", ...}
+            response = await self.client.post(url, json={"organisation_codes": organisation_codes})
+            response.raise_for_status()
+            return response.json()  # Assume response is {"code1": "name1", "code2": "name2", ...}
         except httpx.RequestError as e:
             logger.error(f"Error connecting to organisation service: {str(e)}")
-            return {}
+            return None
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Organisation service error: {str(e)}")
+            return None
+
+    def _get_cached_name(self, organisation_code: str) -> str | None:
+        entry = self._names.get(organisation_code)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._names[organisation_code]
+            return None
+        return entry[1]
+
+    def _set_cached_name(self, organisation_code: str, name: str):
+        self._names[organisation_code] = (time.monotonic() + ORGANISATION_CACHE_TTL, name)
+
+
+_organisation_service: OrganisationServiceClient | None = None
+
 
+async def close_organisation_service():
+    """
+    Close the shared organisation service client and its pooled connections.
+    """
+    global _organisation_service
+    if _organisation_service is not None:
+        await _organisation_service.aclose()
+        _organisation_service = None
 
 
 def get_organisation_service() -> OrganisationServiceClient:
-    return OrganisationServiceClient()
+    """
+    Return the shared organisation service client of the worker, its name cache lives as long as the worker.
+    """
+    global _organisation_service
+    if _organisation_service is None:
+        _organisation_service = OrganisationServiceClient()
+    return _organisation_service
@@ -1,30 +1,47 @@
 import logging
 
+from sqlalchemy import insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from sqlalchemy.future import select
 from fastapi import HTTPException
 
 from app.enums import EmailStatus
-from app.models import ArenaSession, ArenaSessionPlayers
+from app.models import ArenaSession, ArenaSessionPlayers, WebhookDelivery
 from app.payloads.request.webhook_invitation_progress_request import WebhookInvitationProgressRequest, InvitationStatus, \
     RoleType
+from app.repositories.get_players_by_session_by_user_ids import get_players_by_session_by_user_ids
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 logger = logging.getLogger(__name__)
 
 
-async def progress_invitation_service(db: AsyncSession, data: WebhookInvitationProgressRequest):
+async def progress_invitation_service(db: AsyncSession, data: WebhookInvitationProgressRequest,
+                                      idempotency_key: str | None = None):
     """
     Processes invitation progress updates by updating the database based on the webhook data.
 
+    Every affected player is loaded with one query, then the status changes
+    are written with one UPDATE and the missing players with one multi-row
+    INSERT. A delivery carrying an idempotency key already processed is
+    acknowledged without changes.
+
     Args:
         db (AsyncSession): SQLAlchemy asynchronous database session.
         data (WebhookInvitationProgressRequest): Webhook payload containing progress information.
+        idempotency_key (str | None): Key of the delivery, defaults to the one of the payload.
 
     Returns:
         dict: A dictionary with a success message.
     """
+    idempotency_key = idempotency_key or data.idempotency_key
     try:
+        if idempotency_key:
+            if await db.get(WebhookDelivery, idempotency_key):
+                return {"message": "Invitation progress already processed."}
+            db.add(WebhookDelivery(id=idempotency_key))
+
         # Step 1: Validate session existence
         result = await db.execute(select(ArenaSession).filter_by(id=data.session_id))
         session = result.scalars().first()
@@ -34,64 +51,61 @@ async def progress_invitation_service(db: AsyncSession, data: WebhookInvitationP
                 detail=f"Session with ID {data.session_id} not found."
             )
 
-        if data.role.value == RoleType.PLAYER.value:
-            for user_data in data.users:
-                result = await db.execute(
-                    select(ArenaSessionPlayers).filter_by(
-                        session_id=data.session_id,
-                        user_id=user_data.id
-                    )
-                )
-                player = result.scalars().first()
-
-                if player:
-                    # Update player email status to reflect the progress
-                    player.email_status = EmailStatus.DELIVERED if data.status == InvitationStatus.INVITATION_ACCEPTED else EmailStatus.SENT
-                else:
-                    # Optionally create a new player if not found
-                    new_player = ArenaSessionPlayers(
-                        session_id=data.session_id,
-                        user_id=user_data.id,
-                        is_game_master=False,
-                        email_status=EmailStatus.SENT
-                    )
-                    db.add(new_player)
-        elif data.role.value == RoleType.GAME_MASTER.value:
-            for user_data in data.users:
-                result = await db.execute(
-                    select(ArenaSessionPlayers).filter_by(
-                        session_id=data.session_id,
-                        user_id=user_data.id
-                    )
+        email_status = EmailStatus.DELIVERED if data.status == InvitationStatus.INVITATION_ACCEPTED else EmailStatus.SENT
+
+        if data.role.value in (RoleType.PLAYER.value, RoleType.GAME_MASTER.value):
+            user_ids = list(dict.fromkeys(user_data.id for user_data in data.users if user_data.id))
+            players = await get_players_by_session_by_user_ids(data.session_id, user_ids, db)
+
+            if players:
+                # Update player email status to reflect the progress
+                await db.execute(
+                    update(ArenaSessionPlayers)
+                    .where(ArenaSessionPlayers.id.in_([player.id for player in players]))
+                    .values(email_status=email_status)
+                    .execution_options(synchronize_session=False)
                 )
-                player = result.scalars().first()
-
-                if player:
-                    # Update player email status to reflect the progress
-                    player.email_status = EmailStatus.DELIVERED if data.status == InvitationStatus.INVITATION_ACCEPTED else EmailStatus.SENT
-                else:
-                    # Optionally create a new player if not found
-                    new_player = ArenaSessionPlayers(
-                        session_id=data.session_id,
-                        user_id=user_data.id,
-                        is_game_master=True,
-                        email_status=EmailStatus.SENT
-                    )
-                    db.add(new_player)
+
+            # Optionally create the players that were not found
+            known_user_ids = {player.user_id for player in players}
+            new_players = [
+                {
+                    "session_id": data.session_id,
+                    "user_id": user_id,
+                    "is_game_master": data.role.value == RoleType.GAME_MASTER.value,
+                    "email_status": EmailStatus.SENT,
+                }
+                for user_id in user_ids if user_id not in known_user_ids
+            ]
+            if new_players:
+                await db.execute(insert(ArenaSessionPlayers), new_players)
+                await sync_user_game_memberships(
+                    db, [player["user_id"] for player in new_players], [session.project_id])
         elif data.role.value == RoleType.MODERATOR.value:
-            logger.error("Moderator condition has been enter")
-            for user_data in data.users:
-                logger.error("users has been looped")
-                # Update player email status to reflect the progress
-                session.email_status = EmailStatus.DELIVERED if data.status == InvitationStatus.INVITATION_ACCEPTED else EmailStatus.SENT
-                session.super_game_master_id = user_data.id
+            if data.users:
+                # Update session email status to reflect the progress
+                session.email_status = email_status
+                previous_moderator_id = session.super_game_master_id
+                session.super_game_master_id = data.users[-1].id
                 db.add(session)
+                await sync_user_game_memberships(
+                    db, [previous_moderator_id, session.super_game_master_id], [session.project_id])
 
         # Commit all changes to the database
         await db.commit()
+        await bump_game_versions([session.project_id])
 
         return {"message": "Invitation progress updated successfully."}
 
+    except IntegrityError as e:
+        await db.rollback()
+        # A concurrent delivery with the same key won the race
+        if idempotency_key and await db.get(WebhookDelivery, idempotency_key):
+            return {"message": "Invitation progress already processed."}
+        raise HTTPException(
+            status_code=500,
+            detail=f"Database error occurred: {str(e)}"
+        )
     except SQLAlchemyError as e:
         await db.rollback()
         raise HTTPException(
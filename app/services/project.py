@@ -3,6 +3,7 @@ from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException
 
 from app import models
+from app.pagination import Page, page_of
 from app.payloads.request.ModuleCreateRequest import ModuleCreateRequest
 from app.payloads.request.ModuleUpdateRequest import ModuleUpdateRequest
 from app.payloads.request.ProjectUpdateRequest import ProjectUpdateRequest
@@ -11,15 +12,21 @@ from app.repositories.get_all_projects import get_all_projects
 from app.repositories.get_game_by_id_only import get_game_by_id_only
 from app.repositories.get_module_by_id import get_module_by_id
 from app.repositories.get_modules_by_game import get_modules_by_game
+from app.services.game_view_cache import bump_game_versions
 from app.services.organisation_service import get_organisation_service
 
 
-async def list_projects(db: AsyncSession):
+async def list_projects(db: AsyncSession, limit: int | None = None,
+                        cursor: list | None = None) -> Page[ProjectAdminResponse]:
+    """Retrieve a page of projects, the most recent first."""
     organisation_service = get_organisation_service()
-    projects = await get_all_projects(db)
+    projects = await get_all_projects(db, limit=limit, cursor=cursor)
+    organisation_names = await organisation_service.get_organisation_names(
+        [str(project.organisation_code) for project in projects]
+    )
     result = []
     for project in projects:
-        organisation_name = await organisation_service.get_organisation_name(str(project.organisation_code))
+        organisation_name = organisation_names.get(str(project.organisation_code))
         if organisation_name is None:
             organisation_name = "Unknown Organisation"
 
@@ -33,7 +40,7 @@ async def list_projects(db: AsyncSession):
             organisation_code=project.organisation_code
         ))
 
-    return result
+    return page_of(result, projects, limit, lambda project: [project.created_at, project.id])
 
 
 async def list_modules(db: AsyncSession, project_id: str):
@@ -48,6 +55,7 @@ async def update_project(db: AsyncSession, project_id: str, project: ProjectUpda
     for key, value in project.dict(exclude_unset=True).items():
         setattr(db_project, key, value)
     await db.commit()
+    await bump_game_versions([project_id])
     await db.refresh(db_project)
     return db_project
 
@@ -58,6 +66,7 @@ async def delete_project(db: AsyncSession, project_id: str):
         raise HTTPException(status_code=404, detail="Project not found")
     await db.delete(db_project)
     await db.commit()
+    await bump_game_versions([project_id])
     return {"message": "Project deleted successfully"}
 
 
@@ -70,6 +79,7 @@ async def create_module(db: AsyncSession, module: ModuleCreateRequest):
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Unique constraint violation.")
+    await bump_game_versions([db_module.project_id])
     return db_module
 
 
@@ -84,9 +94,11 @@ async def update_module(db: AsyncSession, module_id: str, module: ModuleUpdateRe
     db_module = await get_module_by_id(module_id, db)
     if not db_module:
         raise HTTPException(status_code=404, detail="Module not found")
+    previous_project_id = db_module.project_id
     for key, value in module.dict(exclude_unset=True).items():
         setattr(db_module, key, value)
     await db.commit()
+    await bump_game_versions([previous_project_id, db_module.project_id])
     await db.refresh(db_module)
     return db_module
 
@@ -97,6 +109,7 @@ async def delete_module(db: AsyncSession, module_id: str):
         raise HTTPException(status_code=404, detail="Module not found")
     await db.delete(db_module)
     await db.commit()
+    await bump_game_versions([db_module.project_id])
     return {"message": "Module deleted successfully"}
 
 
@@ -114,6 +127,7 @@ async def set_template_module(db: AsyncSession, module_id: str, template_code: s
 
     # Commit the changes
     await db.commit()
+    await bump_game_versions([module.project_id])
     await db.refresh(module)
 
     return {"message": "Template set successfully", "module_id": module_id, "template_code": template_code}
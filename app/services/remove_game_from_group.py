@@ -3,6 +3,9 @@ from sqlalchemy.future import select
 from fastapi import HTTPException, status
 from uuid import UUID
 from app.models import Group, GroupProjects
+from app.repositories.get_manager_id_by_group import get_manager_id_by_group
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 
 async def remove_game_from_group(group_id: str, game_id: str, organisation_id: str, db: AsyncSession):
@@ -33,7 +36,9 @@ async def remove_game_from_group(group_id: str, game_id: str, organisation_id: s
 
     # Remove the association
     await db.delete(group_project)
+    await sync_user_game_memberships(db, await get_manager_id_by_group(group.id, db), [str(game_id)])
     await db.commit()
+    await bump_game_versions([game_id])
     return {
         "message": "Game successfully removed from the group",
         "group_id": str(group_id),
@@ -4,6 +4,10 @@ from sqlalchemy.future import select
 from app.models import Group, GroupUsers
 from fastapi import HTTPException, status
 
+from app.repositories.get_game_ids_by_group import get_game_ids_by_group
+from app.services.user_game_membership import sync_user_game_memberships
+from app.services.game_view_cache import bump_game_versions, get_game_ids_showing_group
+
 
 async def remove_manager_from_group_by_email(
         group_id: str, manager_email: str, organisation_id: str, db: AsyncSession
@@ -33,7 +37,10 @@ async def remove_manager_from_group_by_email(
 
         # Remove manager
         await db.delete(manager)
+        await sync_user_game_memberships(db, [manager.user_id], await get_game_ids_by_group(group.id, db))
+        game_ids = await get_game_ids_showing_group(db, group.id)
         await db.commit()
+        await bump_game_versions(game_ids)
 
         return {
             "message": "Manager successfully removed from the group",
@@ -1,6 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.exceptions.PlayerNotFoundError import PlayerNotFoundError
 from app.repositories.get_player_by_id import get_player_by_id
+from app.repositories.get_session_by_id_only import get_session_by_id_only
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 
 async def remove_player_from_session(db: AsyncSession, session_player_id: str, org_id: str):
@@ -17,4 +20,9 @@ async def remove_player_from_session(db: AsyncSession, session_player_id: str, o
 
     # Remove the player from the session
     await db.delete(session_player)
+    arena_session = await get_session_by_id_only(session_player.session_id, db)
+    if arena_session:
+        await sync_user_game_memberships(db, [session_player.user_id], [arena_session.project_id])
     await db.commit()
+    if arena_session:
+        await bump_game_versions([arena_session.project_id])
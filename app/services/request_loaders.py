@@ -0,0 +1,103 @@
+import asyncio
+from collections import defaultdict
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums import ModuleForType
+from app.repositories.get_arenas_by_ids import get_arenas_by_ids
+from app.repositories.get_games_by_ids import get_games_by_ids
+from app.repositories.get_managers_by_groups import get_managers_by_groups
+from app.repositories.get_modules_by_games_by_types import get_modules_by_games_by_types
+from app.repositories.get_players_by_sessions import get_players_by_sessions
+from app.services.data_loader import DataLoader
+
+# Key of the loaders in the info of the database session
+_LOADERS_KEY = "loaders"
+
+
+class RequestLoaders:
+    """
+    The loaders of the hot repository lookups, shared by every service of a request.
+
+    - arenas: arena id -> Arena or None, as get_arena_by_id
+    - games: (game id, organisation code) -> Project or None, as get_game_by_id
+    - managers_by_group: group id -> list of GroupUsers, as get_manager_by_group
+    - players_by_session: session id -> list of ArenaSessionPlayers, as get_players_by_session
+    - modules_by_game_by_type: (game id, tuple of ModuleForType) -> list of ProjectModule,
+      as get_module_by_game_by_type
+
+    They memoize what they read, so they are meant for the read paths: a
+    service changing those rows clears the loader it affects.
+
+    Every loader flushes in its own task on the one session of the request,
+    which runs a single statement at a time, so their batch calls take turns.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._lock = asyncio.Lock()
+        self.arenas = DataLoader(self._serialized(self._load_arenas))
+        self.games = DataLoader(self._serialized(self._load_games))
+        self.managers_by_group = DataLoader(self._serialized(self._load_managers_by_group), default=list)
+        self.players_by_session = DataLoader(self._serialized(self._load_players_by_session), default=list)
+        self.modules_by_game_by_type = DataLoader(self._serialized(self._load_modules_by_game_by_type),
+                                                  default=list)
+
+    def _serialized(self, batch_load: Callable[[list], Awaitable[dict]]) -> Callable[[list], Awaitable[dict]]:
+        async def load(keys: list) -> dict:
+            async with self._lock:
+                return await batch_load(keys)
+
+        return load
+
+    async def _load_arenas(self, arena_ids: list[str]) -> dict:
+        return {arena.id: arena for arena in await get_arenas_by_ids(arena_ids, self.db)}
+
+    async def _load_games(self, keys: list[tuple[str, str]]) -> dict:
+        games = await get_games_by_ids(list({game_id for game_id, _ in keys}), self.db)
+        return {(game.id, game.organisation_code): game for game in games}
+
+    async def _load_managers_by_group(self, group_ids: list[str]) -> dict:
+        managers = defaultdict(list)
+        for manager in await get_managers_by_groups(group_ids, self.db):
+            managers[manager.group_id].append(manager)
+        return managers
+
+    async def _load_players_by_session(self, session_ids: list[str]) -> dict:
+        players = defaultdict(list)
+        for player in await get_players_by_sessions(session_ids, self.db):
+            players[player.session_id].append(player)
+        return players
+
+    async def _load_modules_by_game_by_type(self, keys: list[tuple[str, tuple[ModuleForType, ...]]]) -> dict:
+        game_ids = list({game_id for game_id, _ in keys})
+        types = list({mtype for _, mtypes in keys for mtype in mtypes})
+        modules_by_game = defaultdict(list)
+        for module in await get_modules_by_games_by_types(game_ids, types, self.db):
+            modules_by_game[module.project_id].append(module)
+
+        return {
+            (game_id, mtypes): [module for module in modules_by_game[game_id] if module.module_for in mtypes]
+            for game_id, mtypes in keys
+        }
+
+
+def get_loaders(db: AsyncSession) -> RequestLoaders:
+    """
+    Return the loaders of a database session, created on first use.
+
+    The session given by get_db_async lives for one request, so do its
+    loaders and everything they memoize.
+
+    Args:
+        db (AsyncSession): The database session of the request.
+
+    Returns:
+        RequestLoaders: The loaders bound to that session.
+    """
+    loaders = db.info.get(_LOADERS_KEY)
+    if loaders is None:
+        loaders = RequestLoaders(db)
+        db.info[_LOADERS_KEY] = loaders
+    return loaders
@@ -129,7 +129,7 @@ async def show_arena(db: Session, arena_id: UUID, org_id: str) -> ArenaListRespo
     Returns:
         ArenaListResponseTop: The response containing arena details.
     """
-    db_arena = get_arena(db, arena_id, org_id)
+    db_arena = await get_arena(db, arena_id, org_id)
     if not db_arena:
         raise ValueError(f"Arena with ID {arena_id} not found in organization {org_id}")
 
@@ -1,18 +1,21 @@
+from collections import defaultdict
 from typing import Optional, List
 from uuid import UUID
 
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import ArenaSession
+from app.models import ArenaSession, ArenaSessionPlayers
 from app.payloads.response.ArenaShowByGameResponse import ArenaShowByGameResponse, ArenaShowByGameSessionResponse, \
     ArenaShowByGameSessionMemberResponse
+from app.repositories.get_players_by_sessions import get_players_by_sessions
+from app.repositories.get_session_by_arena_by_game import get_session_by_arena_by_game
 from app.services.get_arena import get_arena
 from app.services.user_service import get_user_service
 
 
-async def show_arena_by_game(db: Session, arena_id: UUID, game_id: UUID, org_id: str) -> ArenaShowByGameResponse:
-    db_arena = get_arena(db, arena_id, org_id)
+async def show_arena_by_game(db: AsyncSession, arena_id: UUID, game_id: UUID, org_id: str) -> ArenaShowByGameResponse:
+    db_arena = await get_arena(db, arena_id, org_id)
 
     if not db_arena:
         raise NoResultFound("Arena not found")
@@ -21,24 +24,28 @@ async def show_arena_by_game(db: Session, arena_id: UUID, game_id: UUID, org_id:
                                     name=db_arena.name,
                                     sessions=[])
 
-    arena_sessions = db.query(ArenaSession).filter(
-        ArenaSession.project_id == str(game_id),
-        ArenaSession.arena_id == db_arena.id
-    ).all()
-    print(arena_sessions)
+    arena_sessions = await get_session_by_arena_by_game(str(game_id), db_arena.id, db)
+
+    # The players of every session are loaded together
+    players_by_session = defaultdict(list)
+    for player in await get_players_by_sessions([db_session.id for db_session in arena_sessions], db):
+        players_by_session[player.session_id].append(player)
 
     # Populate sessions
-    arena.sessions = await _get_sessions_by_arena(arena_sessions)
+    arena.sessions = await _get_sessions_by_arena(arena_sessions, players_by_session)
 
     return arena
 
 
-async def _get_sessions_by_arena(arena_sessions) -> List[ArenaShowByGameSessionResponse]:
+async def _get_sessions_by_arena(arena_sessions: List[ArenaSession],
+                                 players_by_session: dict[str, List[ArenaSessionPlayers]]
+                                 ) -> List[ArenaShowByGameSessionResponse]:
     """
     Fetches sessions and their associated players for a given arena.
 
     Args:
         arena_sessions: Queryset of arena sessions.
+        players_by_session: The players of the sessions by session ID.
 
     Returns:
         List[GroupByGameArenaSessionResponse]: A list of sessions with nested players.
@@ -55,7 +62,7 @@ async def _get_sessions_by_arena(arena_sessions) -> List[ArenaShowByGameSessionR
             access_status=db_session.access_status,
             session_status=db_session.session_status,
             view_access=db_session.view_access,
-            players=(await _get_players_by_session(db_session))
+            players=(await _get_players_by_session(players_by_session[db_session.id]))
         )
 
         sessions.append(session)
@@ -63,19 +70,19 @@ async def _get_sessions_by_arena(arena_sessions) -> List[ArenaShowByGameSessionR
     return sessions
 
 
-async def _get_players_by_session(db_session) -> List[ArenaShowByGameSessionMemberResponse]:
+async def _get_players_by_session(db_players: List[ArenaSessionPlayers]) -> List[ArenaShowByGameSessionMemberResponse]:
     """
     Fetches players for a given session.
 
     Args:
-        db_session: The session object containing players.
+        db_players: The players of the session.
 
     Returns:
         List[GroupByGameSessionPlayerClientResponse]: A list of player responses.
     """
     players = []
 
-    for db_player in db_session.players:
+    for db_player in db_players:
         # Fetch user details using the UserServiceClient
         user_details = None
         if db_player.user_id and db_player.user_id != 'None':
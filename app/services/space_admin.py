@@ -3,17 +3,15 @@ import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.count_session_players import count_session_players
 from app.repositories.get_arenas_by_group import get_arenas_by_group
 from app.repositories.get_favorite_projects_by_user import get_favorite_projects_by_user
+from app.repositories.get_game_counters_by_games import get_game_counters_by_games
 from app.repositories.get_groups_by_game import get_groups_by_game
 from app.repositories.get_manager_by_group import get_manager_by_group
 from app.repositories.get_manager_id_by_game import get_manager_id_by_game
 from app.repositories.get_next_game_by_org import get_next_game_by_org
 from app.repositories.get_player_id_by_game import get_player_id_by_game
-from app.repositories.get_player_id_by_game_by_user import get_player_id_by_game_by_user
 from app.repositories.get_recent_projects_by_org import get_recent_projects_by_org
-from app.repositories.get_user_role_in_game_by_org import get_user_role_in_game_by_org
 
 logger = logging.getLogger(__name__)
 from app.models import Group, Project
@@ -53,15 +51,15 @@ async def _process_group_managers(
     return processed_managers
 
 
-async def _process_single_event(db: AsyncSession, project: Project):
+def _process_single_event(project: Project, counters: dict[str, dict[str, int]]):
     """
     Process a single project event with player count.
 
-    :param db: Database session
     :param project: Project model instance
+    :param counters: Game counters keyed by project id
     :return: Processed event response
     """
-    total_players = await count_session_players(db, project.module_game_id, project.id)
+    total_players = counters[project.id]["session_players"]
 
     return EventGameResponse(
         id=project.id,
@@ -76,32 +74,16 @@ async def _process_single_event(db: AsyncSession, project: Project):
     )
 
 
-async def fetch_favorite_projects(db: AsyncSession, user_id: str):
-    """
-    Fetch and process favorite projects for a user.
-
-    :param db: Database session
-    :param user_id: User identifier
-    :return: List of favorite game responses
-    """
-    favorite_projects = await get_favorite_projects_by_user(user_id, db)
-    favorite_tasks = [
-        await _process_favorite_project(db, fav_project)
-        for fav_project in favorite_projects
-    ]
-
-    return favorite_tasks
-
-
-async def _process_favorite_project(db: AsyncSession, project):
+async def _process_favorite_project(db: AsyncSession, project, counters: dict[str, dict[str, int]]):
     """
     Process a single favorite project with details.
 
     :param db: Database session
     :param project: Favorite project model instance
+    :param counters: Game counters keyed by project id
     :return: Favorite game response
     """
-    total_players = await count_session_players(db, project.module_game_id, project.id)
+    total_players = counters[project.id]["session_players"]
     ids = await get_manager_id_by_game(project.id, db)
 
     if len(ids) != 0:
@@ -134,33 +116,16 @@ async def _process_favorite_project(db: AsyncSession, project):
     )
 
 
-async def fetch_recent_projects(db: AsyncSession, org_id):
-    """
-    Fetch recent projects for an organization.
-
-    :param db: Database session
-    :param org_id: Organization identifier
-    :return: List of recent game responses
-    """
-    recent_projects = await get_recent_projects_by_org(org_id, db)
-
-    recent_tasks = [
-        await _process_recent_project(db, project)
-        for project in recent_projects
-    ]
-
-    return recent_tasks
-
-
-async def _process_recent_project(db, project):
+async def _process_recent_project(db, project, counters: dict[str, dict[str, int]]):
     """
     Process a single recent project with details.
 
     :param db: Database session
     :param project: Project model instance
+    :param counters: Game counters keyed by project id
     :return: Recent game response
     """
-    total_players = await count_session_players(db, project.module_game_id, project.id)
+    total_players = counters[project.id]["session_players"]
     ids = await get_manager_id_by_game(project.id, db)
     if len(ids) != 0:
         users = await get_user_service().get_users_by_id(list(ids))
@@ -208,13 +173,25 @@ async def space_admin(db: AsyncSession, user_id: str, org_id: str):
     # )
 
     project = await get_next_game_by_org(org_id=org_id, session=db)
-    favorite_projects = await fetch_favorite_projects(db, user_id)
-    recent_projects = await fetch_recent_projects(db, org_id)
+    favorite_projects = await get_favorite_projects_by_user(user_id, db)
+    recent_projects = await get_recent_projects_by_org(org_id, db)
+
+    # Player counts of every project of the page in one grouped query
+    counters = await get_game_counters_by_games(
+        db, [(game.module_game_id, game.id) for game in [project, *favorite_projects, *recent_projects]]
+    )
+
     # Process project events
-    event = await _process_single_event(db, project)
+    event = _process_single_event(project, counters)
 
     return AdminSpaceClientResponse(
         events=[event],
-        favorite_games=favorite_projects,
-        recent_games=recent_projects
+        favorite_games=[
+            await _process_favorite_project(db, fav_project, counters)
+            for fav_project in favorite_projects
+        ],
+        recent_games=[
+            await _process_recent_project(db, recent_project, counters)
+            for recent_project in recent_projects
+        ]
     )
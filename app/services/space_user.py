@@ -1,44 +1,97 @@
-from typing import List
+from collections import defaultdict
+from typing import List, NamedTuple
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.count_session_players import count_session_players
-from app.repositories.get_arenas_by_group import get_arenas_by_group
+from app.repositories.get_arenas_by_groups import get_arenas_by_groups
 from app.repositories.get_favorite_projects_by_user import get_favorite_projects_by_user
-from app.repositories.get_groups_by_game import get_groups_by_game
-from app.repositories.get_manager_by_group import get_manager_by_group
-from app.repositories.get_manager_id_by_game import get_manager_id_by_game
+from app.repositories.get_game_counters_by_games import get_game_counters_by_games
+from app.repositories.get_groups_by_games import get_groups_by_games
+from app.repositories.get_managers_by_groups import get_managers_by_groups
 from app.repositories.get_next_game_by_org_by_user import get_next_game_by_org_by_user
-from app.repositories.get_player_id_by_game_by_user import get_player_id_by_game_by_user
 from app.repositories.get_recent_projects_by_org_by_user import get_recent_projects_by_org_by_user
-from app.repositories.get_user_role_in_game_by_org import get_user_role_in_game_by_org
+from app.repositories.get_user_roles_in_games_by_org import get_user_roles_in_games_by_org
 
 logger = logging.getLogger(__name__)
-from app.models import Group, Project
+from app.models import Group, Project, GroupUsers, Arena
 from app.payloads.response.EspaceAdminClientResponse import ArenaResponse, ManagerResponse, GroupResponse, \
     RecentGameResponse, FavoriteGameResponse, EventGameResponse, AdminSpaceClientResponse
 from app.payloads.response.UserResponse import UserResponse
 from app.services.user_service import get_user_service
 
 
-async def _process_group_managers(
-        db_group: Group, users: dict[str, UserResponse], db: AsyncSession
+class _Dashboard(NamedTuple):
+    """
+    Lookups shared by every project of the dashboard, keyed by project, group or user id.
+    """
+    counters: dict[str, dict[str, int]]
+    roles: dict[str, str | None]
+    groups: dict[str, List[Group]]
+    arenas: dict[str, List[Arena]]
+    managers: dict[str, List[GroupUsers]]
+    users: dict[str, UserResponse]
+
+
+async def _load_dashboard(db: AsyncSession, projects: List[Project], user_id: str) -> _Dashboard:
+    """
+    Load everything the dashboard needs for a list of projects with grouped queries.
+
+    :param db: Database session
+    :param projects: Every event, favorite and recent project of the dashboard
+    :param user_id: User identifier
+    :return: The dashboard lookups
+    """
+    projects = list({project.id: project for project in projects}.values())
+    project_ids = [project.id for project in projects]
+
+    counters = await get_game_counters_by_games(
+        db, [(project.module_game_id, project.id) for project in projects]
+    )
+    roles = await get_user_roles_in_games_by_org(
+        user_id, {project.id: project.organisation_code for project in projects}, db
+    )
+
+    groups = defaultdict(list)
+    for project_id, group in await get_groups_by_games(project_ids, db):
+        groups[project_id].append(group)
+
+    group_ids = list({group.id for project_groups in groups.values() for group in project_groups})
+    arenas = defaultdict(list)
+    for group_id, arena in await get_arenas_by_groups(group_ids, db):
+        arenas[group_id].append(arena)
+
+    managers = defaultdict(list)
+    for manager in await get_managers_by_groups(group_ids, db):
+        managers[manager.group_id].append(manager)
+
+    ids = {manager.user_id for group_managers in managers.values() for manager in group_managers}
+    ids.discard(None)
+    if len(ids) != 0:
+        users = await get_user_service().get_users_by_id(list(ids))
+    else:
+        users = dict()
+
+    return _Dashboard(counters, roles, groups, arenas, managers, users)
+
+
+def _process_group_managers(
+        db_group: Group, dashboard: _Dashboard
 ) -> List[ManagerResponse]:
     """
-    Process group managers with concurrent user details fetching.
+    Process group managers with the preloaded user details.
 
     Args:
         db_group (Group): Group
-        users: the users of api salah
+        dashboard (_Dashboard): The dashboard lookups
 
     Returns:
         List[GameViewManagerResponse]: Processed manager details
     """
     processed_managers = []
 
-    for manager in (await get_manager_by_group(db_group.id, db)):
-        user_detail = users.get(manager.user_id, None)
+    for manager in dashboard.managers.get(db_group.id, []):
+        user_detail = dashboard.users.get(manager.user_id, None)
         processed_manager = ManagerResponse(
             user_id=user_detail.get('user_id') if user_detail else str(manager.user_id),
             email=user_detail.get('user_email') if user_detail else manager.user_email,
@@ -52,194 +105,117 @@ async def _process_group_managers(
     return processed_managers
 
 
-async def _process_single_event(db: AsyncSession, project: Project, role: str):
+def _process_project_groups(project: Project, dashboard: _Dashboard) -> List[GroupResponse]:
+    """
+    Process the groups of a project with their managers and arenas.
+
+    :param project: Project model instance
+    :param dashboard: The dashboard lookups
+    :return: List of group responses
+    """
+    return [
+        GroupResponse(
+            id=group.id,
+            name=group.name,
+            managers=_process_group_managers(group, dashboard),
+            arenas=[
+                ArenaResponse(
+                    id=arena.id,
+                    name=arena.name
+                ) for arena in dashboard.arenas.get(group.id, [])
+            ]
+        ) for group in dashboard.groups.get(project.id, [])
+    ]
+
+
+def _process_single_event(project: Project, dashboard: _Dashboard):
     """
     Process a single project event with player count.
 
-    :param db: Database session
     :param project: Project model instance
+    :param dashboard: The dashboard lookups
     :return: Processed event response
     """
-    total_players = await count_session_players(db, project.module_game_id, project.id)
-
     return EventGameResponse(
         id=project.id,
         game_name=project.name,
-        role=role,
+        role=dashboard.roles.get(project.id),
         client_name=project.client_name,
         visibility=project.visibility,
         online_date=project.start_time,
         game_type=project.game_type,
         playing_type=project.playing_type,
-        total_players=total_players,
+        total_players=dashboard.counters[project.id]["session_players"],
         tags=[x.strip() for x in project.tags.split(",")]
     )
 
 
-async def fetch_favorite_projects(db: AsyncSession, user_id: str):
-    """
-    Fetch and process favorite projects for a user.
-
-    :param db: Database session
-    :param user_id: User identifier
-    :return: List of favorite game responses
-    """
-    favorite_projects = await get_favorite_projects_by_user(user_id, db)
-    favorite_tasks = [
-        await _process_favorite_project(db, fav_project, user_id)
-        for fav_project in favorite_projects
-    ]
-
-    return favorite_tasks
-
-
-async def _process_favorite_project(db: AsyncSession, project, user_id: str):
+def _process_favorite_project(project: Project, dashboard: _Dashboard):
     """
      Process a single favorite project with details.
 
-    :param db: Database session
     :param project: Favorite project model instance
+    :param dashboard: The dashboard lookups
     :return: Favorite game response
     """
-
-    total_players = await count_session_players(db, project.module_game_id, project.id)
-    ids = await get_manager_id_by_game(project.id, db)
-
-    if len(ids) != 0:
-        users = await get_user_service().get_users_by_id(list(ids))
-    else:
-        users = dict()
-
-    role = await get_user_role_in_game_by_org(project.organisation_code, user_id, project.id, db)
-    if role == "player":
-        player = await get_player_id_by_game_by_user(project.id, user_id, db)
-        if player is not None and player.is_game_master:
-            role = "game_master"
-
     return FavoriteGameResponse(
         id=project.id,
-        role=role,
+        role=dashboard.roles.get(project.id),
         game_name=project.name,
         client_name=project.client_name,
         visibility=project.visibility,
         online_date=project.start_time,
         game_type=project.game_type,
         playing_type=project.playing_type,
-        total_players=total_players,
-        groups=[
-            GroupResponse(
-                id=group.id,
-                name=group.name,
-                managers=await _process_group_managers(group, users, db),
-                arenas=[
-                    ArenaResponse(
-                        id=arena.id,
-                        name=arena.name
-                    ) for arena in (await get_arenas_by_group(group.id, db))
-                ]
-            ) for group in (await get_groups_by_game(project.id, db))
-        ]
+        total_players=dashboard.counters[project.id]["session_players"],
+        groups=_process_project_groups(project, dashboard)
     )
 
 
-async def fetch_recent_projects(db: AsyncSession, org_id, user_id: str):
-    """
-    Fetch recent projects for an organization.
-
-    :param db: Database session
-    :param org_id: Organization identifier
-    :return: List of recent game responses
-    """
-    recent_projects = await get_recent_projects_by_org_by_user(org_id, user_id, db)
-
-    recent_tasks = [
-        await _process_recent_project(db, project, user_id)
-        for project in recent_projects
-    ]
-
-    return recent_tasks
-
-
-async def _process_recent_project(db, project, user_id: str):
+def _process_recent_project(project: Project, dashboard: _Dashboard):
     """
     Process a single recent project with details.
 
-    :param db: Database session
     :param project: Project model instance
+    :param dashboard: The dashboard lookups
     :return: Recent game response
     """
-    total_players = await count_session_players(db, project.module_game_id, project.id)
-    ids = await get_manager_id_by_game(project.id, db)
-    if len(ids) != 0:
-        users = await get_user_service().get_users_by_id(list(ids))
-    else:
-        users = dict()
-
-    role = await get_user_role_in_game_by_org(project.organisation_code, user_id, project.id, db)
-    if role == "player":
-        player = await get_player_id_by_game_by_user(project.id, user_id, db)
-        if player is not None and player.is_game_master:
-            role = "game_master"
-
     return RecentGameResponse(
         id=project.id,
-        role=role,
+        role=dashboard.roles.get(project.id),
         game_name=project.name,
         client_name=project.client_name,
         visibility=project.visibility,
         online_date=project.start_time,
         game_type=project.game_type,
         playing_type=project.playing_type,
-        total_players=total_players,
-        groups=[
-            GroupResponse(
-                id=group.id,
-                name=group.name,
-                managers=await _process_group_managers(group, users, db),
-                arenas=[
-                    ArenaResponse(
-                        id=arena.id,
-                        name=arena.name
-                    ) for arena in (await get_arenas_by_group(group.id, db))
-                ]
-            ) for group in (await get_groups_by_game(project.id, db))
-        ]
+        total_players=dashboard.counters[project.id]["session_players"],
+        groups=_process_project_groups(project, dashboard)
     )
 
 
 async def space_user(db: AsyncSession, user_id: str, org_id: str):
     """
-    Comprehensive admin space retrieval with concurrent processing.
+    Comprehensive admin space retrieval for a non-admin user.
+
+    The event, favorite and recent projects are fetched first, then every
+    counter, role, group, arena and manager they need is loaded at once so
+    the number of queries does not grow with the number of projects.
 
     :param db: Database session
     :param user_id: User identifier
     :param org_id: Organization identifier
     :return: AdminSpaceClientResponse
     """
-    # Await all concurrent tasks
-    # projects, favorite_projects, recent_projects = await asyncio.gather(
-    #     projects_coro,
-    #     favorite_projects_coro,
-    #     recent_projects_coro
-    # )
-
     project = await get_next_game_by_org_by_user(org_id=org_id, user_id=user_id, session=db)
-    favorite_projects = await fetch_favorite_projects(db, user_id)
-    recent_projects = await fetch_recent_projects(db, org_id, user_id)
-
-    # Process project events
-    if project:
-        role = await get_user_role_in_game_by_org(org_id, user_id, project.id, db)
-        if role == "player":
-            player = await get_player_id_by_game_by_user(project.id, user_id, db)
-            if player is not None and player.is_game_master:
-                role = "game_master"
-        events = [await _process_single_event(db, project, role)]
-    else:
-        events = []
+    favorite_projects = await get_favorite_projects_by_user(user_id, db)
+    recent_projects = await get_recent_projects_by_org_by_user(org_id, user_id, db)
+
+    events = [project] if project else []
+    dashboard = await _load_dashboard(db, [*events, *favorite_projects, *recent_projects], user_id)
 
     return AdminSpaceClientResponse(
-        events=events,
-        favorite_games=favorite_projects,
-        recent_games=recent_projects
+        events=[_process_single_event(event, dashboard) for event in events],
+        favorite_games=[_process_favorite_project(fav_project, dashboard) for fav_project in favorite_projects],
+        recent_games=[_process_recent_project(recent_project, dashboard) for recent_project in recent_projects]
     )
@@ -8,6 +8,8 @@ from starlette import status
 from app.models import Arena
 from app.payloads.request import ArenaUpdateRequest
 from app.repositories.get_arena_by_id import get_arena_by_id
+from app.repositories.get_game_ids_by_arena import get_game_ids_by_arena
+from app.services.game_view_cache import bump_game_versions
 
 
 async def update_arena(db: AsyncSession, arena_id: UUID, arena_request: ArenaUpdateRequest, org_id: str) -> Arena:
@@ -40,7 +42,9 @@ async def update_arena(db: AsyncSession, arena_id: UUID, arena_request: ArenaUpd
             arena.name = arena_request.name
 
         # Commit the changes
+        game_ids = await get_game_ids_by_arena(arena.id, db)
         await db.commit()
+        await bump_game_versions(game_ids)
         await db.refresh(arena)
         return arena
     except ValueError as e:
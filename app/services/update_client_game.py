@@ -1,15 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
-from app.models import Project
 import logging
 
 from app.payloads.request.GameUpdateRequest import GameUpdateRequest
 from app.payloads.response.GameConfigResponse import GameConfigResponse
+from app.repositories.get_game_by_id import get_game_by_id
+from app.services.game_view_cache import bump_game_versions
 
 logger = logging.getLogger(__name__)
 
-def update_client_game(
-    db: Session,
+async def update_client_game(
+    db: AsyncSession,
     org_id: str,
     project_id: str,
     update_data: GameUpdateRequest
@@ -23,11 +24,7 @@ def update_client_game(
     :return: Updated project as ProjectResponse schema
     """
     # Fetch the project by organisation ID and project ID
-    project = (
-        db.query(Project)
-        .filter(Project.organisation_code == org_id, Project.id == project_id)
-        .first()
-    )
+    project = await get_game_by_id(project_id, org_id, db)
 
     if not project:
         logger.warning(f"Project with ID {project_id} for organisation {org_id} not found.")
@@ -45,11 +42,12 @@ def update_client_game(
 
     try:
         # Commit changes to the database
-        db.commit()
-        db.refresh(project)
+        await db.commit()
+        await bump_game_versions([project_id])
+        await db.refresh(project)
 
         logger.info(f"Project with ID {project_id} updated successfully for organisation {org_id}.")
-        return GameConfigResponse.from_orm(project)
+        return GameConfigResponse.model_validate(project, from_attributes=True)
 
     except Exception as e:
         logger.error(f"Error updating project with ID {project_id} for organisation {org_id}: {e}")
@@ -1,17 +1,18 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException, status
 from app.models import ProjectComment
+from app.repositories.get_comment_by_id import get_comment_by_id as fetch_comment_by_id
 import logging
 
 from app.payloads.request.ProjectCommentUpdateRequest import ProjectCommentUpdateRequest
 
 logger = logging.getLogger(__name__)
 
-def get_comment_by_id(db: Session, comment_id: str) -> ProjectComment:
+async def get_comment_by_id(db: AsyncSession, comment_id: str) -> ProjectComment:
     """
     Retrieve a comment by ID.
     """
-    comment = db.query(ProjectComment).filter(ProjectComment.id == comment_id).first()
+    comment = await fetch_comment_by_id(comment_id, db)
     if not comment:
         logger.error(f"Comment with ID {comment_id} not found.")
         raise HTTPException(
@@ -31,14 +32,14 @@ def is_comment_owner(comment: ProjectComment, user_id: str) -> None:
             detail="You are not authorized to edit this comment.",
         )
 
-def update_comment(
-    db: Session, comment_id: str, updated_data: ProjectCommentUpdateRequest, user_id: str
+async def update_comment(
+    db: AsyncSession, comment_id: str, updated_data: ProjectCommentUpdateRequest, user_id: str
 ) -> ProjectComment:
     """
     Update an existing comment if the user is the owner.
     """
     # Retrieve the comment
-    comment = get_comment_by_id(db, comment_id)
+    comment = await get_comment_by_id(db, comment_id)
 
     # Check ownership
     is_comment_owner(comment, user_id)
@@ -47,9 +48,8 @@ def update_comment(
     if updated_data.comment_text is not None:
         comment.comment_text = updated_data.comment_text
 
-    # Commit changes and refresh
-    db.commit()
-    db.refresh(comment)
+    # Commit changes, the likes were loaded with the comment
+    await db.commit()
 
     logger.info(f"Comment with ID {comment_id} updated by user {user_id}.")
     return comment
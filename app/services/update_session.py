@@ -1,10 +1,13 @@
 import logging
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from app.models import ArenaSession
 from app.payloads.request import SessionUpdateRequest
+from app.repositories.get_players_by_session import get_players_by_session
 from app.services.get_session import get_session
+from app.services.game_view_cache import bump_game_versions
+from app.services.user_game_membership import sync_user_game_memberships
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -31,7 +34,7 @@ def validate_session_update(session: SessionUpdateRequest):
     return True
 
 
-def update_session(db: Session, session_id: str, session: SessionUpdateRequest, org_id: str):
+async def update_session(db: AsyncSession, session_id: str, session: SessionUpdateRequest, org_id: str):
     """
     Updates the session with the given details.
 
@@ -52,7 +55,7 @@ def update_session(db: Session, session_id: str, session: SessionUpdateRequest,
         validate_session_update(session)
 
         # Retrieve the session to be updated
-        db_session = get_session(db, session_id, org_id)
+        db_session = await get_session(db, session_id, org_id)
         if not db_session:
             logger.warning(f"Session {session_id} not found for organization {org_id}.")
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
@@ -64,18 +67,31 @@ def update_session(db: Session, session_id: str, session: SessionUpdateRequest,
         db_session.access_status = session.access_status
         db_session.session_status = session.session_status
         db_session.view_access = session.view_access
+        previous_project_id = db_session.project_id
         db_session.project_id = session.project_id
 
+        # The players and the moderator follow the session to its game
+        project_id = str(db_session.project_id) if db_session.project_id else None
+        if previous_project_id != project_id:
+            players = await get_players_by_session(session_id, db)
+            await sync_user_game_memberships(
+                db, [player.user_id for player in players] + [db_session.super_game_master_id],
+                [previous_project_id, project_id])
+
         # Commit the changes to the database
-        db.commit()
+        await db.commit()
+        await bump_game_versions([previous_project_id, project_id])
 
         logger.info(f"Session {session_id} successfully updated for organization {org_id}.")
         return db_session
 
+    except HTTPException:
+        raise
+
     except SQLAlchemyError as e:
         # Log database errors and rollback transaction
         logger.error(f"Database error while updating session {session_id}: {str(e)}")
-        db.rollback()  # Rollback in case of an error
+        await db.rollback()  # Rollback in case of an error
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Error updating session.")
 
     except Exception as e:
@@ -0,0 +1,72 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class UserBatcher:
+    """
+    Collect the keys of concurrent lookups and resolve them with one bulk call.
+
+    Keys are gathered for `window` seconds after the first lookup, or until
+    `max_batch` keys are pending, then a single bulk call is made and every
+    waiting caller receives the values of the keys it asked for.
+    """
+
+    def __init__(self, fetch: Callable[[list], Awaitable[dict | None]], window: float, max_batch: int):
+        self.fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self._keys: dict[Hashable, None] = dict()
+        self._waiters: list[tuple[list, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def load_many(self, keys: list) -> dict[Hashable, Any] | None:
+        """
+        Resolve keys together with the other lookups of the current window.
+
+        :param keys: The keys to resolve
+        :return: The values of the found keys, None when the bulk call failed
+        """
+        if self.window <= 0:
+            return await self.fetch(keys)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append((keys, future))
+        self._keys.update(dict.fromkeys(keys))
+
+        if len(self._keys) >= self.max_batch:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._dispatch)
+
+        return await future
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        keys, waiters = list(self._keys), self._waiters
+        self._keys, self._waiters = dict(), []
+
+        task = asyncio.get_running_loop().create_task(self._flush(keys, waiters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, keys: list, waiters: list[tuple[list, asyncio.Future]]):
+        try:
+            values = await self.fetch(keys)
+        except Exception as e:
+            for _, future in waiters:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for waiter_keys, future in waiters:
+            if future.done():
+                continue
+            if values is None:
+                future.set_result(None)
+            else:
+                future.set_result({key: values[key] for key in waiter_keys if key in values})
@@ -0,0 +1,86 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterable
+
+# Marks keys the user service answered without a user
+_MISSING = object()
+
+
+class UserCache:
+    """
+    In-process LRU cache with a time to live per entry.
+
+    Keys the user service does not know about are kept as negative entries,
+    with their own (usually shorter) time to live, so unknown ids are not
+    requested again on every call.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, keys: Iterable[Hashable]) -> tuple[dict[Hashable, Any], list[Hashable]]:
+        """
+        Look up many keys at once.
+
+        :param keys: The keys to look up, duplicates are ignored
+        :return: The cached values of the known keys and the keys to fetch
+        """
+        found = dict()
+        missing = []
+        now = time.monotonic()
+        for key in dict.fromkeys(keys):
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                missing.append(key)
+                continue
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if entry[1] is not _MISSING:
+                found[key] = entry[1]
+        return found, missing
+
+    def set_many(self, values: dict[Hashable, Any], requested: Iterable[Hashable] = ()):
+        """
+        Store fetched values, the requested keys without a value are stored as negative entries.
+
+        :param values: The fetched values by key
+        :param requested: The keys that were requested
+        """
+        if self.max_size <= 0:
+            return
+
+        now = time.monotonic()
+        for key, value in values.items():
+            self._store(key, (now + self.ttl, value))
+        for key in requested:
+            if key not in values:
+                self._store(key, (now + self.negative_ttl, _MISSING))
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _store(self, key: Hashable, entry: tuple[float, Any]):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,74 @@
+import uuid
+from typing import Iterable
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UserGameMembership
+from app.repositories.get_game_memberships_from_sources import get_game_memberships_from_sources
+
+# Rows per multi-row INSERT of the rebuild
+MEMBERSHIP_INSERT_CHUNK_SIZE = 1000
+
+
+def _membership_rows(memberships) -> list[dict]:
+    return [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": membership.user_id,
+            "project_id": membership.project_id,
+            "organisation_code": membership.organisation_code,
+            "role": membership.role,
+            "is_game_master": bool(membership.is_game_master),
+        }
+        for membership in memberships
+    ]
+
+
+async def sync_user_game_memberships(
+        db: AsyncSession, user_ids: Iterable[str | None], project_ids: Iterable[str | None]
+):
+    """
+    Recompute the memberships of some users in some games from the group
+    managers, the session players and the session moderators.
+
+    Called by the write paths changing those rows after their changes and
+    before their commit, so the memberships commit with them. The caller commits.
+
+    Args:
+        db (AsyncSession): The database session.
+        user_ids (Iterable[str | None]): The users whose membership may have changed, None ids are ignored.
+        project_ids (Iterable[str | None]): The games in which it may have changed, None ids are ignored.
+    """
+    user_ids = list({user_id for user_id in user_ids if user_id})
+    project_ids = list({project_id for project_id in project_ids if project_id})
+    if not user_ids or not project_ids:
+        return
+
+    await db.execute(
+        delete(UserGameMembership)
+        .where(UserGameMembership.user_id.in_(user_ids), UserGameMembership.project_id.in_(project_ids))
+        .execution_options(synchronize_session=False)
+    )
+    memberships = await get_game_memberships_from_sources(db, user_ids, project_ids)
+    if memberships:
+        await db.execute(insert(UserGameMembership), _membership_rows(memberships))
+
+
+async def rebuild_user_game_memberships(db: AsyncSession) -> int:
+    """
+    Rebuild the whole membership table from the group managers, the session
+    players and the session moderators, in one transaction.
+
+    Args:
+        db (AsyncSession): The database session.
+
+    Returns:
+        int: The number of memberships.
+    """
+    await db.execute(delete(UserGameMembership).execution_options(synchronize_session=False))
+    rows = _membership_rows(await get_game_memberships_from_sources(db))
+    for i in range(0, len(rows), MEMBERSHIP_INSERT_CHUNK_SIZE):
+        await db.execute(insert(UserGameMembership), rows[i:i + MEMBERSHIP_INSERT_CHUNK_SIZE])
+    await db.commit()
+    return len(rows)
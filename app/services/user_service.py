@@ -7,39 +7,99 @@ import logging
 
 logger = logging.getLogger(__name__)
 from app.payloads.response.UserResponse import UserResponse
+from app.services.user_batcher import UserBatcher
+from app.services.user_cache import UserCache
+
+# Connection pool settings of the shared client, one pool per worker
+USER_SERVICE_MAX_CONNECTIONS = int(os.getenv("USER_SERVICE_MAX_CONNECTIONS", "100"))
+USER_SERVICE_MAX_KEEPALIVE = int(os.getenv("USER_SERVICE_MAX_KEEPALIVE", "20"))
+USER_SERVICE_KEEPALIVE_EXPIRY = float(os.getenv("USER_SERVICE_KEEPALIVE_EXPIRY", "30"))
+USER_SERVICE_CONNECT_TIMEOUT = float(os.getenv("USER_SERVICE_CONNECT_TIMEOUT", "5"))
+USER_SERVICE_READ_TIMEOUT = float(os.getenv("USER_SERVICE_READ_TIMEOUT", "10"))
+USER_SERVICE_HTTP2 = os.getenv("USER_SERVICE_HTTP2", "false").lower() in ("1", "true", "yes")
+
+# User profile cache settings, a size of 0 disables the cache
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+USER_CACHE_TTL = float(os.getenv("USER_CACHE_TTL", "300"))
+USER_CACHE_NEGATIVE_TTL = float(os.getenv("USER_CACHE_NEGATIVE_TTL", "60"))
+
+# Id lookups of concurrent requests are sent together, a window of 0 disables the batching
+USER_BATCH_WINDOW_MS = float(os.getenv("USER_BATCH_WINDOW_MS", "3"))
+USER_BATCH_MAX_SIZE = int(os.getenv("USER_BATCH_MAX_SIZE", "200"))
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """
+    Build the pooled HTTP client used to reach the user service.
+
+    HTTP/2 needs the optional `h2` package, without it the client stays on HTTP/1.1.
+    """
+    http2 = USER_SERVICE_HTTP2
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            logger.warning("USER_SERVICE_HTTP2 is enabled but the h2 package is not installed, using HTTP/1.1")
+            http2 = False
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=USER_SERVICE_MAX_CONNECTIONS,
+            max_keepalive_connections=USER_SERVICE_MAX_KEEPALIVE,
+            keepalive_expiry=USER_SERVICE_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            USER_SERVICE_READ_TIMEOUT,
+            connect=USER_SERVICE_CONNECT_TIMEOUT,
+        ),
+    )
 
 
 class UserServiceClient:
-    def __init__(self):
+    def __init__(self, client: httpx.AsyncClient | None = None):
         self.base_url = f'{os.getenv("CLIENTAUTH_API")}/api/v1'
+        self.client = client or _create_http_client()
+        # Profiles of the bulk lookups, only the ids and emails that miss are requested
+        self.users_by_id = UserCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL, USER_CACHE_NEGATIVE_TTL)
+        self.users_by_email = UserCache(USER_CACHE_MAX_SIZE, USER_CACHE_TTL, USER_CACHE_NEGATIVE_TTL)
+        self.id_batcher = UserBatcher(self._fetch_users_by_id, USER_BATCH_WINDOW_MS / 1000, USER_BATCH_MAX_SIZE)
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        return {
+            "users_by_id": self.users_by_id.stats(),
+            "users_by_email": self.users_by_email.stats(),
+        }
 
     async def get_user_by_email(self, email: str) -> UserResponse | None:
         url = f"{self.base_url}/users/email/{email}"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
-                if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
-                    data = response.json()
-                    full_name = data.get("name",
-                                         "").strip()  # Ensure we handle empty or invalid full_name gracefully
-                    if " " in full_name:
-                        first_name, last_name = full_name.split(" ", 1)  # Split only on the first space
-                    else:
-                        first_name = full_name  # If only one name is provided, treat it as the first name
-                        last_name = None  # No last name in this case
+            response = await self.client.get(url)
+            response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
+            if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
+                data = response.json()
+                full_name = data.get("name",
+                                     "").strip()  # Ensure we handle empty or invalid full_name gracefully
+                if " " in full_name:
+                    first_name, last_name = full_name.split(" ", 1)  # Split only on the first space
+                else:
+                    first_name = full_name  # If only one name is provided, treat it as the first name
+                    last_name = None  # No last name in this case
 
-                    return UserResponse(
-                        user_id=data.get("user_id", None),
-                        email=data.get("email", None),
-                        user_email=data.get("email", None),
-                        username=data.get("username", None),
-                        full_name=full_name,
-                        user_name=full_name,  # Still use full_name here
-                        first_name=first_name,
-                        last_name=last_name,
-                    )
-                return None
+                return UserResponse(
+                    user_id=data.get("user_id", None),
+                    email=data.get("email", None),
+                    user_email=data.get("email", None),
+                    username=data.get("username", None),
+                    full_name=full_name,
+                    user_name=full_name,  # Still use full_name here
+                    first_name=first_name,
+                    last_name=last_name,
+                )
+            return None
         except httpx.RequestError as e:
             logger.error(f"Error connecting to user service: {str(e)}")
             return None
@@ -48,107 +108,115 @@ class UserServiceClient:
             return None
 
     async def get_users_by_email(self, emails: list[str]) -> dict[str, UserResponse]:
+        items, missing = self.users_by_email.get_many(emails)
+        if missing:
+            fetched = await self._fetch_users_by_email(missing)
+            if fetched is not None:
+                # The user service may answer with another casing of the requested email
+                known = {email.lower() for email in fetched if email}
+                self.users_by_email.set_many(
+                    fetched, [email for email in missing if email and email.lower() not in known]
+                )
+                items.update(fetched)
+        return items
+
+    async def _fetch_users_by_email(self, emails: list[str]) -> dict[str, UserResponse] | None:
         items = dict()
         url = f"{self.base_url}/users/bulk/emails"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json={'email': emails})
-                response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
-                if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
-                    data = response.json()
-                    users = data.get("users", [])  # Ensure we handle empty or invalid users gracefully
-                    for user in users:
-                        full_name = user.get("name",
-                                             "").strip()  # Ensure we handle empty or invalid full_name gracefully
-                        if " " in full_name:
-                            first_name, last_name = full_name.split(" ", 1)  # Split only on the first space
-                        else:
-                            first_name = full_name  # If only one name is provided, treat it as the first name
-                            last_name = None  # No last name in this case
-
-                        items[user.get('email')] = UserResponse(
-                            user_id=user.get("user_id", None),
-                            email=user.get("email", None),
-                            user_email=user.get("email", None),
-                            username=user.get("username", None),
-                            full_name=full_name,
-                            user_name=full_name,  # Still use full_name here
-                            first_name=first_name,
-                            last_name=last_name)
-                return items
+            response = await self.client.post(url, json={'email': emails})
+            response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
+            if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
+                data = response.json()
+                users = data.get("users", [])  # Ensure we handle empty or invalid users gracefully
+                for user in users:
+                    full_name = user.get("name",
+                                         "").strip()  # Ensure we handle empty or invalid full_name gracefully
+                    if " " in full_name:
+                        first_name, last_name = full_name.split(" ", 1)  # Split only on the first space
+                    else:
+                        first_name = full_name  # If only one name is provided, treat it as the first name
+                        last_name = None  # No last name in this case
+
+                    items[user.get('email')] = UserResponse(
+                        user_id=user.get("user_id", None),
+                        email=user.get("email", None),
+                        user_email=user.get("email", None),
+                        username=user.get("username", None),
+                        full_name=full_name,
+                        user_name=full_name,  # Still use full_name here
+                        first_name=first_name,
+                        last_name=last_name)
+            return items
         except httpx.RequestError as e:
             logger.error(f"Error connecting to user service: {str(e)}")
-            return items
+            return None
         except httpx.HTTPStatusError as e:
             logger.error(f"User service error: {response.json().get('detail', str(e))}")
-            return items
+            return None
 
     async def get_users_by_id(self, ids: list[str]) -> dict[str, UserResponse]:
+        items, missing = self.users_by_id.get_many(ids)
+        if missing:
+            fetched = await self.id_batcher.load_many(missing)
+            if fetched is not None:
+                self.users_by_id.set_many(fetched, missing)
+                items.update(fetched)
+        return items
+
+    async def _fetch_users_by_id(self, ids: list[str]) -> dict[str, UserResponse] | None:
         items = dict()
         url = f"{self.base_url}/users/bulk/ids"
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json={'user_id': ids})
-                response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
-                if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
-                    data = response.json()
-                    users = data.get("users", [])  # Ensure we handle empty or invalid users gracefully
-                    for user in users:
-                        first_name = user.get("first_name", "")  # If only one name is provided, treat it as the first name
-                        last_name = user.get("last_name", "")  # No last name in this case
-
-                        items[user.get('user_id')] = UserResponse(
-                            user_id=user.get("user_id", None),
-                            email=user.get("email", None),
-                            user_email=user.get("email", None),
-                            username=user.get("username", None),
-                            full_name=f"{first_name} {last_name}".strip(),
-                            user_name=f"{first_name} {last_name}".strip(),  # Still use full_name here
-                            first_name=first_name,
-                            last_name=last_name)
-                return items
+            response = await self.client.post(url, json={'user_id': ids})
+            response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
+            if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
+                data = response.json()
+                users = data.get("users", [])  # Ensure we handle empty or invalid users gracefully
+                for user in users:
+                    first_name = user.get("first_name", "")  # If only one name is provided, treat it as the first name
+                    last_name = user.get("last_name", "")  # No last name in this case
+
+                    items[user.get('user_id')] = UserResponse(
+                        user_id=user.get("user_id", None),
+                        email=user.get("email", None),
+                        user_email=user.get("email", None),
+                        username=user.get("username", None),
+                        full_name=f"{first_name} {last_name}".strip(),
+                        user_name=f"{first_name} {last_name}".strip(),  # Still use full_name here
+                        first_name=first_name,
+                        last_name=last_name)
+            return items
         except httpx.RequestError as e:
             logger.error(f"Error connecting to user service: {str(e)}")
-            return items
+            return None
         except httpx.HTTPStatusError as e:
             logger.error(f"User service error: {response.json().get('detail', str(e))}")
-            return items
+            return None
 
     async def get_user_by_id(self, code: str) -> UserResponse | None:
-        url = f"{self.base_url}/users/{code}"
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()  # Raise HTTP exceptions for 4xx/5xx responses
-                if response.status_code == 200 or response.status_code == 201 or response.status_code == 202:
-                    data = response.json()
+        # Single lookups share the cache and the bulk batches of get_users_by_id
+        return (await self.get_users_by_id([code])).get(code)
 
-                    full_name = data.get("name",
-                                         "").strip()  # Ensure we handle empty or invalid full_name gracefully
-                    if " " in full_name:
-                        first_name, last_name = full_name.split(" ", 1)  # Split only on the first space
-                    else:
-                        first_name = full_name  # If only one name is provided, treat it as the first name
-                        last_name = None  # No last name in this case
 
-                    return UserResponse(
-                        user_id=data.get("user_id"),
-                        email=data.get("email", None),
-                        user_email=data.get("email"),
-                        username=data.get("username"),
-                        full_name=full_name,
-                        user_name=full_name,  # Still use full_name here
-                        first_name=first_name,
-                        last_name=last_name,
-                    )
-                return None
-        except httpx.RequestError as e:
-            logger.error(f"Error connecting to user service: {str(e)}")
-            return None
-        except httpx.HTTPStatusError as e:
-            logger.error(f"User service error: {str(e)}")
-            return None
+_user_service: UserServiceClient | None = None
+
+
+async def close_user_service():
+    """
+    Close the shared user service client and its pooled connections.
+    """
+    global _user_service
+    if _user_service is not None:
+        await _user_service.aclose()
+        _user_service = None
 
 
 def get_user_service() -> UserServiceClient:
-    return UserServiceClient()
+    """
+    Return the shared user service client of the worker, created on first use.
+    """
+    global _user_service
+    if _user_service is None:
+        _user_service = UserServiceClient()
+    return _user_service
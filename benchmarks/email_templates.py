@@ -0,0 +1,45 @@
+"""
+Micro-benchmark of the invitation email rendering.
+
+Compares the former rendering (read the file, one replace per placeholder,
+collapse the whitespace of the whole document) with the compiled templates
+of app.services.email_templates.
+
+Usage: python benchmarks/email_templates.py [renders]
+"""
+import os
+import re
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.email_templates import MAILS_PATH, TEMPLATE_INVITE_PLAYER, compile_template, render_template
+
+CONTEXT = {
+    "[Recipient Name]": "Jane Doe",
+    "[OrgName]": "acme",
+    "[Your CTA URL]": "https://acme.gamitool.com/game/7d1f/invite?token=0b5e",
+    "[GAME_NAME]": "Escape Room",
+}
+
+
+def render_legacy(template: str, context: dict[str, str]) -> str:
+    with open(os.path.join(MAILS_PATH, template), "r", encoding="utf-8") as file:
+        template_content = file.read()
+    for placeholder, value in context.items():
+        template_content = template_content.replace(placeholder, value)
+    return re.sub(r"\s+", " ", template_content).strip()
+
+
+def main(renders: int):
+    compile_template(TEMPLATE_INVITE_PLAYER)
+    assert render_legacy(TEMPLATE_INVITE_PLAYER, CONTEXT) == render_template(TEMPLATE_INVITE_PLAYER, CONTEXT)
+
+    for name, render in (("legacy", render_legacy), ("compiled", render_template)):
+        seconds = min(timeit.repeat(lambda: render(TEMPLATE_INVITE_PLAYER, CONTEXT), number=renders, repeat=5))
+        print(f"{name:>8}: {seconds / renders * 1e6:8.2f} us per render ({renders} renders)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -2,6 +2,7 @@ import mimetypes
 import os
 import sys
 import traceback
+from contextlib import asynccontextmanager
 from http.client import HTTPResponse
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -17,19 +18,28 @@ from app.repositories.get_session_by_id_only import get_session_by_id_only
 from app.services.game_view_user import _process_session_players_for_moderator
 from app.services.get_com_session_players_service import get_com_session_players_service
 from app.services.progress_invitation_service import progress_invitation_service
-from app.services.user_service import get_user_service
+from app.services.user_game_membership import rebuild_user_game_memberships
+from app.services.game_view_cache import get_game_view_cache
+from app.services.email_outbox_worker import start_email_outbox_worker, stop_email_outbox_worker
+from app.services.email_templates import load_templates
+from app.services.organisation_service import close_organisation_service
+from app.services.user_service import get_user_service, close_user_service
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from fastapi import FastAPI, Depends, status, HTTPException
+from fastapi import FastAPI, Depends, status, HTTPException, Header
 from app.routers import project
 from app.routers import arena
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from fastapi.openapi.utils import get_openapi
 from sqlalchemy import text
-from app.database import get_db_async, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME
+from app.database import get_db_async, get_db_read_async, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT, DB_NAME, \
+    warm_up_pool, dispose_pool, get_pool_stats
+from app.middlewares.ETagMiddleware import ETagMiddleware
+from app.middlewares.ReadYourWritesMiddleware import ReadYourWritesMiddleware
+from app.pagination import NEXT_CURSOR_HEADER
 from alembic.config import Config
 from alembic import command
 from fastapi.middleware.cors import CORSMiddleware
@@ -56,7 +66,24 @@ print("Change tmp folder for uploading file")
 # actualy he take the file in memory only
 tempfile.tempdir = "/app/tmp_uploads"
 
-app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    # Database connections are opened before the first requests come in
+    await warm_up_pool()
+    # One pooled user service client per worker, closed with the worker
+    get_user_service()
+    # Invitation emails are rendered from templates compiled once, and delivered from the outbox in the background
+    load_templates()
+    start_email_outbox_worker()
+    yield
+    await stop_email_outbox_worker()
+    await close_user_service()
+    await close_organisation_service()
+    await dispose_pool()
+
+
+app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None, lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -64,7 +91,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
+# Clients that just wrote read from the primary until the replica caught up
+app.add_middleware(ReadYourWritesMiddleware)
+# Polling clients sending back the ETag of their copy get a 304 while it did not change
+app.add_middleware(ETagMiddleware)
 
 
 # @app.post("/create-folder")
@@ -136,8 +168,26 @@ async def generate_migrations():
         )
 
 
+@app.post("/server/rebuild/user-game-membership")
+async def rebuild_user_game_membership(db: AsyncSession = Depends(get_db_async)):
+    """Endpoint to rebuild the user game membership table from the groups and the sessions."""
+    try:
+        memberships = await rebuild_user_game_memberships(db)
+
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={"message": "User game memberships rebuilt successfully", "memberships": memberships}
+        )
+
+    except Exception as e:
+        return JSONResponse(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            content={"message": f"User game membership rebuild failed: {e}"}
+        )
+
+
 @app.get("/com/check/session/{session_id}")
-async def check_session(session_id: str, db: AsyncSession = Depends(get_db_async)):
+async def check_session(session_id: str, db: AsyncSession = Depends(get_db_read_async)):
     """Check if a session exists."""
     try:
         session = await get_session_by_id_only(session_id, db)
@@ -152,7 +202,7 @@ async def check_session(session_id: str, db: AsyncSession = Depends(get_db_async
 
 
 @app.get("/com/check/game/{db_index}/{player_id}")
-async def check_player(db_index: str, player_id: str, db: AsyncSession = Depends(get_db_async)):
+async def check_player(db_index: str, player_id: str, db: AsyncSession = Depends(get_db_read_async)):
     """Check if a session exists."""
     try:
         player = await get_player_by_session_by_id_only(db_index, player_id, db)
@@ -167,7 +217,7 @@ async def check_player(db_index: str, player_id: str, db: AsyncSession = Depends
 
 
 @app.get("/com/game/{db_index}/players", response_model=list[GameSessionPlayerResponse])
-async def get_players(db_index: str, db: AsyncSession = Depends(get_db_async)):
+async def get_players(db_index: str, db: AsyncSession = Depends(get_db_read_async)):
     try:
         return await get_com_session_players_service(db_index, db)
     except Exception as exc:
@@ -182,10 +232,11 @@ async def get_players(db_index: str, db: AsyncSession = Depends(get_db_async)):
 
 
 @app.post("/webhook/invitation/progress")
-async def progress_invitation(data: WebhookInvitationProgressRequest, db: AsyncSession = Depends(get_db_async)):
+async def progress_invitation(data: WebhookInvitationProgressRequest, db: AsyncSession = Depends(get_db_async),
+                              idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
     """Endpoint to run Alembic migrations."""
     try:
-        return await progress_invitation_service(db, data)
+        return await progress_invitation_service(db, data, idempotency_key)
     except Exception as e:
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -218,6 +269,24 @@ async def health_game(db: AsyncSession = Depends(get_db_async)):
         )
 
 
+@app.get("/server/cache/users", response_model=Dict[str, Any])
+async def user_cache_stats():
+    """Hit, miss and eviction counters of the user profile cache."""
+    return get_user_service().cache_stats()
+
+
+@app.get("/server/cache/game-view", response_model=Dict[str, Any])
+async def game_view_cache_stats():
+    """Size, hit, miss and eviction counters of the game view cache."""
+    return get_game_view_cache().stats()
+
+
+@app.get("/server/pool/db", response_model=Dict[str, Any])
+async def db_pool_stats():
+    """Connections, checkouts, overflow and checkout wait times of the database pools."""
+    return get_pool_stats()
+
+
 app.include_router(project.client_router, tags=["Client Apis"])
 app.include_router(project.admin_router, tags=["Orchestrator Apis"])
 app.include_router(arena.router, tags=["Orchestrator Apis", "Client Apis"])
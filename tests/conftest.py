@@ -1,39 +1,105 @@
+import asyncio
+import os
 import sys
-sys.path.append('/app')
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import jwt
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.database import Base, get_db
+from sqlalchemy.pool import NullPool
+
+# Taken before main points the temporary files to the upload folder of the container
+TEST_TMP_DIR = tempfile.gettempdir()
+
+import app.services.user_service as user_service
+from app.database import Base, get_db_async, get_db_read_async
 from main import app
 from fastapi.testclient import TestClient
 
+# Claims of the requests of the tests, overridden per request with the auth fixture
+ORG_ID = "org-test"
+USER_ID = "11111111-1111-1111-1111-111111111111"
+
+
+class FakeUserService:
+    """
+    Stand-in of the user service client, every user is unknown to it.
+    """
+
+    async def get_users_by_id(self, ids):
+        return {}
+
+    async def get_user_by_id(self, user_id):
+        return None
+
+    async def get_users_by_email(self, emails):
+        return {}
+
+    async def get_user_by_email(self, email):
+        return None
+
+
+# SQLite database file for testing, shared by the sync session of the tests and the async sessions of the app
+@pytest.fixture(scope="function")
+def database_path():
+    with tempfile.TemporaryDirectory(dir=TEST_TMP_DIR) as directory:
+        path = os.path.join(directory, "test.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+        yield path
 
-# SQLite in-memory database for testing
-SQLITE_TEST_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(SQLITE_TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Fixture for setting up the database
+# Fixture for seeding and checking the database
 @pytest.fixture(scope="function")
-def db_session():
-    Base.metadata.create_all(bind=engine)
+def db_session(database_path):
+    engine = create_engine(f"sqlite:///{database_path}")
+    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
     db = TestingSessionLocal()
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
 
-# Override FastAPI's dependency for `get_db`
+
+# Async sessions on the test database, as given to the app by get_db_async
+@pytest.fixture(scope="function")
+def async_session_factory(database_path):
+    # Without pooling every request opens its connection on the event loop it runs on
+    engine = create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
+    yield sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture(autouse=True)
+def fake_user_service(monkeypatch):
+    monkeypatch.setattr(user_service, "_user_service", FakeUserService())
+
+
+# Override FastAPI's database dependencies with the async SQLite sessions
 @pytest.fixture(scope="function")
-def client(db_session):
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
-
-    app.dependency_overrides[get_db] = override_get_db
-    with TestClient(app) as c:
-        yield c
+def client(async_session_factory):
+    async def override_get_db():
+        async with async_session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db_async] = override_get_db
+    app.dependency_overrides[get_db_read_async] = override_get_db
+    # Not entered as a context manager, the lifespan would connect to the MySQL database
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+# Headers authenticating a request as a user of an organisation
+@pytest.fixture
+def auth():
+    def headers(user_id: str = USER_ID, org_id: str = ORG_ID) -> dict:
+        # The claims are read without verifying the signature
+        token = jwt.encode({"uid": user_id, "org_id": org_id}, "secret-of-the-tests-signing-tokens", algorithm="HS256")
+        return {"Authorization": f"Bearer {token}"}
+
+    return headers
@@ -0,0 +1,53 @@
+import uuid
+
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.models import Arena, ArenaSession, ArenaSessionPlayers, Group, GroupArenas
+from conftest import ORG_ID
+
+
+def add_arena(db_session, org_id=ORG_ID):
+    arena = Arena(id=str(uuid.uuid4()), name="Arena", organisation_code=org_id)
+    group = Group(id=str(uuid.uuid4()), name="Group", organisation_code=org_id)
+    db_session.add_all([arena, group, GroupArenas(group_id=group.id, arena_id=arena.id)])
+    db_session.commit()
+    return arena
+
+
+def test_show_arena_by_game(client, db_session, auth):
+    arena = add_arena(db_session)
+    game_id, other_game_id = str(uuid.uuid4()), str(uuid.uuid4())
+    session = ArenaSession(id=str(uuid.uuid4()), organisation_code=ORG_ID, arena_id=arena.id, project_id=game_id,
+                           period_type=PeriodType.FREE, access_status=AccessStatus.AUTH,
+                           session_status=SessionStatus.PENDING, view_access=ViewAccess.ALL)
+    other_session = ArenaSession(id=str(uuid.uuid4()), organisation_code=ORG_ID, arena_id=arena.id,
+                                 project_id=other_game_id)
+    db_session.add_all([session, other_session,
+                        ArenaSessionPlayers(session_id=session.id, user_id="player-1", user_email="p1@example.com"),
+                        ArenaSessionPlayers(session_id=session.id, user_id="player-2", user_email="p2@example.com"),
+                        ArenaSessionPlayers(session_id=other_session.id, user_id="player-3")])
+    db_session.commit()
+
+    response = client.get(f"/arenas/{arena.id}/game/{game_id}", headers=auth())
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == arena.id
+    assert [s["id"] for s in data["sessions"]] == [session.id]
+    assert data["sessions"][0]["period_type"] == "free"
+    assert sorted(player["user_id"] for player in data["sessions"][0]["players"]) == ["player-1", "player-2"]
+
+
+def test_show_arena_by_game_of_another_organisation(client, db_session, auth):
+    arena = add_arena(db_session, org_id="other-org")
+
+    response = client.get(f"/arenas/{arena.id}/game/{uuid.uuid4()}", headers=auth())
+    assert response.status_code == 404
+
+
+def test_delete_arena(client, db_session, auth):
+    arena = add_arena(db_session)
+
+    response = client.delete(f"/arenas/{arena.id}", headers=auth())
+    assert response.status_code == 200
+    assert db_session.query(Arena).filter(Arena.id == arena.id).count() == 0
+    assert db_session.query(GroupArenas).filter(GroupArenas.arena_id == arena.id).count() == 0
+    assert db_session.query(Group).count() == 1
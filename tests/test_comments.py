@@ -0,0 +1,71 @@
+from app.models import ProjectComment
+from conftest import USER_ID
+
+
+def test_create_comment(client, db_session, auth):
+    response = client.post("/games/game-1/add-comment", json={"comment_text": "Nice game"}, headers=auth())
+    assert response.status_code == 200
+    data = response.json()
+    assert data["project_id"] == "game-1"
+    assert data["user_id"] == USER_ID
+    assert data["comment_text"] == "Nice game"
+    assert data["likes"] == []
+
+    assert db_session.get(ProjectComment, data["id"]).comment_text == "Nice game"
+
+
+def test_list_comments(client, db_session, auth):
+    for text in ("first", "second", "third"):
+        client.post("/games/game-1/add-comment", json={"comment_text": text}, headers=auth())
+    client.post("/games/game-2/add-comment", json={"comment_text": "other game"}, headers=auth())
+    db_session.add(ProjectComment(project_id="game-1", user_id=USER_ID, comment_text="hidden", visible=False))
+    db_session.commit()
+
+    response = client.get("/games/game-1/comments", headers=auth())
+    assert response.status_code == 200
+    assert sorted(comment["comment_text"] for comment in response.json()) == ["first", "second", "third"]
+
+
+def test_list_comments_by_page(client, auth):
+    for text in ("first", "second", "third"):
+        client.post("/games/game-1/add-comment", json={"comment_text": text}, headers=auth())
+
+    first = client.get("/games/game-1/comments", params={"limit": 2}, headers=auth())
+    assert len(first.json()) == 2
+    second = client.get("/games/game-1/comments", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+                        headers=auth())
+    assert len(second.json()) == 1
+    assert "X-Next-Cursor" not in second.headers
+    assert sorted(comment["comment_text"] for comment in first.json() + second.json()) == ["first", "second", "third"]
+
+
+def test_update_comment(client, db_session, auth):
+    comment_id = client.post("/games/game-1/add-comment", json={"comment_text": "Nice game"}, headers=auth()).json()["id"]
+
+    response = client.put(f"/comments/{comment_id}", json={"comment_text": "Great game"}, headers=auth())
+    assert response.status_code == 200
+    assert response.json()["comment_text"] == "Great game"
+    assert response.json()["updated_at"] is not None
+
+    assert db_session.get(ProjectComment, comment_id).comment_text == "Great game"
+
+
+def test_update_comment_of_another_user(client, db_session, auth):
+    comment_id = client.post("/games/game-1/add-comment", json={"comment_text": "Nice game"}, headers=auth()).json()["id"]
+
+    response = client.put(f"/comments/{comment_id}", json={"comment_text": "Bad game"}, headers=auth(user_id="other"))
+    assert response.status_code == 403
+    assert db_session.get(ProjectComment, comment_id).comment_text == "Nice game"
+
+
+def test_delete_comment(client, db_session, auth):
+    comment_id = client.post("/games/game-1/add-comment", json={"comment_text": "Nice game"}, headers=auth()).json()["id"]
+
+    response = client.delete(f"/comments/{comment_id}", headers=auth())
+    assert response.status_code == 204
+    assert db_session.get(ProjectComment, comment_id) is None
+
+
+def test_delete_missing_comment(client, auth):
+    response = client.delete("/comments/missing", headers=auth())
+    assert response.status_code == 404
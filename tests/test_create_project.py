@@ -1,18 +1,19 @@
-def test_like_comment(client):
-    response = client.post("/items/", json={"name": "Test Item", "description": "Test Description"})
-    assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == "Test Item"
-    assert data["description"] == "Test Description"
+from app.models import Project
 
-def test_read_item(client):
-    # Create an item
-    response = client.post("/items/", json={"name": "Test Item", "description": "Test Description"})
-    item_id = response.json()["id"]
 
-    # Read the item
-    response = client.get(f"/items/{item_id}")
+def test_create_project(client, db_session):
+    response = client.post("/projects", json={"name": "Test Game", "slug": "test-game", "organisation_code": "org-test"})
     assert response.status_code == 200
     data = response.json()
-    assert data["name"] == "Test Item"
-    assert data["description"] == "Test Description"
+    assert data["name"] == "Test Game"
+    assert data["slug"] == "test-game"
+
+    assert db_session.get(Project, data["id"]).organisation_code == "org-test"
+
+
+def test_create_project_with_taken_slug(client, db_session):
+    client.post("/projects", json={"name": "Test Game", "slug": "test-game"})
+
+    response = client.post("/projects", json={"name": "Other Game", "slug": "test-game"})
+    assert response.status_code == 400
+    assert db_session.query(Project).count() == 1
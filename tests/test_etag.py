@@ -0,0 +1,85 @@
+import uuid
+
+import pytest
+
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.middlewares.ETagMiddleware import etag_matches
+from app.models import Arena, ArenaSession, Project, UserGameMembership
+from app.services.game_view_cache import InMemoryGameViewCache, set_game_view_cache
+from conftest import ORG_ID, USER_ID
+
+CONFIG = {
+    "period_type": "range",
+    "start_time": "2025-01-01T10:00:00",
+    "end_time": "2025-01-01T12:00:00",
+    "access_status": "guest",
+    "session_status": "playing",
+    "view_access": "game",
+}
+
+
+@pytest.fixture(autouse=True)
+def game_view_cache():
+    cache = InMemoryGameViewCache(max_entries=100, max_bytes=1024 * 1024, ttl=60)
+    set_game_view_cache(cache)
+    yield cache
+    set_game_view_cache(None)
+
+
+def add_game(db_session):
+    project = Project(id=str(uuid.uuid4()), name="Game", slug=str(uuid.uuid4()), organisation_code=ORG_ID)
+    arena = Arena(id=str(uuid.uuid4()), name="Arena", organisation_code=ORG_ID)
+    session = ArenaSession(id=str(uuid.uuid4()), organisation_code=ORG_ID, arena_id=arena.id,
+                           project_id=project.id, period_type=PeriodType.FREE,
+                           access_status=AccessStatus.AUTH, session_status=SessionStatus.PENDING,
+                           view_access=ViewAccess.ALL)
+    membership = UserGameMembership(user_id=USER_ID, project_id=project.id, organisation_code=ORG_ID,
+                                    role="manager")
+    db_session.add_all([project, arena, session, membership])
+    db_session.commit()
+    return project, session
+
+
+def test_unchanged_sessions_are_not_modified(client, db_session, auth):
+    _, session = add_game(db_session)
+
+    first = client.get("/sessions?limit=1", headers=auth())
+    etag = first.headers["ETag"]
+    assert first.status_code == 200
+
+    second = client.get("/sessions?limit=1", headers=dict(auth(), **{"If-None-Match": etag}))
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+
+    client.put(f"/sessions/{session.id}/config", json=CONFIG, headers=auth())
+    third = client.get("/sessions?limit=1", headers=dict(auth(), **{"If-None-Match": etag}))
+    assert third.status_code == 200
+    assert third.headers["ETag"] != etag
+    assert third.json()[0]["session_status"] == "playing"
+
+
+def test_unchanged_game_view_is_answered_from_the_cache(client, db_session, auth, game_view_cache):
+    project, _ = add_game(db_session)
+
+    first = client.get(f"/game-view/{project.id}", headers=auth())
+    second = client.get(f"/game-view/{project.id}", headers=dict(auth(), **{"If-None-Match": first.headers["ETag"]}))
+    assert second.status_code == 304
+    assert (game_view_cache.hits, game_view_cache.misses) == (1, 1)
+
+
+def test_etag_of_another_user_is_not_matched(client, db_session, auth):
+    add_game(db_session)
+    etag = client.get("/sessions", headers=auth()).headers["ETag"]
+
+    response = client.get("/sessions", headers=dict(auth(org_id="other-org"), **{"If-None-Match": etag}))
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_if_none_match_comparison():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
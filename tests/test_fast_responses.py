@@ -0,0 +1,38 @@
+import uuid
+
+import pytest
+
+import app.responses as responses
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.models import Arena, ArenaSession, Project
+from conftest import ORG_ID
+
+
+def add_sessions(db_session, count=3):
+    project = Project(id=str(uuid.uuid4()), name="Gamé", slug=str(uuid.uuid4()), organisation_code=ORG_ID)
+    arena = Arena(id=str(uuid.uuid4()), name="Arena \"1\"", organisation_code=ORG_ID)
+    sessions = []
+    for _ in range(count):
+        sessions.append(ArenaSession(id=str(uuid.uuid4()), organisation_code=ORG_ID, arena_id=arena.id,
+                                     project_id=project.id, period_type=PeriodType.FREE,
+                                     access_status=AccessStatus.AUTH, session_status=SessionStatus.PENDING,
+                                     view_access=ViewAccess.ALL))
+    db_session.add_all([project, arena] + sessions)
+    db_session.commit()
+    return sessions
+
+
+@pytest.mark.parametrize("path", ["/sessions", "/sessions?limit=2", "/sessions/{session_id}", "/arenas",
+                                  "/arenas?limit=1"])
+def test_fast_responses_are_byte_compatible(client, db_session, auth, monkeypatch, path):
+    path = path.format(session_id=add_sessions(db_session)[0].id)
+
+    validated = client.get(path, headers=auth())
+    monkeypatch.setattr(responses, "FAST_JSON_RESPONSES", True)
+    fast = client.get(path, headers=auth())
+
+    assert validated.status_code == fast.status_code == 200
+    assert fast.content == validated.content
+    assert fast.headers["content-type"] == validated.headers["content-type"]
+    assert fast.headers.get("X-Next-Cursor") == validated.headers.get("X-Next-Cursor")
+    assert fast.headers["content-length"] == str(len(fast.content))
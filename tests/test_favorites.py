@@ -0,0 +1,53 @@
+from app.models import Project, ProjectFavorite
+from app.services import favorite_project
+from conftest import USER_ID
+
+
+def add_games(db_session, count):
+    games = [Project(name=f"Game {i}", slug=f"game-{i}", organisation_code="org-test") for i in range(count)]
+    db_session.add_all(games)
+    db_session.commit()
+    return games
+
+
+def test_list_favorites(client, db_session, auth):
+    games = add_games(db_session, 3)
+    db_session.add_all([ProjectFavorite(user_id=USER_ID, project_id=games[0].id),
+                        ProjectFavorite(user_id=USER_ID, project_id=games[2].id),
+                        ProjectFavorite(user_id="other", project_id=games[1].id)])
+    db_session.commit()
+
+    response = client.get(f"/users/{USER_ID}/favorites", headers=auth())
+    assert response.status_code == 200
+    assert sorted(game["id"] for game in response.json()) == sorted([games[0].id, games[2].id])
+
+
+def test_list_favorites_by_page(client, db_session, auth):
+    games = add_games(db_session, 3)
+    db_session.add_all([ProjectFavorite(user_id=USER_ID, project_id=game.id) for game in games])
+    db_session.commit()
+
+    ids, cursor = [], None
+    while True:
+        params = {"limit": 2, "cursor": cursor} if cursor else {"limit": 2}
+        response = client.get(f"/users/{USER_ID}/favorites", params=params, headers=auth())
+        ids.extend(game["id"] for game in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert sorted(ids) == sorted(game.id for game in games)
+
+
+def test_concurrent_favorite_is_a_conflict(client, db_session, auth, monkeypatch):
+    games = add_games(db_session, 1)
+    db_session.add(ProjectFavorite(user_id=USER_ID, project_id=games[0].id))
+    db_session.commit()
+
+    # The other request inserted its favorite after this one checked for it
+    async def not_favorited_yet(user_id, project_id, session):
+        return None
+
+    monkeypatch.setattr(favorite_project, "get_favorite_project", not_favorited_yet)
+    response = client.post(f"/projects/{games[0].id}/favorite", headers=auth())
+    assert response.status_code == 409
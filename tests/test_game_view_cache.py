@@ -0,0 +1,159 @@
+import asyncio
+import os
+import shutil
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.models import Arena, ArenaSession, Project, UserGameMembership
+from app.routers import project as project_router
+from app.services.game_view_cache import InMemoryGameViewCache, set_game_view_cache, get_game_view_cache
+from conftest import ORG_ID, USER_ID
+
+CONFIG = {
+    "period_type": "range",
+    "start_time": "2025-01-01T10:00:00",
+    "end_time": "2025-01-01T12:00:00",
+    "access_status": "guest",
+    "session_status": "playing",
+    "view_access": "game",
+}
+
+
+@pytest.fixture(autouse=True)
+def game_view_cache():
+    cache = InMemoryGameViewCache(max_entries=100, max_bytes=1024 * 1024, ttl=60)
+    set_game_view_cache(cache)
+    yield cache
+    set_game_view_cache(None)
+
+
+def add_game(db_session, role="manager"):
+    project = Project(id=str(uuid.uuid4()), name="Game", slug=str(uuid.uuid4()), organisation_code=ORG_ID)
+    arena = Arena(id=str(uuid.uuid4()), name="Arena", organisation_code=ORG_ID)
+    session = ArenaSession(id=str(uuid.uuid4()), organisation_code=ORG_ID, arena_id=arena.id,
+                           project_id=project.id, period_type=PeriodType.FREE,
+                           access_status=AccessStatus.AUTH, session_status=SessionStatus.PENDING,
+                           view_access=ViewAccess.ALL)
+    membership = UserGameMembership(user_id=USER_ID, project_id=project.id, organisation_code=ORG_ID, role=role)
+    db_session.add_all([project, arena, session, membership])
+    db_session.commit()
+    return project, session
+
+
+def test_game_view_is_served_from_the_cache(client, db_session, auth, game_view_cache):
+    project, session = add_game(db_session)
+
+    first = client.get(f"/game-view/{project.id}", headers=auth())
+    second = client.get(f"/game-view/{project.id}", headers=auth())
+    assert first.status_code == second.status_code == 200
+    assert first.content == second.content
+    assert first.headers["content-type"] == "application/json"
+    assert first.json()["role"] == "manager"
+    assert first.json()["arenas"][0]["sessions"][0]["id"] == session.id
+    assert (game_view_cache.hits, game_view_cache.misses) == (1, 1)
+
+
+def test_writes_to_the_game_drop_its_views(client, db_session, auth, game_view_cache):
+    project, session = add_game(db_session)
+    other_project, _ = add_game(db_session)
+    client.get(f"/game-view/{project.id}", headers=auth())
+    client.get(f"/game-view/{other_project.id}", headers=auth())
+
+    assert client.put(f"/sessions/{session.id}/config", json=CONFIG, headers=auth()).status_code == 200
+
+    response = client.get(f"/game-view/{project.id}", headers=auth())
+    assert response.json()["arenas"][0]["sessions"][0]["session_status"] == "playing"
+    client.get(f"/game-view/{other_project.id}", headers=auth())
+    assert (game_view_cache.hits, game_view_cache.misses) == (1, 3)
+
+
+def test_view_read_after_a_write_is_built_from_the_primary(client, db_session, database_path, auth, monkeypatch):
+    project, session = add_game(db_session)
+    # A replica lagging behind the write below, the role of the user is read from it
+    replica_path = os.path.join(os.path.dirname(database_path), "replica.db")
+    shutil.copy(database_path, replica_path)
+    replica_engine = create_async_engine(f"sqlite+aiosqlite:///{replica_path}", poolclass=NullPool)
+    replica_sessions = []
+
+    def open_replica_session():
+        replica_sessions.append(AsyncSession(bind=replica_engine, expire_on_commit=False))
+        return replica_sessions[-1]
+
+    monkeypatch.setattr(project_router, "reads_from_primary", lambda request: False)
+    monkeypatch.setattr(project_router, "AsyncReadSessionLocal", open_replica_session)
+    try:
+        assert client.put(f"/sessions/{session.id}/config", json=CONFIG, headers=auth()).status_code == 200
+
+        response = client.get(f"/game-view/{project.id}", headers=auth())
+        assert response.json()["arenas"][0]["sessions"][0]["session_status"] == "playing"
+        assert len(replica_sessions) == 1
+    finally:
+        asyncio.run(replica_engine.dispose())
+
+
+def test_client_reading_its_writes_gets_a_fresh_view(client, db_session, auth, game_view_cache):
+    project, session = add_game(db_session)
+    client.get(f"/game-view/{project.id}", headers=auth())
+    # Written through another replica of the service, the version of this one is not bumped
+    session.session_status = SessionStatus.PLAYING
+    db_session.commit()
+
+    assert client.get(f"/game-view/{project.id}", headers=auth()).json()["arenas"][0]["sessions"][0][
+               "session_status"] == "pending"
+    client.cookies.set("db_primary", "1")
+    response = client.get(f"/game-view/{project.id}", headers=auth())
+    assert response.json()["arenas"][0]["sessions"][0]["session_status"] == "playing"
+    # The fresh view replaced the cached one
+    client.cookies.clear()
+    assert client.get(f"/game-view/{project.id}", headers=auth()).content == response.content
+
+
+def test_player_views_are_cached_per_user(client, db_session, auth, game_view_cache):
+    project, _ = add_game(db_session, role="player")
+    other_user = "55555555-5555-5555-5555-555555555555"
+    db_session.add(UserGameMembership(user_id=other_user, project_id=project.id, organisation_code=ORG_ID,
+                                      role="player"))
+    db_session.commit()
+
+    assert client.get(f"/game-view/{project.id}", headers=auth()).status_code == 200
+    assert client.get(f"/game-view/{project.id}", headers=auth(user_id=other_user)).status_code == 200
+    assert (game_view_cache.hits, game_view_cache.misses) == (0, 2)
+
+
+def test_game_view_without_access_is_not_cached(client, db_session, auth, game_view_cache):
+    project, _ = add_game(db_session)
+
+    response = client.get(f"/game-view/{project.id}", headers=auth(user_id="66666666-6666-6666-6666-666666666666"))
+    assert response.status_code == 400
+    assert game_view_cache.stats()["size"] == 0
+
+
+def test_in_memory_cache_is_bounded():
+    cache = InMemoryGameViewCache(max_entries=2, max_bytes=10, ttl=60)
+
+    async def fill():
+        await cache.set("a", b"1234")
+        await cache.set("b", b"1234")
+        await cache.get("a")
+        await cache.set("c", b"1234")  # Evicts b, the least recently used
+        await cache.set("d", b"12345678901")  # Larger than the cache, not stored
+        return [await cache.get(key) for key in ("a", "b", "c", "d")]
+
+    assert asyncio.run(fill()) == [b"1234", None, b"1234", None]
+    assert cache.stats()["size_bytes"] == 8
+    assert cache.evictions == 1
+
+
+def test_bumped_versions_are_per_game():
+    cache = InMemoryGameViewCache(max_entries=2, max_bytes=10, ttl=60)
+
+    async def bump():
+        await cache.bump_versions(["game-1", "game-1", "game-2"])
+        return await cache.get_version("game-1"), await cache.get_version("game-3")
+
+    assert asyncio.run(bump()) == (1, 0)
+    assert get_game_view_cache() is not cache
@@ -0,0 +1,42 @@
+import uuid
+
+from app.models import Group, GroupArenas, GroupProjects, GroupUsers
+from conftest import ORG_ID
+
+
+def add_group(db_session, org_id=ORG_ID):
+    group = Group(id=str(uuid.uuid4()), name="Group", organisation_code=org_id)
+    db_session.add_all([group,
+                        GroupUsers(group_id=group.id, user_id="manager-1", user_email="m1@example.com"),
+                        GroupProjects(group_id=group.id, project_id=str(uuid.uuid4())),
+                        GroupArenas(group_id=group.id, arena_id=str(uuid.uuid4()))])
+    db_session.commit()
+    return group
+
+
+def test_delete_group(client, db_session, auth):
+    group = add_group(db_session)
+    other_group = add_group(db_session)
+
+    response = client.delete(f"/groups/{group.id}", headers=auth())
+    assert response.status_code == 200
+    assert db_session.query(Group).filter(Group.id == group.id).count() == 0
+    for model in (GroupUsers, GroupProjects, GroupArenas):
+        assert db_session.query(model).filter(model.group_id == group.id).count() == 0
+        assert db_session.query(model).filter(model.group_id == other_group.id).count() == 1
+
+
+def test_delete_group_of_another_organisation(client, db_session, auth):
+    group = add_group(db_session, org_id="other-org")
+
+    response = client.delete(f"/groups/{group.id}", headers=auth())
+    assert response.status_code >= 400
+    assert db_session.get(Group, group.id) is not None
+
+
+def test_create_group_with_a_repeated_game(client, db_session, auth):
+    project_id = str(uuid.uuid4())
+
+    response = client.post("/groups", json={"name": "Group", "project_ids": [project_id, project_id]}, headers=auth())
+    assert response.status_code == 200
+    assert db_session.query(GroupProjects).filter(GroupProjects.project_id == project_id).count() == 1
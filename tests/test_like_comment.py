@@ -1,18 +1,52 @@
-def test_like_comment(client):
-    response = client.post("/items/", json={"name": "Test Item", "description": "Test Description"})
+from app.models import CommentLike, ProjectComment
+from conftest import USER_ID
+
+
+def add_comment(db_session, user_id="someone-else"):
+    comment = ProjectComment(project_id="game-1", user_id=user_id, comment_text="Nice game", visible=True)
+    db_session.add(comment)
+    db_session.commit()
+    return comment
+
+
+def test_like_comment(client, db_session, auth):
+    comment = add_comment(db_session)
+
+    response = client.post(f"/comments/{comment.id}/like", headers=auth())
     assert response.status_code == 200
     data = response.json()
-    assert data["name"] == "Test Item"
-    assert data["description"] == "Test Description"
+    assert data["id"] == comment.id
+    assert [like["user_id"] for like in data["likes"]] == [USER_ID]
+
+    assert db_session.query(CommentLike).filter(CommentLike.comment_id == comment.id).count() == 1
+
+
+def test_like_comment_twice(client, db_session, auth):
+    comment = add_comment(db_session)
+    client.post(f"/comments/{comment.id}/like", headers=auth())
 
-def test_read_item(client):
-    # Create an item
-    response = client.post("/items/", json={"name": "Test Item", "description": "Test Description"})
-    item_id = response.json()["id"]
+    response = client.post(f"/comments/{comment.id}/like", headers=auth())
+    assert response.status_code == 400
+    assert db_session.query(CommentLike).filter(CommentLike.comment_id == comment.id).count() == 1
 
-    # Read the item
-    response = client.get(f"/items/{item_id}")
+
+def test_like_missing_comment(client, auth):
+    response = client.post("/comments/missing/like", headers=auth())
+    assert response.status_code == 404
+
+
+def test_dislike_comment(client, db_session, auth):
+    comment = add_comment(db_session)
+    client.post(f"/comments/{comment.id}/like", headers=auth())
+    client.post(f"/comments/{comment.id}/like", headers=auth(user_id="another-user"))
+
+    response = client.post(f"/comments/{comment.id}/dislike", headers=auth())
     assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == "Test Item"
-    assert data["description"] == "Test Description"
+    assert [like["user_id"] for like in response.json()["likes"]] == ["another-user"]
+
+
+def test_dislike_comment_not_liked(client, db_session, auth):
+    comment = add_comment(db_session)
+
+    response = client.post(f"/comments/{comment.id}/dislike", headers=auth())
+    assert response.status_code == 404
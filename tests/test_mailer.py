@@ -0,0 +1,26 @@
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.mailer import Mailer
+
+
+@pytest.mark.parametrize("bulk_path", ["", "/api/v1/emails/bulk"])
+def test_failures_are_the_errors_of_their_emails(bulk_path):
+    def handle(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(202)
+
+    mailer = Mailer(httpx.AsyncClient(transport=httpx.MockTransport(handle)), bulk_path=bulk_path, bulk_size=1)
+    mailer.url = "http://mailer/api/v1/emails"
+    mailer.bulk_url = f"http://mailer{bulk_path}" if bulk_path else None
+
+    async def send():
+        errors = await mailer.send_many([("key-1", {"to": "a@example.com"}),
+                                         ("key-2", {"to": "b@example.com", "body": object()})])
+        await mailer.aclose()
+        return errors
+
+    errors = asyncio.run(send())
+    assert errors[0] is None
+    assert errors[1]
@@ -0,0 +1,39 @@
+import asyncio
+import json
+
+import httpx
+
+from app.services.organisation_service import OrganisationServiceClient, UNKNOWN_ORGANISATION
+
+
+def organisation_service(names: dict, batch_names: dict, requests: list) -> OrganisationServiceClient:
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path.endswith("/batch"):
+            codes = json.loads(request.content)["organisation_codes"]
+            return httpx.Response(200, json={code: batch_names[code] for code in codes if code in batch_names})
+        code = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"name": names[code]} if code in names else {})
+
+    service = OrganisationServiceClient(httpx.AsyncClient(transport=httpx.MockTransport(handle)))
+    service.base_url = "http://organisations/api/v1"
+    return service
+
+
+def test_unknown_names_are_not_cached():
+    requests = []
+    names = {"org-b": "Org B"}
+    service = organisation_service(names, {"org-a": "Org A"}, requests)
+
+    async def resolve():
+        first = await service.get_organisation_names(["org-a", "org-b", "org-c"])
+        # The organisation service catches up, the names it did not give are asked again
+        names["org-c"] = "Org C"
+        second = await service.get_organisation_names(["org-a", "org-b", "org-c"])
+        await service.aclose()
+        return first, second
+
+    first, second = asyncio.run(resolve())
+    assert first == {"org-a": "Org A", "org-b": "Org B", "org-c": UNKNOWN_ORGANISATION}
+    assert second == {"org-a": "Org A", "org-b": "Org B", "org-c": "Org C"}
+    assert [path.rsplit("/", 1)[-1] for path in requests] == ["batch", "org-b", "org-c", "batch", "org-c"]
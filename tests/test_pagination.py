@@ -0,0 +1,38 @@
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.models import Project
+from app.pagination import encode_cursor
+from conftest import ORG_ID
+
+ID_LISTS = ["/sessions", "/groups", "/arenas", "/games/game-1/comments", "/users/user-1/favorites"]
+
+
+@pytest.mark.parametrize("path", ID_LISTS)
+@pytest.mark.parametrize("key", [[1, 2], {"a": 1}, 1, None, ["2025-01-01T00:00:00", "id"]])
+def test_id_cursor_of_another_shape_is_refused(client, auth, path, key):
+    response = client.get(path, params={"cursor": encode_cursor(key)}, headers=auth())
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid cursor")
+
+
+@pytest.mark.parametrize("key", ["id", [1, "id"], ["not a date", "id"], [None, 1], [None, "id", "extra"]])
+def test_project_cursor_of_another_shape_is_refused(client, key):
+    response = client.get("/projects", params={"cursor": encode_cursor(key)})
+    assert response.status_code == 400
+
+
+def test_project_pages(client, db_session):
+    db_session.add_all([
+        Project(id=str(uuid.uuid4()), name="Game", slug=str(uuid.uuid4()), organisation_code=ORG_ID,
+                created_at=datetime(2025, 1, day))
+        for day in (1, 2, 3)
+    ])
+    db_session.commit()
+
+    first = client.get("/projects", params={"limit": 2})
+    second = client.get("/projects", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert first.status_code == second.status_code == 200
+    assert [len(first.json()), len(second.json())] == [2, 1]
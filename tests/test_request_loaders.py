@@ -0,0 +1,37 @@
+import asyncio
+import uuid
+
+from app.models import Arena, Project
+from app.services.request_loaders import get_loaders
+from conftest import ORG_ID
+
+
+def test_loaders_of_one_tick_take_turns_on_the_session(db_session, async_session_factory):
+    arena = Arena(id=str(uuid.uuid4()), name="Arena", organisation_code=ORG_ID)
+    game = Project(id=str(uuid.uuid4()), name="Game", slug=str(uuid.uuid4()), organisation_code=ORG_ID)
+    db_session.add_all([arena, game])
+    db_session.commit()
+
+    async def load():
+        async with async_session_factory() as db:
+            running, overlaps = [], []
+            execute = db.execute
+
+            # Records the statements running on the session at once
+            async def tracked_execute(*args, **kwargs):
+                running.append(True)
+                overlaps.append(len(running))
+                try:
+                    await asyncio.sleep(0.01)
+                    return await execute(*args, **kwargs)
+                finally:
+                    running.pop()
+
+            db.execute = tracked_execute
+            loaders = get_loaders(db)
+            loaded = await asyncio.gather(loaders.arenas.load(arena.id), loaders.games.load((game.id, ORG_ID)))
+            return [row.id for row in loaded], overlaps
+
+    ids, overlaps = asyncio.run(load())
+    assert ids == [arena.id, game.id]
+    assert overlaps == [1, 1]
@@ -0,0 +1,57 @@
+import uuid
+
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.models import ArenaSession
+from conftest import ORG_ID
+
+CONFIG = {
+    "period_type": "range",
+    "start_time": "2025-01-01T10:00:00",
+    "end_time": "2025-01-01T12:00:00",
+    "access_status": "guest",
+    "session_status": "playing",
+    "view_access": "game",
+}
+
+
+def add_session(db_session, org_id=ORG_ID):
+    session = ArenaSession(id=str(uuid.uuid4()), organisation_code=org_id, arena_id=str(uuid.uuid4()),
+                           project_id=str(uuid.uuid4()), period_type=PeriodType.FREE,
+                           access_status=AccessStatus.AUTH, session_status=SessionStatus.PENDING,
+                           view_access=ViewAccess.ALL)
+    db_session.add(session)
+    db_session.commit()
+    return session
+
+
+def test_config_session(client, db_session, auth):
+    session = add_session(db_session)
+
+    response = client.put(f"/sessions/{session.id}/config", json=CONFIG, headers=auth())
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == session.id
+    assert data["period_type"] == "range"
+    assert data["session_status"] == "playing"
+
+    db_session.expire_all()
+    stored = db_session.get(ArenaSession, session.id)
+    assert stored.view_access == ViewAccess.GAME
+    assert stored.access_status == AccessStatus.GUEST
+
+
+def test_config_session_with_end_before_start(client, db_session, auth):
+    session = add_session(db_session)
+
+    response = client.put(f"/sessions/{session.id}/config", json=dict(CONFIG, end_time="2025-01-01T09:00:00"),
+                          headers=auth())
+    assert response.status_code == 400
+
+
+def test_config_session_of_another_organisation(client, db_session, auth):
+    session = add_session(db_session, org_id="other-org")
+
+    response = client.put(f"/sessions/{session.id}/config", json=CONFIG, headers=auth())
+    assert response.status_code == 404
+    db_session.expire_all()
+    assert db_session.get(ArenaSession, session.id).session_status == SessionStatus.PENDING
@@ -0,0 +1,32 @@
+from app.models import Project
+from conftest import ORG_ID
+
+
+def add_game(db_session, org_id=ORG_ID):
+    game = Project(name="Game", slug="game", organisation_code=org_id, allow_comments=True)
+    db_session.add(game)
+    db_session.commit()
+    return game
+
+
+def test_update_game(client, db_session, auth):
+    game = add_game(db_session)
+
+    response = client.put(f"/game/{game.id}", json={"name": "Renamed", "allow_comments": False}, headers=auth())
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == game.id
+    assert data["name"] == "Renamed"
+    assert data["allow_comments"] is False
+
+    db_session.expire_all()
+    assert db_session.get(Project, game.id).name == "Renamed"
+
+
+def test_update_game_of_another_organisation(client, db_session, auth):
+    game = add_game(db_session, org_id="other-org")
+
+    response = client.put(f"/game/{game.id}", json={"name": "Renamed"}, headers=auth())
+    assert response.status_code == 404
+    db_session.expire_all()
+    assert db_session.get(Project, game.id).name == "Game"
@@ -0,0 +1,134 @@
+import asyncio
+import uuid
+
+from app.enums import AccessStatus, PeriodType, SessionStatus, ViewAccess
+from app.models import ArenaSession, ArenaSessionPlayers, Group, GroupProjects, GroupUsers, UserGameMembership
+from app.repositories.get_game_memberships_from_sources import get_game_memberships_from_sources
+from app.repositories.get_user_roles_in_games_by_org import get_user_roles_in_games_by_org
+from conftest import ORG_ID
+
+PLAYER_ID = "22222222-2222-2222-2222-222222222222"
+MODERATOR_ID = "33333333-3333-3333-3333-333333333333"
+MANAGER_ID = "44444444-4444-4444-4444-444444444444"
+
+
+def add_session(db_session, org_id=ORG_ID, project_id=None):
+    session = ArenaSession(id=str(uuid.uuid4()), organisation_code=org_id, arena_id=str(uuid.uuid4()),
+                           project_id=project_id or str(uuid.uuid4()), period_type=PeriodType.FREE,
+                           access_status=AccessStatus.AUTH, session_status=SessionStatus.PENDING,
+                           view_access=ViewAccess.ALL)
+    db_session.add(session)
+    db_session.commit()
+    return session
+
+
+def add_group(db_session, org_id=ORG_ID):
+    group = Group(id=str(uuid.uuid4()), name="Group", organisation_code=org_id)
+    db_session.add_all([group, GroupUsers(group_id=group.id, user_id=MANAGER_ID, user_email="m@example.com")])
+    db_session.commit()
+    return group
+
+
+def memberships(db_session, user_id):
+    db_session.expire_all()
+    return {(m.project_id, m.organisation_code, m.role, m.is_game_master)
+            for m in db_session.query(UserGameMembership).filter(UserGameMembership.user_id == user_id)}
+
+
+def roles(async_session_factory, user_id, games):
+    async def read():
+        async with async_session_factory() as db:
+            return await get_user_roles_in_games_by_org(user_id, games, db)
+
+    return asyncio.run(read())
+
+
+def progress(client, session_id, role, user_id):
+    return client.post("/webhook/invitation/progress", json={
+        "status": "invitation_accepted", "role": role, "session_id": session_id, "users": [{"id": user_id}],
+    })
+
+
+def test_webhook_player_progress_adds_membership(client, db_session, async_session_factory):
+    session = add_session(db_session)
+
+    response = progress(client, session.id, "game_master", PLAYER_ID)
+    assert response.status_code == 200
+    assert memberships(db_session, PLAYER_ID) == {(session.project_id, ORG_ID, "player", True)}
+
+    assert roles(async_session_factory, PLAYER_ID, {session.project_id: ORG_ID}) == {session.project_id: "game_master"}
+    # Sessions only count for the organization of their game
+    assert roles(async_session_factory, PLAYER_ID, {session.project_id: "other-org"}) == {session.project_id: None}
+
+
+def test_webhook_moderator_progress_moves_membership(client, db_session, async_session_factory):
+    session = add_session(db_session)
+
+    assert progress(client, session.id, "moderator", MODERATOR_ID).status_code == 200
+    assert memberships(db_session, MODERATOR_ID) == {(session.project_id, ORG_ID, "moderator", False)}
+
+    assert progress(client, session.id, "moderator", PLAYER_ID).status_code == 200
+    assert memberships(db_session, MODERATOR_ID) == set()
+    assert roles(async_session_factory, PLAYER_ID, {session.project_id: ORG_ID}) == {session.project_id: "moderator"}
+
+
+def test_group_game_association_and_manager_removal(client, db_session, auth, async_session_factory):
+    group = add_group(db_session)
+    session = add_session(db_session)
+    progress(client, session.id, "player", MANAGER_ID)
+
+    response = client.post(f"/groups/{group.id}/assign-game/{session.project_id}", headers=auth())
+    assert response.status_code == 200
+    assert memberships(db_session, MANAGER_ID) == {(session.project_id, ORG_ID, "manager", False),
+                                                   (session.project_id, ORG_ID, "player", False)}
+    # A manager wins over a player
+    assert roles(async_session_factory, MANAGER_ID, {session.project_id: ORG_ID}) == {session.project_id: "manager"}
+
+    manager = db_session.query(GroupUsers).filter(GroupUsers.group_id == group.id).one()
+    response = client.post(f"/groups/manager/{manager.id}/remove", headers=auth())
+    assert response.status_code == 200
+    assert memberships(db_session, MANAGER_ID) == {(session.project_id, ORG_ID, "player", False)}
+    assert roles(async_session_factory, MANAGER_ID, {session.project_id: ORG_ID}) == {session.project_id: "player"}
+
+
+def test_remove_game_from_group_and_delete_session(client, db_session, auth):
+    group = add_group(db_session)
+    session = add_session(db_session)
+    client.post(f"/groups/{group.id}/assign-game/{session.project_id}", headers=auth())
+    progress(client, session.id, "player", PLAYER_ID)
+
+    response = client.delete(f"/groups/{group.id}/remove-game/{session.project_id}", headers=auth())
+    assert response.status_code == 200
+    assert memberships(db_session, MANAGER_ID) == set()
+
+    response = client.delete(f"/sessions/{session.id}", headers=auth())
+    assert response.status_code == 200
+    assert memberships(db_session, PLAYER_ID) == set()
+
+
+def test_rebuild_matches_sources(client, db_session, async_session_factory):
+    group = add_group(db_session)
+    session = add_session(db_session)
+    db_session.add_all([
+        GroupProjects(group_id=group.id, project_id=session.project_id),
+        ArenaSessionPlayers(session_id=session.id, user_id=PLAYER_ID, is_game_master=False),
+        ArenaSessionPlayers(session_id=session.id, user_id=PLAYER_ID, is_game_master=True),
+        UserGameMembership(user_id="stale-user", project_id=session.project_id, role="player"),
+    ])
+    session.super_game_master_id = MODERATOR_ID
+    db_session.commit()
+
+    response = client.post("/server/rebuild/user-game-membership")
+    assert response.status_code == 200
+    assert response.json()["memberships"] == 3
+
+    async def derive():
+        async with async_session_factory() as db:
+            return await get_game_memberships_from_sources(db)
+
+    db_session.expire_all()
+    stored = {(m.user_id, m.project_id, m.organisation_code, m.role, m.is_game_master)
+              for m in db_session.query(UserGameMembership)}
+    assert stored == {(row.user_id, row.project_id, row.organisation_code, row.role, bool(row.is_game_master))
+                      for row in asyncio.run(derive())}
+    assert (PLAYER_ID, session.project_id, ORG_ID, "player", True) in stored